@@ -10,69 +10,107 @@ The system automatically switches between heating and cooling based
 on room temperature and setpoints.
 """
 
+import argparse
+import hashlib
 import json
+import pickle
+import sys
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
+
+from pydantic_core import to_json
 
 from python_cdl.models.blocks import CompositeBlock, ElementaryBlock
 from python_cdl.models.connections import Connection
 from python_cdl.models.connectors import BooleanInput, BooleanOutput, RealInput, RealOutput
-from python_cdl.models.parameters import Parameter
 from python_cdl.models.types import CDLTypeEnum
 
+from utils import build_params, prototype, validate_block
+
+# Module-level aliases for the CDL types used throughout the factories
+_REAL = CDLTypeEnum.REAL
+_BOOL = CDLTypeEnum.BOOLEAN
+_INT = CDLTypeEnum.INTEGER
+
+# Interned unit strings shared by every connector and parameter
+_K, _S, _ONE = map(sys.intern, ("K", "s", "1"))
+
+# Directory the example writes its exported files to
+_OUTPUT_DIR = Path(__file__).parent / "output"
+
+# Pre-generated CDL-JSON for the system, refreshed by tools/regen_templates.py
+_TEMPLATE_PATH = Path(__file__).with_name("room_control_system.template.json")
+
 
+_HEATING_CONTROLLER_PARAMS = (
+    ("controllerType", _INT, 2),
+    ("k", _REAL, 0.5),
+    ("Ti", _REAL, 120.0, _S),
+    ("yMax", _REAL, 1.0),
+    ("yMin", _REAL, 0.0),
+    ("reverseActing", _BOOL, True),
+)
+
+
+@prototype
 def create_heating_controller() -> ElementaryBlock:
     """Create PI controller for heating mode."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="HeatingController",
         block_type="Buildings.Controls.OBC.CDL.Continuous.LimPID",
         category="elementary",
         description="PI controller for heating valve",
         inputs=[
-            RealInput(name="u_s", type=CDLTypeEnum.REAL, unit="K"),
-            RealInput(name="u_m", type=CDLTypeEnum.REAL, unit="K"),
+            RealInput(name="u_s", type=_REAL, unit=_K),
+            RealInput(name="u_m", type=_REAL, unit=_K),
         ],
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="1", min=0.0, max=1.0),
-        ],
-        parameters=[
-            Parameter(name="controllerType", type=CDLTypeEnum.INTEGER, value=2),
-            Parameter(name="k", type=CDLTypeEnum.REAL, value=0.5),
-            Parameter(name="Ti", type=CDLTypeEnum.REAL, value=120.0, unit="s"),
-            Parameter(name="yMax", type=CDLTypeEnum.REAL, value=1.0),
-            Parameter(name="yMin", type=CDLTypeEnum.REAL, value=0.0),
-            Parameter(name="reverseActing", type=CDLTypeEnum.BOOLEAN, value=True),
+            RealOutput(name="y", type=_REAL, unit=_ONE, min=0.0, max=1.0),
         ],
+        parameters=build_params(_HEATING_CONTROLLER_PARAMS),
     )
 
 
+_COOLING_CONTROLLER_PARAMS = (
+    ("controllerType", _INT, 2),
+    ("k", _REAL, 0.8),
+    ("Ti", _REAL, 90.0, _S),
+    ("yMax", _REAL, 1.0),
+    ("yMin", _REAL, 0.0),
+    ("reverseActing", _BOOL, False),
+)
+
+
+@prototype
 def create_cooling_controller() -> ElementaryBlock:
     """Create PI controller for cooling mode."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="CoolingController",
         block_type="Buildings.Controls.OBC.CDL.Continuous.LimPID",
         category="elementary",
         description="PI controller for cooling valve",
         inputs=[
-            RealInput(name="u_s", type=CDLTypeEnum.REAL, unit="K"),
-            RealInput(name="u_m", type=CDLTypeEnum.REAL, unit="K"),
+            RealInput(name="u_s", type=_REAL, unit=_K),
+            RealInput(name="u_m", type=_REAL, unit=_K),
         ],
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="1", min=0.0, max=1.0),
-        ],
-        parameters=[
-            Parameter(name="controllerType", type=CDLTypeEnum.INTEGER, value=2),
-            Parameter(name="k", type=CDLTypeEnum.REAL, value=0.8),
-            Parameter(name="Ti", type=CDLTypeEnum.REAL, value=90.0, unit="s"),
-            Parameter(name="yMax", type=CDLTypeEnum.REAL, value=1.0),
-            Parameter(name="yMin", type=CDLTypeEnum.REAL, value=0.0),
-            Parameter(name="reverseActing", type=CDLTypeEnum.BOOLEAN, value=False),
+            RealOutput(name="y", type=_REAL, unit=_ONE, min=0.0, max=1.0),
         ],
+        parameters=build_params(_COOLING_CONTROLLER_PARAMS),
     )
 
 
+_MODE_SELECTOR_PARAMS = (
+    ("uLow", _REAL, -1.0, _K, None, "Lower threshold (switch to heating)"),
+    ("uHigh", _REAL, 1.0, _K, None, "Upper threshold (switch to cooling)"),
+)
+
+
+@prototype
 def create_mode_selector() -> ElementaryBlock:
     """Create mode selection logic based on temperature and setpoints."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="ModeSelector",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Hysteresis",
         category="elementary",
@@ -80,124 +118,164 @@ def create_mode_selector() -> ElementaryBlock:
         inputs=[
             RealInput(
                 name="u",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 description="Temperature error (measured - setpoint)"
             ),
         ],
         outputs=[
             BooleanOutput(
                 name="y",
-                type=CDLTypeEnum.BOOLEAN,
+                type=_BOOL,
                 description="True = heating mode, False = cooling mode"
             ),
         ],
-        parameters=[
-            Parameter(
-                name="uLow",
-                type=CDLTypeEnum.REAL,
-                value=-1.0,
-                unit="K",
-                description="Lower threshold (switch to heating)"
-            ),
-            Parameter(
-                name="uHigh",
-                type=CDLTypeEnum.REAL,
-                value=1.0,
-                unit="K",
-                description="Upper threshold (switch to cooling)"
-            ),
-        ],
+        parameters=build_params(_MODE_SELECTOR_PARAMS),
     )
 
 
+_SUBTRACTOR_PARAMS = (
+    ("k1", _REAL, 1.0),
+    ("k2", _REAL, -1.0),  # Subtract
+)
+
+
+@prototype
 def create_subtractor() -> ElementaryBlock:
     """Create subtractor for error calculation."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="ErrorCalculator",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Add",
         category="elementary",
         description="Calculate temperature error",
         inputs=[
-            RealInput(name="u1", type=CDLTypeEnum.REAL, unit="K"),
-            RealInput(name="u2", type=CDLTypeEnum.REAL, unit="K"),
+            RealInput(name="u1", type=_REAL, unit=_K),
+            RealInput(name="u2", type=_REAL, unit=_K),
         ],
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="K"),
-        ],
-        parameters=[
-            Parameter(name="k1", type=CDLTypeEnum.REAL, value=1.0),
-            Parameter(name="k2", type=CDLTypeEnum.REAL, value=-1.0),  # Subtract
+            RealOutput(name="y", type=_REAL, unit=_K),
         ],
+        parameters=build_params(_SUBTRACTOR_PARAMS),
     )
 
 
+@prototype
 def create_switch() -> ElementaryBlock:
     """Create switch to select between heating and cooling outputs."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="OutputSwitch",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Switch",
         category="elementary",
         description="Switch between heating and cooling valve commands",
         inputs=[
-            RealInput(name="u1", type=CDLTypeEnum.REAL, unit="1", description="Heating signal"),
-            RealInput(name="u2", type=CDLTypeEnum.REAL, unit="1", description="Cooling signal"),
-            BooleanInput(name="u3", type=CDLTypeEnum.BOOLEAN, description="Mode selection"),
+            RealInput(name="u1", type=_REAL, unit=_ONE, description="Heating signal"),
+            RealInput(name="u2", type=_REAL, unit=_ONE, description="Cooling signal"),
+            BooleanInput(name="u3", type=_BOOL, description="Mode selection"),
         ],
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="1", min=0.0, max=1.0),
+            RealOutput(name="y", type=_REAL, unit=_ONE, min=0.0, max=1.0),
         ],
     )
 
 
+_HEATING_SETPOINT_PARAMS = (
+    ("k", _REAL, 293.15, _K),  # 20°C
+)
+
+
+@prototype
 def create_heating_setpoint() -> ElementaryBlock:
     """Create heating setpoint source (20°C)."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="HeatingSetpoint",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Sources.Constant",
         category="elementary",
         description="Heating mode setpoint",
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="K"),
-        ],
-        parameters=[
-            Parameter(name="k", type=CDLTypeEnum.REAL, value=293.15, unit="K"),  # 20°C
+            RealOutput(name="y", type=_REAL, unit=_K),
         ],
+        parameters=build_params(_HEATING_SETPOINT_PARAMS),
     )
 
 
+_COOLING_SETPOINT_PARAMS = (
+    ("k", _REAL, 297.15, _K),  # 24°C
+)
+
+
+@prototype
 def create_cooling_setpoint() -> ElementaryBlock:
     """Create cooling setpoint source (24°C)."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="CoolingSetpoint",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Sources.Constant",
         category="elementary",
         description="Cooling mode setpoint",
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="K"),
-        ],
-        parameters=[
-            Parameter(name="k", type=CDLTypeEnum.REAL, value=297.15, unit="K"),  # 24°C
+            RealOutput(name="y", type=_REAL, unit=_K),
         ],
+        parameters=build_params(_COOLING_SETPOINT_PARAMS),
     )
 
 
+_DEADBAND_SETPOINT_PARAMS = (
+    ("k", _REAL, 295.15, _K),  # 22°C
+)
+
+
+@prototype
 def create_deadband_setpoint() -> ElementaryBlock:
     """Create deadband center setpoint (22°C)."""
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="DeadbandSetpoint",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Sources.Constant",
         category="elementary",
         description="Deadband center for mode switching",
         outputs=[
-            RealOutput(name="y", type=CDLTypeEnum.REAL, unit="K"),
-        ],
-        parameters=[
-            Parameter(name="k", type=CDLTypeEnum.REAL, value=295.15, unit="K"),  # 22°C
+            RealOutput(name="y", type=_REAL, unit=_K),
         ],
+        parameters=build_params(_DEADBAND_SETPOINT_PARAMS),
     )
 
 
+# (from_block, from_output, to_block, to_input, description) for each
+# connection in the room control system
+_CONNECTIONS = (
+    # Calculate error for mode selection
+    ("room_temperature", "room_temperature", "ErrorCalculator", "u1",
+     "Room temp to error calculator"),
+    ("DeadbandSetpoint", "y", "ErrorCalculator", "u2",
+     "Deadband setpoint to error calculator"),
+    # Mode selection
+    ("ErrorCalculator", "y", "ModeSelector", "u",
+     "Temperature error to mode selector"),
+    # Heating controller
+    ("HeatingSetpoint", "y", "HeatingController", "u_s",
+     "Heating setpoint"),
+    ("room_temperature", "room_temperature", "HeatingController", "u_m",
+     "Room temp to heating controller"),
+    # Cooling controller
+    ("CoolingSetpoint", "y", "CoolingController", "u_s",
+     "Cooling setpoint"),
+    ("room_temperature", "room_temperature", "CoolingController", "u_m",
+     "Room temp to cooling controller"),
+    # Output switch
+    ("HeatingController", "y", "OutputSwitch", "u1",
+     "Heating output to switch"),
+    ("CoolingController", "y", "OutputSwitch", "u2",
+     "Cooling output to switch"),
+    ("ModeSelector", "y", "OutputSwitch", "u3",
+     "Mode to switch"),
+    # Outputs
+    ("HeatingController", "y", "heating_valve", "heating_valve",
+     "Heating valve output"),
+    ("CoolingController", "y", "cooling_valve", "cooling_valve",
+     "Cooling valve output"),
+    ("ModeSelector", "y", "heating_mode", "heating_mode",
+     "Mode indicator output"),
+)
+
+
 def create_room_control_system() -> CompositeBlock:
     """Create complete dual-mode room control system."""
 
@@ -224,8 +302,8 @@ def create_room_control_system() -> CompositeBlock:
         inputs=[
             RealInput(
                 name="room_temperature",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Measured room temperature"
             ),
@@ -233,23 +311,23 @@ def create_room_control_system() -> CompositeBlock:
         outputs=[
             RealOutput(
                 name="heating_valve",
-                type=CDLTypeEnum.REAL,
-                unit="1",
+                type=_REAL,
+                unit=_ONE,
                 min=0.0,
                 max=1.0,
                 description="Heating valve position (0-1)"
             ),
             RealOutput(
                 name="cooling_valve",
-                type=CDLTypeEnum.REAL,
-                unit="1",
+                type=_REAL,
+                unit=_ONE,
                 min=0.0,
                 max=1.0,
                 description="Cooling valve position (0-1)"
             ),
             BooleanOutput(
                 name="heating_mode",
-                type=CDLTypeEnum.BOOLEAN,
+                type=_BOOL,
                 description="True when in heating mode"
             ),
         ],
@@ -264,176 +342,167 @@ def create_room_control_system() -> CompositeBlock:
             output_switch,
         ],
         connections=[
-            # Calculate error for mode selection
-            Connection(
-                from_block="room_temperature",
-                from_output="room_temperature",
-                to_block="ErrorCalculator",
-                to_input="u1",
-                description="Room temp to error calculator"
-            ),
-            Connection(
-                from_block="DeadbandSetpoint",
-                from_output="y",
-                to_block="ErrorCalculator",
-                to_input="u2",
-                description="Deadband setpoint to error calculator"
-            ),
-            # Mode selection
-            Connection(
-                from_block="ErrorCalculator",
-                from_output="y",
-                to_block="ModeSelector",
-                to_input="u",
-                description="Temperature error to mode selector"
-            ),
-            # Heating controller
-            Connection(
-                from_block="HeatingSetpoint",
-                from_output="y",
-                to_block="HeatingController",
-                to_input="u_s",
-                description="Heating setpoint"
-            ),
-            Connection(
-                from_block="room_temperature",
-                from_output="room_temperature",
-                to_block="HeatingController",
-                to_input="u_m",
-                description="Room temp to heating controller"
-            ),
-            # Cooling controller
-            Connection(
-                from_block="CoolingSetpoint",
-                from_output="y",
-                to_block="CoolingController",
-                to_input="u_s",
-                description="Cooling setpoint"
-            ),
-            Connection(
-                from_block="room_temperature",
-                from_output="room_temperature",
-                to_block="CoolingController",
-                to_input="u_m",
-                description="Room temp to cooling controller"
-            ),
-            # Output switch
-            Connection(
-                from_block="HeatingController",
-                from_output="y",
-                to_block="OutputSwitch",
-                to_input="u1",
-                description="Heating output to switch"
-            ),
-            Connection(
-                from_block="CoolingController",
-                from_output="y",
-                to_block="OutputSwitch",
-                to_input="u2",
-                description="Cooling output to switch"
-            ),
-            Connection(
-                from_block="ModeSelector",
-                from_output="y",
-                to_block="OutputSwitch",
-                to_input="u3",
-                description="Mode to switch"
-            ),
-            # Outputs
-            Connection(
-                from_block="HeatingController",
-                from_output="y",
-                to_block="heating_valve",
-                to_input="heating_valve",
-                description="Heating valve output"
-            ),
-            Connection(
-                from_block="CoolingController",
-                from_output="y",
-                to_block="cooling_valve",
-                to_input="cooling_valve",
-                description="Cooling valve output"
-            ),
-            Connection(
-                from_block="ModeSelector",
-                from_output="y",
-                to_block="heating_mode",
-                to_input="heating_mode",
-                description="Mode indicator output"
-            ),
+            Connection.model_construct(
+                from_block=from_block,
+                from_output=from_output,
+                to_block=to_block,
+                to_input=to_input,
+                description=description,
+            )
+            for from_block, from_output, to_block, to_input, description in _CONNECTIONS
         ],
     )
 
     return system
 
 
-def main():
+def build_many_rooms(n: int) -> list[CompositeBlock]:
+    """Build ``n`` independent room control systems, e.g. one per zone on a floor.
+
+    The system is composed and validated once; every room is a deep copy of
+    that template renamed ``RoomControlSystem_001``, ``RoomControlSystem_002``,
+    and so on, so each additional room costs a model copy rather than another
+    full construction.
+
+    Raises:
+        ValueError: If the composed template fails validation
+    """
+    template = create_room_control_system()
+    is_valid, errors = validate_block(template)
+    if not is_valid:
+        raise ValueError(f"Invalid room control system: {errors}")
+
+    return [
+        template.model_copy(update={"name": f"{template.name}_{i:03d}"}, deep=True)
+        for i in range(1, n + 1)
+    ]
+
+
+def load_or_build_system(cache_dir: Path, rebuild: bool = False) -> CompositeBlock:
+    """Return the room control system, reusing a pickled copy when current.
+
+    The cache file is keyed by a hash of this module's source together with
+    the installed python_cdl and pydantic versions, so editing any factory or
+    upgrading either library invalidates it and the system is rebuilt and
+    re-cached.
+
+    Args:
+        cache_dir: Directory holding the pickled system
+        rebuild: Ignore any cached copy and build from the factories
+    """
+    import pydantic
+
+    import python_cdl
+
+    key = hashlib.sha256(Path(__file__).read_bytes())
+    key.update(f"python_cdl={python_cdl.__version__};pydantic={pydantic.VERSION}".encode())
+    cache_file = cache_dir / f"room_control_system_{key.hexdigest()[:16]}.pkl"
+
+    if not rebuild and cache_file.exists():
+        try:
+            return pickle.loads(cache_file.read_bytes())
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Written by an incompatible python_cdl version; rebuild below
+            pass
+
+    system = create_room_control_system()
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    for stale in cache_dir.glob("room_control_system_*.pkl"):
+        stale.unlink()
+    cache_file.write_bytes(pickle.dumps(system, protocol=pickle.HIGHEST_PROTOCOL))
+    return system
+
+
+def render_template(setpoints: Mapping[str, float] | None = None) -> dict[str, Any]:
+    """Load the pre-generated system CDL-JSON, optionally overriding setpoints.
+
+    The factories are deterministic, so their validated output is stored as a
+    template; only the setpoint sources ever need customizing per room.
+
+    Args:
+        setpoints: Optional map of setpoint block name (``HeatingSetpoint``,
+            ``CoolingSetpoint`` or ``DeadbandSetpoint``) to its value in K
+
+    Returns:
+        CDL-JSON dictionary for the room control system
+    """
+    cdl_json = json.loads(_TEMPLATE_PATH.read_bytes())
+    if setpoints:
+        for block in cdl_json["blocks"]:
+            if block["name"] in setpoints:
+                for param in block["parameters"]:
+                    if param["name"] == "k":
+                        param["value"] = setpoints[block["name"]]
+    return cdl_json
+
+
+def main(argv: list[str] | None = None):
     """Main execution."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="build the system from the factories, ignoring any cached copy",
+    )
+    parser.add_argument(
+        "--from-template",
+        action="store_true",
+        help="export the pre-generated template instead of building the system",
+    )
+    args = parser.parse_args(argv)
+
+    output_file = _OUTPUT_DIR / "room_control_system.json"
+
+    if args.from_template:
+        print("\n🏗️  Exporting Room Control System from Template")
+        print("="*70)
+        cdl_json = render_template()
+        _OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        output_file.write_bytes(to_json(cdl_json, indent=2))
+        print(f"\n   ✓ Exported {cdl_json['name']} to {output_file}")
+        print(f"   File size: {output_file.stat().st_size:,} bytes")
+        return
+
     print("\n🏗️  Building Room Control System Programmatically")
     print("="*70)
 
-    # Create system
+    # Create system (or load it from the on-disk cache)
     print("\n1. Creating dual-mode control system...")
-    system = create_room_control_system()
+    system = load_or_build_system(_OUTPUT_DIR, rebuild=args.rebuild)
     print(f"   ✓ Created {len(system.blocks)} blocks")
     print(f"   ✓ Configured {len(system.connections)} connections")
 
     # Print summary
-    print(f"\n2. System: {system.name}")
-    print(f"   {system.description}")
-    print(f"\n   Inputs: {', '.join(i.name for i in system.inputs)}")
-    print(f"   Outputs: {', '.join(o.name for o in system.outputs)}")
-    print(f"\n   Control Modes:")
-    print("   • Heating: T < 20°C (293.15 K)")
-    print("   • Deadband: 20°C < T < 24°C")
-    print("   • Cooling: T > 24°C (297.15 K)")
-    print("   • Hysteresis: ±1°C to prevent rapid switching")
-
-    # Export
+    sys.stdout.write("\n".join([
+        f"\n2. System: {system.name}",
+        f"   {system.description}",
+        f"\n   Inputs: {', '.join(i.name for i in system.inputs)}",
+        f"   Outputs: {', '.join(o.name for o in system.outputs)}",
+        "\n   Control Modes:",
+        "   • Heating: T < 20°C (293.15 K)",
+        "   • Deadband: 20°C < T < 24°C",
+        "   • Cooling: T > 24°C (297.15 K)",
+        "   • Hysteresis: ±1°C to prevent rapid switching\n",
+    ]))
+
+    # Validate and serialize in a single walk of the system
     print("\n3. Exporting to CDL-JSON...")
-    output_dir = Path(__file__).parent / "output"
-    output_file = output_dir / "room_control_system.json"
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    cdl_json = system.model_dump(mode='json', exclude_none=True)
+    from python_cdl.validators import validate_and_dump
 
-    with open(output_file, 'w') as f:
-        json.dump(cdl_json, f, indent=2)
+    result, cdl_json = validate_and_dump(system)
+    output_file.write_bytes(to_json(cdl_json, indent=2))
 
     print(f"   ✓ Exported to {output_file}")
     print(f"   File size: {output_file.stat().st_size:,} bytes")
 
-    # Validate
     print("\n4. Validating...")
-    from python_cdl.validators import BlockValidator, GraphValidator
-
-    block_validator = BlockValidator()
-    graph_validator = GraphValidator()
-
-    result = block_validator.validate(system)
-    if hasattr(result, 'is_valid'):
-        is_valid = result.is_valid
-        errors = result.errors if hasattr(result, 'errors') else []
-    else:
-        is_valid, errors = result
-
-    if is_valid:
+    if result.is_valid:
         print("   ✓ Block structure is valid")
-    else:
-        print(f"   ✗ Block validation errors: {errors}")
-        return
-
-    result = graph_validator.validate(system)
-    if hasattr(result, 'is_valid'):
-        is_valid = result.is_valid
-        errors = result.errors if hasattr(result, 'errors') else []
-    else:
-        is_valid, errors = result
-
-    if is_valid:
         print("   ✓ Connection graph is valid (no cycles)")
     else:
-        print(f"   ⚠ Graph validation: {errors}")
+        print(f"   ✗ Validation errors: {[str(e) for e in result.errors]}")
+        return
 
     print("\n✅ Example completed successfully!")
     print(f"\nGenerated file: {output_file}")
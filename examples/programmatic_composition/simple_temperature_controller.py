@@ -12,21 +12,44 @@ The controller maintains room temperature by:
 """
 
 import json
+import sys
 from pathlib import Path
 
 from python_cdl.models.blocks import CompositeBlock, ElementaryBlock
 from python_cdl.models.connections import Connection
 from python_cdl.models.connectors import RealInput, RealOutput
-from python_cdl.models.parameters import Parameter
 from python_cdl.models.types import CDLTypeEnum
 
+from utils import build_params, prototype
 
+# Module-level aliases for the CDL types used throughout the factories
+_REAL = CDLTypeEnum.REAL
+_INT = CDLTypeEnum.INTEGER
+
+# Interned unit strings shared by every connector and parameter
+_K, _S, _ONE, _RATE = map(sys.intern, ("K", "s", "1", "1/s"))
+
+# Directory the example writes its exported files to
+_OUTPUT_DIR = Path(__file__).parent / "output"
+
+
+_PI_CONTROLLER_PARAMS = (
+    ("controllerType", _INT, 2, None, None,
+     "Type of controller (1=P, 2=PI, 3=PID)"),  # PI control
+    ("k", _REAL, 0.5, _ONE, None, "Proportional gain"),
+    ("Ti", _REAL, 60.0, _S, "Time", "Integral time constant"),
+    ("yMax", _REAL, 1.0, _ONE, None, "Maximum output"),
+    ("yMin", _REAL, 0.0, _ONE, None, "Minimum output"),
+)
+
+
+@prototype
 def create_pi_controller() -> ElementaryBlock:
     """Create a PI controller block with anti-windup.
 
     CDL Type: Buildings.Controls.OBC.CDL.Continuous.LimPID
     """
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="PI_Controller",
         block_type="Buildings.Controls.OBC.CDL.Continuous.LimPID",
         category="elementary",
@@ -34,15 +57,15 @@ def create_pi_controller() -> ElementaryBlock:
         inputs=[
             RealInput(
                 name="u_s",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Setpoint temperature"
             ),
             RealInput(
                 name="u_m",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Measured temperature"
             ),
@@ -50,59 +73,29 @@ def create_pi_controller() -> ElementaryBlock:
         outputs=[
             RealOutput(
                 name="y",
-                type=CDLTypeEnum.REAL,
-                unit="1",
+                type=_REAL,
+                unit=_ONE,
                 min=0.0,
                 max=1.0,
                 description="Control signal (0-1)"
             ),
         ],
-        parameters=[
-            Parameter(
-                name="controllerType",
-                type=CDLTypeEnum.INTEGER,
-                value=2,  # PI control
-                description="Type of controller (1=P, 2=PI, 3=PID)"
-            ),
-            Parameter(
-                name="k",
-                type=CDLTypeEnum.REAL,
-                value=0.5,
-                unit="1",
-                description="Proportional gain"
-            ),
-            Parameter(
-                name="Ti",
-                type=CDLTypeEnum.REAL,
-                value=60.0,
-                unit="s",
-                quantity="Time",
-                description="Integral time constant"
-            ),
-            Parameter(
-                name="yMax",
-                type=CDLTypeEnum.REAL,
-                value=1.0,
-                unit="1",
-                description="Maximum output"
-            ),
-            Parameter(
-                name="yMin",
-                type=CDLTypeEnum.REAL,
-                value=0.0,
-                unit="1",
-                description="Minimum output"
-            ),
-        ],
+        parameters=build_params(_PI_CONTROLLER_PARAMS),
     )
 
 
+_TEMPERATURE_SENSOR_PARAMS = (
+    ("T", _REAL, 10.0, _S, "Time", "Filter time constant"),
+)
+
+
+@prototype
 def create_temperature_sensor() -> ElementaryBlock:
     """Create a temperature sensor block with noise filtering.
 
     CDL Type: Buildings.Controls.OBC.CDL.Continuous.Filter
     """
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="TempSensor",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Filter",
         category="elementary",
@@ -110,8 +103,8 @@ def create_temperature_sensor() -> ElementaryBlock:
         inputs=[
             RealInput(
                 name="u",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Raw temperature measurement"
             ),
@@ -119,31 +112,31 @@ def create_temperature_sensor() -> ElementaryBlock:
         outputs=[
             RealOutput(
                 name="y",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Filtered temperature"
             ),
         ],
-        parameters=[
-            Parameter(
-                name="T",
-                type=CDLTypeEnum.REAL,
-                value=10.0,
-                unit="s",
-                quantity="Time",
-                description="Filter time constant"
-            ),
-        ],
+        parameters=build_params(_TEMPERATURE_SENSOR_PARAMS),
     )
 
 
+_VALVE_ACTUATOR_PARAMS = (
+    ("riseRate", _REAL, 0.1, _RATE, None,
+     "Maximum rate of valve opening (per second)"),
+    ("fallRate", _REAL, 0.1, _RATE, None,
+     "Maximum rate of valve closing (per second)"),
+)
+
+
+@prototype
 def create_valve_actuator() -> ElementaryBlock:
     """Create a valve actuator with rate limiting.
 
     CDL Type: Buildings.Controls.OBC.CDL.Continuous.LimRateLimiter
     """
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="HeatingValve",
         block_type="Buildings.Controls.OBC.CDL.Continuous.LimRateLimiter",
         category="elementary",
@@ -151,8 +144,8 @@ def create_valve_actuator() -> ElementaryBlock:
         inputs=[
             RealInput(
                 name="u",
-                type=CDLTypeEnum.REAL,
-                unit="1",
+                type=_REAL,
+                unit=_ONE,
                 min=0.0,
                 max=1.0,
                 description="Desired valve position"
@@ -161,38 +154,30 @@ def create_valve_actuator() -> ElementaryBlock:
         outputs=[
             RealOutput(
                 name="y",
-                type=CDLTypeEnum.REAL,
-                unit="1",
+                type=_REAL,
+                unit=_ONE,
                 min=0.0,
                 max=1.0,
                 description="Actual valve position"
             ),
         ],
-        parameters=[
-            Parameter(
-                name="riseRate",
-                type=CDLTypeEnum.REAL,
-                value=0.1,
-                unit="1/s",
-                description="Maximum rate of valve opening (per second)"
-            ),
-            Parameter(
-                name="fallRate",
-                type=CDLTypeEnum.REAL,
-                value=0.1,
-                unit="1/s",
-                description="Maximum rate of valve closing (per second)"
-            ),
-        ],
+        parameters=build_params(_VALVE_ACTUATOR_PARAMS),
     )
 
 
+_SETPOINT_SOURCE_PARAMS = (
+    ("k", _REAL, 294.15, _K, "ThermodynamicTemperature",
+     "Constant setpoint value"),  # 21°C in Kelvin
+)
+
+
+@prototype
 def create_setpoint_source() -> ElementaryBlock:
     """Create a constant setpoint source.
 
     CDL Type: Buildings.Controls.OBC.CDL.Continuous.Sources.Constant
     """
-    return ElementaryBlock(
+    return ElementaryBlock.model_construct(
         name="SetpointSource",
         block_type="Buildings.Controls.OBC.CDL.Continuous.Sources.Constant",
         category="elementary",
@@ -201,22 +186,13 @@ def create_setpoint_source() -> ElementaryBlock:
         outputs=[
             RealOutput(
                 name="y",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Setpoint temperature"
             ),
         ],
-        parameters=[
-            Parameter(
-                name="k",
-                type=CDLTypeEnum.REAL,
-                value=294.15,  # 21°C in Kelvin
-                unit="K",
-                quantity="ThermodynamicTemperature",
-                description="Constant setpoint value"
-            ),
-        ],
+        parameters=build_params(_SETPOINT_SOURCE_PARAMS),
     )
 
 
@@ -238,8 +214,8 @@ def create_temperature_control_system() -> CompositeBlock:
         inputs=[
             RealInput(
                 name="temperature_measurement",
-                type=CDLTypeEnum.REAL,
-                unit="K",
+                type=_REAL,
+                unit=_K,
                 quantity="ThermodynamicTemperature",
                 description="Room temperature sensor input"
             ),
@@ -247,8 +223,8 @@ def create_temperature_control_system() -> CompositeBlock:
         outputs=[
             RealOutput(
                 name="valve_position",
-                type=CDLTypeEnum.REAL,
-                unit="1",
+                type=_REAL,
+                unit=_ONE,
                 min=0.0,
                 max=1.0,
                 description="Heating valve position output"
@@ -304,49 +280,54 @@ def create_temperature_control_system() -> CompositeBlock:
 
 def export_to_json(block: CompositeBlock, output_path: Path) -> None:
     """Export block to CDL-JSON format."""
-    # Use Pydantic's model_dump for JSON serialization
-    cdl_json = block.model_dump(mode='json', exclude_none=True)
+    # Serialize straight from the model in pydantic-core, emitting only the
+    # fields that were explicitly set; omitted fields are defaults the parser
+    # restores on import
+    cdl_json = block.model_dump_json(exclude_unset=True, indent=2)
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Write to file
-    with open(output_path, 'w') as f:
-        json.dump(cdl_json, f, indent=2)
+    output_path.write_text(cdl_json, encoding='utf-8')
 
     print(f"✓ Exported to {output_path}")
     print(f"  File size: {output_path.stat().st_size:,} bytes")
 
 
-def print_system_summary(system: CompositeBlock) -> None:
-    """Print a summary of the control system."""
-    print("\n" + "="*70)
-    print(f"Control System: {system.name}")
-    print("="*70)
-    print(f"\nDescription: {system.description}")
-    print(f"\nType: {system.block_type}")
-    print(f"Category: {system.category}")
-
-    print(f"\nInputs ({len(system.inputs)}):")
+def format_system_summary(system: CompositeBlock) -> str:
+    """Format a summary of the control system as a single string."""
+    rule = "="*70
+    parts = [
+        "",
+        rule,
+        f"Control System: {system.name}",
+        rule,
+        f"\nDescription: {system.description}",
+        f"\nType: {system.block_type}",
+        f"Category: {system.category}",
+    ]
+
+    parts.append(f"\nInputs ({len(system.inputs)}):")
     for inp in system.inputs:
-        print(f"  • {inp.name}: {inp.type} [{inp.unit}] - {inp.description}")
+        parts.append(f"  • {inp.name}: {inp.type} [{inp.unit}] - {inp.description}")
 
-    print(f"\nOutputs ({len(system.outputs)}):")
+    parts.append(f"\nOutputs ({len(system.outputs)}):")
     for out in system.outputs:
-        print(f"  • {out.name}: {out.type} [{out.unit}] - {out.description}")
+        parts.append(f"  • {out.name}: {out.type} [{out.unit}] - {out.description}")
 
-    print(f"\nInternal Blocks ({len(system.blocks)}):")
+    parts.append(f"\nInternal Blocks ({len(system.blocks)}):")
     for block in system.blocks:
-        print(f"  • {block.name} ({block.block_type})")
-        if block.parameters:
-            for param in block.parameters:
-                print(f"      - {param.name} = {param.value} {param.unit or ''}")
+        parts.append(f"  • {block.name} ({block.block_type})")
+        for param in block.parameters:
+            parts.append(f"      - {param.name} = {param.value} {param.unit or ''}")
 
-    print(f"\nConnections ({len(system.connections)}):")
+    parts.append(f"\nConnections ({len(system.connections)}):")
     for conn in system.connections:
-        print(f"  • {conn.from_block}.{conn.from_output} → {conn.to_block}.{conn.to_input}")
+        parts.append(f"  • {conn.from_block}.{conn.from_output} → {conn.to_block}.{conn.to_input}")
 
-    print("\n" + "="*70 + "\n")
+    parts.extend(["", rule, "\n"])
+    return "\n".join(parts)
 
 
 def main():
@@ -362,12 +343,11 @@ def main():
 
     # Print summary
     print("\n2. System summary:")
-    print_system_summary(system)
+    sys.stdout.write(format_system_summary(system))
 
     # Export to JSON
     print("3. Exporting to CDL-JSON format...")
-    output_dir = Path(__file__).parent / "output"
-    output_file = output_dir / "simple_temp_controller.json"
+    output_file = _OUTPUT_DIR / "simple_temp_controller.json"
     export_to_json(system, output_file)
 
     # Validation
@@ -377,17 +357,10 @@ def main():
     validator = BlockValidator()
     result = validator.validate(system)
 
-    # Handle both tuple and ValidationResult returns
-    if hasattr(result, 'is_valid'):
-        is_valid = result.is_valid
-        errors = result.errors if hasattr(result, 'errors') else []
-    else:
-        is_valid, errors = result
-
-    if is_valid:
+    if result.is_valid:
         print("   ✓ Block structure is valid")
     else:
-        print(f"   ✗ Validation errors: {errors}")
+        print(f"   ✗ Validation errors: {result.errors}")
         return
 
     # Round-trip test
@@ -395,7 +368,7 @@ def main():
     from python_cdl.parser import CDLParser
 
     parser = CDLParser()
-    with open(output_file) as f:
+    with open(output_file, encoding='utf-8') as f:
         json_data = json.load(f)
     reimported = parser.parse(json_data)
     print(f"   ✓ Successfully re-imported {reimported.name}")
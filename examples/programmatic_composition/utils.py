@@ -1,35 +1,114 @@
 """Utility functions for programmatic CDL composition examples."""
 
-import json
+import functools
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from python_cdl.models.blocks import Block, CompositeBlock
-from python_cdl.parser import CDLParser
-from python_cdl.validators import BlockValidator, GraphValidator
+from pydantic_core import from_json
 
+from python_cdl.models.blocks import Block, CompositeBlock, ElementaryBlock
+from python_cdl.models.parameters import Parameter
 
-def export_block_to_json(block: Block, output_path: Path) -> dict[str, Any]:
+if TYPE_CHECKING:
+    from python_cdl.validators import BlockValidator, GraphValidator
+
+
+@functools.cache
+def _validators() -> tuple["BlockValidator", "GraphValidator"]:
+    """Get the shared block and graph validators.
+
+    Validators hold no per-call state, so one instance of each is shared. They
+    are imported on first use so scripts that only summarize or visualize
+    blocks never load the validator modules.
+    """
+    from python_cdl.validators import BlockValidator, GraphValidator
+
+    return BlockValidator(), GraphValidator()
+
+
+def prototype(factory: Callable[[], ElementaryBlock]) -> Callable[[], ElementaryBlock]:
+    """Build a factory's block once and return deep copies of that prototype.
+
+    Block parameters are compile-time constants, so the model tree
+    only needs to be constructed once; callers still get an independent copy
+    they are free to mutate.
+    """
+    cached = functools.cache(factory)
+
+    @functools.wraps(factory)
+    def wrapper() -> ElementaryBlock:
+        return cached().model_copy(deep=True)
+
+    return wrapper
+
+
+_PARAM_FIELDS = ("name", "type", "value", "unit", "quantity", "description")
+
+
+def build_params(spec: tuple[tuple[Any, ...], ...]) -> list[Parameter]:
+    """Build parameters from trusted spec rows.
+
+    Each row is ``(name, type, value[, unit[, quantity[, description]]])``;
+    ``None`` entries fall back to the field default.
+
+    The specs are static literals in the example modules, so
+    ``model_construct`` is used to skip re-validating them.
+    """
+    params = []
+    for row in spec:
+        fields = {key: val for key, val in zip(_PARAM_FIELDS, row) if val is not None}
+        params.append(Parameter.model_construct(**fields))
+    return params
+
+
+# Run block and graph validation concurrently. Both validators are pure
+# Python, so this only pays off on free-threaded builds; opt in by setting
+# CDL_PARALLEL_VALIDATION=1.
+_PARALLEL_VALIDATION = os.environ.get("CDL_PARALLEL_VALIDATION") == "1"
+
+
+@functools.cache
+def _validation_executor() -> ThreadPoolExecutor:
+    """Get the shared thread pool used for parallel validation."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="cdl-validate")
+
+
+# Most recently used validate_block results, oldest first
+_VALIDATION_CACHE_SIZE = 128
+_VALIDATION_CACHE: OrderedDict[tuple[str, bytes, bool], tuple[bool, tuple[str, ...]]] = OrderedDict()
+
+
+def export_block_to_json(
+    block: Block, output_path: Path, return_data: bool = False
+) -> dict[str, Any] | None:
     """Export a block to CDL-JSON format.
 
     Args:
         block: Block to export
         output_path: Path to save JSON file
+        return_data: Whether to parse the written JSON back into a dictionary
 
     Returns:
-        Dictionary containing the exported JSON data
+        Dictionary containing the exported JSON data if ``return_data`` is
+        set, otherwise None
     """
-    # Use Pydantic's model_dump for JSON serialization
-    cdl_json = block.model_dump(mode='json', exclude_none=True)
+    # Serialize straight from the model in pydantic-core; the same bytes are
+    # written to disk and, if requested, parsed back for the return value
+    json_bytes = block.model_dump_json(exclude_none=True, indent=2).encode()
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file with pretty formatting
-    with open(output_path, 'w') as f:
-        json.dump(cdl_json, f, indent=2, sort_keys=False)
+    # Write the file in a single call
+    output_path.write_bytes(json_bytes)
 
-    return cdl_json
+    return from_json(json_bytes) if return_data else None
 
 
 def validate_block(block: Block, check_graph: bool = True) -> tuple[bool, list[str]]:
@@ -41,51 +120,92 @@ def validate_block(block: Block, check_graph: bool = True) -> tuple[bool, list[s
 
     Returns:
         Tuple of (is_valid, list_of_errors)
+
+    Results are memoized on a fingerprint of the block's serialized content.
+    Computing that fingerprint still serializes the whole block on every call,
+    so a cache hit saves the validator passes but not the serialization.
     """
+    # Blocks are mutable, so results are keyed on the block's serialized
+    # content rather than its identity; any edit produces a new key. Only a
+    # fixed-size digest of the dump is kept, not the dump itself.
+    dump = block.model_dump_json(serialize_as_any=True).encode()
+    key = (type(block).__name__, hashlib.blake2b(dump, digest_size=16).digest(), check_graph)
+    cached = _VALIDATION_CACHE.get(key)
+    if cached is not None:
+        _VALIDATION_CACHE.move_to_end(key)
+        return cached[0], list(cached[1])
+
     all_errors = []
+    check_graph = check_graph and isinstance(block, CompositeBlock)
+    block_validator, graph_validator = _validators()
+
+    # The two validators inspect disjoint aspects of the block, so they can
+    # run side by side when parallel validation is enabled
+    if check_graph and _PARALLEL_VALIDATION:
+        graph_future = _validation_executor().submit(graph_validator.validate, block)
+    else:
+        graph_future = None
 
     # Validate block structure
-    block_validator = BlockValidator()
-    is_valid, errors = block_validator.validate(block)
+    result = block_validator.validate(block)
 
-    if not is_valid:
-        all_errors.extend([f"Block: {e}" for e in errors])
+    if not result.is_valid:
+        all_errors.extend([f"Block: {e}" for e in result.errors])
 
     # Validate connection graph if it's a composite block
-    if check_graph and isinstance(block, CompositeBlock):
-        graph_validator = GraphValidator()
-        is_valid, errors = graph_validator.validate(block)
+    if check_graph:
+        if graph_future is not None:
+            is_valid, errors = graph_future.result()
+        else:
+            is_valid, errors = graph_validator.validate(block)
 
         if not is_valid:
             all_errors.extend([f"Graph: {e}" for e in errors])
 
+    _VALIDATION_CACHE[key] = (len(all_errors) == 0, tuple(all_errors))
+    if len(_VALIDATION_CACHE) > _VALIDATION_CACHE_SIZE:
+        _VALIDATION_CACHE.popitem(last=False)
+
     return len(all_errors) == 0, all_errors
 
 
-def test_roundtrip(block: Block, json_path: Path) -> bool:
+def clear_validation_cache() -> None:
+    """Drop all memoized ``validate_block`` results, e.g. between tests."""
+    _VALIDATION_CACHE.clear()
+
+
+def test_roundtrip(block: Block, json_path: Path, validate: bool = True) -> bool:
     """Test that a block can be exported and re-imported correctly.
 
     Args:
         block: Original block
         json_path: Path where JSON was saved
+        validate: Re-import the file through the validating parser. When False,
+            the saved JSON is compared directly against the block's
+            serialization without rebuilding any models; this expects the
+            file to have been written by ``export_block_to_json``.
 
     Returns:
         True if round-trip was successful
     """
     try:
-        # Parse the exported file
-        parser = CDLParser()
-        reimported = parser.parse_file(json_path)
-
-        # Basic checks
-        assert reimported.name == block.name, "Name mismatch"
-        assert reimported.block_type == block.block_type, "Type mismatch"
-        assert len(reimported.inputs) == len(block.inputs), "Input count mismatch"
-        assert len(reimported.outputs) == len(block.outputs), "Output count mismatch"
-
-        if isinstance(block, CompositeBlock):
-            assert len(reimported.blocks) == len(block.blocks), "Block count mismatch"
-            assert len(reimported.connections) == len(block.connections), "Connection count mismatch"
+        if validate:
+            from python_cdl.parser import load_cdl_file
+
+            # Parse the exported file
+            reimported = load_cdl_file(json_path)
+
+            # A single serialized comparison covers names, types, connectors,
+            # parameters, child blocks and connections
+            assert (
+                reimported.model_dump_json(exclude_none=True)
+                == block.model_dump_json(exclude_none=True)
+            ), "Re-imported block differs from original"
+        else:
+            assert (
+                from_json(json_path.read_bytes())
+                == from_json(block.model_dump_json(exclude_none=True))
+            ), "Saved JSON differs from original"
 
         return True
 
@@ -94,118 +214,170 @@ def test_roundtrip(block: Block, json_path: Path) -> bool:
         return False
 
 
-def print_block_summary(block: Block, indent: int = 0) -> None:
-    """Print a formatted summary of a block's structure.
+def format_block_summary(block: Block, indent: int = 0) -> str:
+    """Format a summary of a block's structure.
 
     Args:
         block: Block to summarize
         indent: Indentation level for nested blocks
+
+    Returns:
+        Multi-line summary text
     """
     prefix = "  " * indent
+    # Prefixes for section headings and their bullet items, built once
+    heading = prefix + "   "
+    bullet = prefix + "     • "
 
-    print(f"{prefix}📦 {block.name} ({block.block_type})")
+    lines = [f"{prefix}📦 {block.name} ({block.block_type})"]
 
     if block.description:
-        print(f"{prefix}   Description: {block.description}")
-
-    # Inputs
-    if block.inputs:
-        print(f"{prefix}   Inputs ({len(block.inputs)}):")
-        for inp in block.inputs:
-            unit_str = f" [{inp.unit}]" if inp.unit else ""
-            print(f"{prefix}     • {inp.name}: {inp.type}{unit_str}")
-
-    # Outputs
-    if block.outputs:
-        print(f"{prefix}   Outputs ({len(block.outputs)}):")
-        for out in block.outputs:
-            unit_str = f" [{out.unit}]" if out.unit else ""
-            print(f"{prefix}     • {out.name}: {out.type}{unit_str}")
+        lines.append(f"{heading}Description: {block.description}")
+
+    # Inputs and outputs, read column-wise from the block's port tables
+    for label, table in (("Inputs", block.input_table), ("Outputs", block.output_table)):
+        if table.names:
+            lines.append(f"{heading}{label} ({len(table.names)}):")
+            lines.extend([
+                f"{bullet}{name}: {typ}" + (f" [{unit}]" if unit else "")
+                for name, typ, unit in zip(*table)
+            ])
 
     # Parameters
     if block.parameters:
-        print(f"{prefix}   Parameters ({len(block.parameters)}):")
+        lines.append(f"{heading}Parameters ({len(block.parameters)}):")
         for param in block.parameters[:3]:  # Show first 3
             unit_str = f" {param.unit}" if param.unit else ""
-            print(f"{prefix}     • {param.name} = {param.value}{unit_str}")
+            lines.append(f"{bullet}{param.name} = {param.value}{unit_str}")
         if len(block.parameters) > 3:
-            print(f"{prefix}     ... and {len(block.parameters) - 3} more")
+            lines.append(f"{prefix}     ... and {len(block.parameters) - 3} more")
 
     # Nested blocks for composite
     if isinstance(block, CompositeBlock) and block.blocks:
-        print(f"{prefix}   Internal Blocks ({len(block.blocks)}):")
+        lines.append(f"{heading}Internal Blocks ({len(block.blocks)}):")
         for child in block.blocks:
-            print(f"{prefix}     • {child.name} ({child.block_type})")
+            lines.append(f"{bullet}{child.name} ({child.block_type})")
 
+    return "\n".join(lines)
 
-def generate_graphviz(block: CompositeBlock, output_path: Path | None = None) -> str:
-    """Generate a Graphviz DOT representation of a composite block.
 
-    Args:
-        block: Composite block to visualize
-        output_path: Optional path to save .dot file
+def print_block_summary(block: Block, indent: int = 0) -> None:
+    """Print a formatted summary of a block's structure.
 
-    Returns:
-        DOT format string
+    Args:
+        block: Block to summarize
+        indent: Indentation level for nested blocks
     """
-    lines = [
-        "digraph ControlSystem {",
-        "  rankdir=LR;",
-        "  node [shape=box, style=rounded];",
-        ""
-    ]
+    sys.stdout.write(format_block_summary(block, indent) + "\n")
+
+
+# DOT edge templates; edges are labelled only when their port names differ
+_DOT_EDGE_LABELED = '  "%s" -> "%s" [label="%s→%s"];\n'
+_DOT_EDGE_PLAIN = '  "%s" -> "%s";\n'
+
+
+def _iter_dot_lines(block: CompositeBlock) -> Iterator[str]:
+    """Yield the newline-terminated lines of a block's Graphviz DOT document."""
+    yield "digraph ControlSystem {\n"
+    yield "  rankdir=LR;\n"
+    yield "  node [shape=box, style=rounded];\n"
+    yield "\n"
 
     # Add nodes
-    lines.append("  // External interfaces")
-    for inp in block.inputs:
-        lines.append(f'  "{inp.name}" [shape=circle, style=filled, fillcolor=lightblue];')
+    yield "  // External interfaces\n"
+    for name in block.input_table.names:
+        yield f'  "{name}" [shape=circle, style=filled, fillcolor=lightblue];\n'
 
-    for out in block.outputs:
-        lines.append(f'  "{out.name}" [shape=circle, style=filled, fillcolor=lightgreen];')
+    for name in block.output_table.names:
+        yield f'  "{name}" [shape=circle, style=filled, fillcolor=lightgreen];\n'
 
-    lines.append("\n  // Internal blocks")
+    yield "\n  // Internal blocks\n"
     for child in block.blocks:
-        label = f"{child.name}\\n({child.block_type})"
-        lines.append(f'  "{child.name}" [label="{label}"];')
+        yield f'  "{child.name}" [label="{child.name}\\n({child.block_type})"];\n'
 
     # Add connections
-    lines.append("\n  // Connections")
+    yield "\n  // Connections\n"
     for conn in block.connections:
-        label = f' [label="{conn.from_port}→{conn.to_port}"]' if conn.from_port != conn.to_port else ""
-        lines.append(f'  "{conn.from_block}" -> "{conn.to_block}"{label};')
+        if conn.from_output != conn.to_input:
+            yield _DOT_EDGE_LABELED % (conn.from_block, conn.to_block, conn.from_output, conn.to_input)
+        else:
+            yield _DOT_EDGE_PLAIN % (conn.from_block, conn.to_block)
+
+    yield "}"
 
-    lines.append("}")
 
-    dot_string = "\n".join(lines)
+def generate_graphviz(block: CompositeBlock, output_path: Path | None = None) -> str:
+    """Generate a Graphviz DOT representation of a composite block.
+
+    Args:
+        block: Composite block to visualize
+        output_path: Optional path to save .dot file
+
+    Returns:
+        DOT format string
+    """
+    dot_string = "".join(_iter_dot_lines(block))
 
     if output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w') as f:
-            f.write(dot_string)
+        output_path.write_text(dot_string, encoding='utf-8')
 
     return dot_string
 
 
-def compare_blocks(block1: Block, block2: Block) -> dict[str, Any]:
+def generate_graphviz_to_file(block: CompositeBlock, output_path: Path) -> None:
+    """Stream a Graphviz DOT representation of a composite block to a file.
+
+    Unlike ``generate_graphviz``, the document is never held in memory as a
+    whole, which keeps memory flat for very large composites.
+
+    Args:
+        block: Composite block to visualize
+        output_path: Path to save .dot file
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.writelines(_iter_dot_lines(block))
+
+
+def compare_blocks(block1: Block, block2: Block, fast_fail: bool = False) -> dict[str, Any]:
     """Compare two blocks and return differences.
 
+    Cheap invariants (names, types and counts) are checked first; the full
+    serialized comparison behind ``identical`` only runs when they all match.
+
     Args:
         block1: First block
         block2: Second block
+        fast_fail: Return as soon as any check fails, leaving the remaining
+            checks out of the result
 
     Returns:
         Dictionary describing differences
     """
-    differences = {
-        "name": block1.name == block2.name,
-        "type": block1.block_type == block2.block_type,
-        "input_count": len(block1.inputs) == len(block2.inputs),
-        "output_count": len(block1.outputs) == len(block2.outputs),
-        "parameter_count": len(block1.parameters) == len(block2.parameters),
-    }
-
+    checks = [
+        ("name", lambda: block1.name == block2.name),
+        ("type", lambda: block1.block_type == block2.block_type),
+        ("input_count", lambda: len(block1.inputs) == len(block2.inputs)),
+        ("output_count", lambda: len(block1.outputs) == len(block2.outputs)),
+        ("parameter_count", lambda: len(block1.parameters) == len(block2.parameters)),
+    ]
     if isinstance(block1, CompositeBlock) and isinstance(block2, CompositeBlock):
-        differences["block_count"] = len(block1.blocks) == len(block2.blocks)
-        differences["connection_count"] = len(block1.connections) == len(block2.connections)
+        checks += [
+            ("block_count", lambda: len(block1.blocks) == len(block2.blocks)),
+            ("connection_count", lambda: len(block1.connections) == len(block2.connections)),
+        ]
+
+    differences: dict[str, Any] = {}
+    for key, check in checks:
+        differences[key] = check()
+        if fast_fail and not differences[key]:
+            differences["identical"] = False
+            return differences
+
+    # Deep comparison only when every cheap invariant already matches
+    differences["identical"] = all(differences.values()) and (
+        block1.model_dump_json(exclude_none=True) == block2.model_dump_json(exclude_none=True)
+    )
 
     return differences
@@ -17,8 +17,13 @@ from .ahu_controller import (
     SupplyFanController,
 )
 from .control_sequences import AHUControlSystem, CoordinationLogic
-from .zone_controller import VAVBoxController, create_vav_controller_block
+from .zone_controller import (
+    VAVBoxBatchController,
+    VAVBoxController,
+    create_vav_controller_block,
+)
 from .zone_models import (
+    ZoneBatch,
     ZoneConfig,
     ZoneState,
     ZoneType,
@@ -29,8 +34,10 @@ from .zone_models import (
 __all__ = [
     # Zone-level controllers
     "VAVBoxController",
+    "VAVBoxBatchController",
     "ZoneConfig",
     "ZoneState",
+    "ZoneBatch",
     "ZoneType",
     "get_zone_config",
     "create_custom_zone_config",
@@ -8,6 +8,9 @@ in a VAV reheat system, including:
 - Economizer control with mixed air temperature control
 """
 
+import functools
+import sys
+from collections.abc import Callable
 from enum import Enum
 from typing import Any
 
@@ -18,6 +21,22 @@ from python_cdl.models.connectors import BooleanInput, BooleanOutput, RealInput,
 from python_cdl.models.parameters import Parameter
 from python_cdl.models.types import CDLTypeEnum
 
+from .units import (
+    Q_ENTH,
+    Q_PRESS,
+    Q_TDIFF,
+    Q_TEMP,
+    Q_TIME,
+    Q_VFR,
+    U_DEGC,
+    U_H,
+    U_JKG,
+    U_K,
+    U_M3S,
+    U_PA,
+    U_S,
+)
+
 
 class OperatingMode(str, Enum):
     """AHU operating modes."""
@@ -28,6 +47,585 @@ class OperatingMode(str, Enum):
     NIGHT_SETBACK = "night_setback"
 
 
+# Module-level alias for the CDL type used by every parameter below
+_REAL = CDLTypeEnum.REAL
+
+# Interned block type names, used as registry keys and block_type values
+_BT_MODE, _BT_PI, _BT_SF, _BT_RF, _BT_ECON, _BT_DPR = map(
+    sys.intern,
+    (
+        "ModeSelector",
+        "PIController",
+        "SupplyFanController",
+        "ReturnFanController",
+        "EconomizerController",
+        "DuctPressureReset",
+    ),
+)
+
+# Connector and parameter descriptors are built on first use of each block
+# type and handed to every instance, so each descriptor is validated exactly
+# once. Connectors are frozen and shared;
+# parameters are copied per instance because callers tune their values
+# after construction.
+
+
+def _fresh(parameters: tuple[Parameter, ...]) -> list[Parameter]:
+    """Return per-instance copies of cached parameter descriptors."""
+    return [p.model_copy() for p in parameters]
+
+
+@functools.cache
+def _mode_selector_spec() -> dict[str, Any]:
+    """Descriptors for :class:`ModeSelector`."""
+    return {
+        "description": "Finite state machine for AHU operating mode selection",
+        "inputs": (
+            BooleanInput(
+                name="uOccupied",
+                description="Occupancy schedule input (true = occupied period)",
+            ),
+            RealInput(
+                name="TZonAve",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Average zone temperature",
+            ),
+            RealInput(
+                name="TZonSet",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Zone temperature setpoint",
+            ),
+            RealInput(
+                name="TOut",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Outside air temperature",
+            ),
+            RealInput(
+                name="timeOfDay",
+                quantity=Q_TIME,
+                unit=U_H,
+                description="Time of day in hours (0-24)",
+            ),
+        ),
+        "outputs": (
+            BooleanOutput(
+                name="yOccupied",
+                description="Occupied mode active",
+            ),
+            BooleanOutput(
+                name="yMorningWarmup",
+                description="Morning warmup mode active",
+            ),
+            BooleanOutput(
+                name="yNightSetback",
+                description="Night setback mode active",
+            ),
+            BooleanOutput(
+                name="yUnoccupied",
+                description="Unoccupied mode active",
+            ),
+        ),
+        "parameters": (
+            Parameter(
+                name="tWarmupStart",
+                type=_REAL,
+                value=1.0,
+                quantity=Q_TIME,
+                unit=U_H,
+                description="Hours before occupancy to start warmup",
+            ),
+            Parameter(
+                name="dTWarmup",
+                type=_REAL,
+                value=2.0,
+                quantity=Q_TDIFF,
+                unit=U_K,
+                description="Temperature deficit to trigger warmup",
+            ),
+            Parameter(
+                name="tNightSetbackStart",
+                type=_REAL,
+                value=22.0,
+                quantity=Q_TIME,
+                unit=U_H,
+                description="Time of day to start night setback",
+            ),
+        ),
+    }
+
+
+@functools.cache
+def _pi_controller_spec() -> dict[str, Any]:
+    """Descriptors for :class:`PIController`."""
+    return {
+        "description": "Proportional-Integral controller with anti-windup",
+        "inputs": (
+            RealInput(
+                name="u_s",
+                description="Setpoint value",
+            ),
+            RealInput(
+                name="u_m",
+                description="Measured value",
+            ),
+            BooleanInput(
+                name="enable",
+                description="Enable controller (false = reset integral term)",
+            ),
+        ),
+        "outputs": (
+            RealOutput(
+                name="y",
+                min=0.0,
+                max=1.0,
+                description="Control output (0-1)",
+            ),
+        ),
+        "parameters": (
+            Parameter(
+                name="k",
+                type=_REAL,
+                value=1.0,
+                description="Proportional gain",
+                min=0.0,
+            ),
+            Parameter(
+                name="Ti",
+                type=_REAL,
+                value=60.0,
+                quantity=Q_TIME,
+                unit=U_S,
+                description="Integral time constant",
+                min=0.01,
+            ),
+            Parameter(
+                name="yMax",
+                type=_REAL,
+                value=1.0,
+                description="Maximum controller output",
+            ),
+            Parameter(
+                name="yMin",
+                type=_REAL,
+                value=0.0,
+                description="Minimum controller output",
+            ),
+        ),
+    }
+
+
+@functools.cache
+def _supply_fan_controller_spec() -> dict[str, Any]:
+    """Descriptors for :class:`SupplyFanController`."""
+    return {
+        "description": "VFD speed control for supply fan with static pressure control",
+        "inputs": (
+            RealInput(
+                name="pDuctSet",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Duct static pressure setpoint",
+            ),
+            RealInput(
+                name="pDuct",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Measured duct static pressure",
+            ),
+            BooleanInput(
+                name="uEnable",
+                description="Enable fan operation",
+            ),
+            BooleanInput(
+                name="uOccupied",
+                description="Occupied mode active",
+            ),
+        ),
+        "outputs": (
+            RealOutput(
+                name="yFanSpeed",
+                min=0.0,
+                max=1.0,
+                description="Fan speed command (0-1)",
+            ),
+            BooleanOutput(
+                name="yFanStatus",
+                description="Fan running status",
+            ),
+            BooleanOutput(
+                name="yAlarm",
+                description="Fan alarm (failed to prove)",
+            ),
+        ),
+        "parameters": (
+            Parameter(
+                name="kp",
+                type=_REAL,
+                value=0.5,
+                description="Proportional gain for pressure control",
+            ),
+            Parameter(
+                name="Ti",
+                type=_REAL,
+                value=60.0,
+                quantity=Q_TIME,
+                unit=U_S,
+                description="Integral time constant",
+            ),
+            Parameter(
+                name="spdMin",
+                type=_REAL,
+                value=0.3,
+                description="Minimum fan speed when occupied",
+                min=0.0,
+                max=1.0,
+            ),
+            Parameter(
+                name="spdMinUnoccupied",
+                type=_REAL,
+                value=0.15,
+                description="Minimum fan speed when unoccupied",
+                min=0.0,
+                max=1.0,
+            ),
+            Parameter(
+                name="tProveDelay",
+                type=_REAL,
+                value=30.0,
+                quantity=Q_TIME,
+                unit=U_S,
+                description="Time delay for fan proving",
+            ),
+        ),
+    }
+
+
+@functools.cache
+def _return_fan_controller_spec() -> dict[str, Any]:
+    """Descriptors for :class:`ReturnFanController`."""
+    return {
+        "description": "Return fan speed tracking with building pressure control",
+        "inputs": (
+            RealInput(
+                name="VSupAir",
+                quantity=Q_VFR,
+                unit=U_M3S,
+                description="Supply airflow rate",
+            ),
+            RealInput(
+                name="pBldg",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Building static pressure",
+            ),
+            RealInput(
+                name="pBldgSet",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Building pressure setpoint",
+            ),
+            BooleanInput(
+                name="uEnable",
+                description="Enable return fan",
+            ),
+        ),
+        "outputs": (
+            RealOutput(
+                name="yFanSpeed",
+                min=0.0,
+                max=1.0,
+                description="Return fan speed command (0-1)",
+            ),
+        ),
+        "parameters": (
+            Parameter(
+                name="kTracking",
+                type=_REAL,
+                value=0.9,
+                description="Tracking gain (return flow as fraction of supply)",
+                min=0.0,
+                max=1.0,
+            ),
+            Parameter(
+                name="kPressure",
+                type=_REAL,
+                value=0.02,
+                description="Building pressure control gain",
+            ),
+            Parameter(
+                name="spdMin",
+                type=_REAL,
+                value=0.3,
+                description="Minimum return fan speed",
+                min=0.0,
+                max=1.0,
+            ),
+        ),
+    }
+
+
+@functools.cache
+def _economizer_controller_spec() -> dict[str, Any]:
+    """Descriptors for :class:`EconomizerController`."""
+    return {
+        "description": "Economizer with mixed air temperature and enthalpy control",
+        "inputs": (
+            RealInput(
+                name="TMixSet",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Mixed air temperature setpoint",
+            ),
+            RealInput(
+                name="TMix",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Measured mixed air temperature",
+            ),
+            RealInput(
+                name="TOut",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Outside air temperature",
+            ),
+            RealInput(
+                name="TRet",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Return air temperature",
+            ),
+            RealInput(
+                name="hOut",
+                quantity=Q_ENTH,
+                unit=U_JKG,
+                description="Outside air enthalpy",
+            ),
+            RealInput(
+                name="hRet",
+                quantity=Q_ENTH,
+                unit=U_JKG,
+                description="Return air enthalpy",
+            ),
+            RealInput(
+                name="VSupAir",
+                quantity=Q_VFR,
+                unit=U_M3S,
+                description="Supply airflow for minimum OA calculation",
+            ),
+            BooleanInput(
+                name="uEnable",
+                description="Enable economizer operation",
+            ),
+            BooleanInput(
+                name="uFreezeStat",
+                description="Freeze stat alarm (true = alarm active)",
+            ),
+        ),
+        "outputs": (
+            RealOutput(
+                name="yOutDamper",
+                min=0.0,
+                max=1.0,
+                description="Outdoor air damper position (0=closed, 1=open)",
+            ),
+            RealOutput(
+                name="yRetDamper",
+                min=0.0,
+                max=1.0,
+                description="Return air damper position (0=closed, 1=open)",
+            ),
+            RealOutput(
+                name="yRelDamper",
+                min=0.0,
+                max=1.0,
+                description="Relief damper position (0=closed, 1=open)",
+            ),
+            BooleanOutput(
+                name="yEconomizerActive",
+                description="Economizer mode active (not at minimum OA)",
+            ),
+        ),
+        "parameters": (
+            Parameter(
+                name="VOutMinFra",
+                type=_REAL,
+                value=0.15,
+                description="Minimum outdoor air fraction",
+                min=0.0,
+                max=1.0,
+            ),
+            Parameter(
+                name="kp",
+                type=_REAL,
+                value=0.5,
+                description="Proportional gain for mixed air temperature control",
+            ),
+            Parameter(
+                name="Ti",
+                type=_REAL,
+                value=120.0,
+                quantity=Q_TIME,
+                unit=U_S,
+                description="Integral time constant",
+            ),
+            Parameter(
+                name="TOutLowLim",
+                type=_REAL,
+                value=-5.0,
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Lower limit for economizer operation",
+            ),
+            Parameter(
+                name="TOutHighLim",
+                type=_REAL,
+                value=21.0,
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Upper limit for economizer operation",
+            ),
+            Parameter(
+                name="hOutHighLim",
+                type=_REAL,
+                value=65000.0,
+                quantity=Q_ENTH,
+                unit=U_JKG,
+                description="Maximum outdoor air enthalpy for economizer",
+            ),
+            Parameter(
+                name="dhEconomizerMin",
+                type=_REAL,
+                value=5000.0,
+                quantity=Q_ENTH,
+                unit=U_JKG,
+                description="Minimum enthalpy difference (hRet - hOut) for economizer",
+            ),
+        ),
+    }
+
+
+@functools.cache
+def _duct_pressure_reset_spec() -> dict[str, Any]:
+    """Descriptors for :class:`DuctPressureReset`."""
+    return {
+        "description": "Duct static pressure setpoint reset using trim and respond",
+        "inputs": (
+            RealInput(
+                name="uDamperPositions",
+                description="Array of VAV box damper positions (0-1)",
+                min=0.0,
+                max=1.0,
+            ),
+            BooleanInput(
+                name="uOccupied",
+                description="Occupied mode active",
+            ),
+        ),
+        "outputs": (
+            RealOutput(
+                name="pDuctSet",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Duct static pressure setpoint",
+            ),
+        ),
+        "parameters": (
+            Parameter(
+                name="pDuctSetMin",
+                type=_REAL,
+                value=75.0,
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Minimum duct static pressure setpoint",
+            ),
+            Parameter(
+                name="pDuctSetMax",
+                type=_REAL,
+                value=400.0,
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Maximum duct static pressure setpoint",
+            ),
+            Parameter(
+                name="pDuctSetOccupied",
+                type=_REAL,
+                value=250.0,
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Initial occupied setpoint",
+            ),
+            Parameter(
+                name="pDuctSetUnoccupied",
+                type=_REAL,
+                value=100.0,
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Initial unoccupied setpoint",
+            ),
+            Parameter(
+                name="damperThreshold",
+                type=_REAL,
+                value=0.9,
+                description="Damper position threshold for trim up",
+                min=0.0,
+                max=1.0,
+            ),
+            Parameter(
+                name="trimAmount",
+                type=_REAL,
+                value=25.0,
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Pressure adjustment per trim cycle",
+            ),
+            Parameter(
+                name="trimInterval",
+                type=_REAL,
+                value=300.0,
+                quantity=Q_TIME,
+                unit=U_S,
+                description="Time between trim adjustments",
+            ),
+            Parameter(
+                name="respondTime",
+                type=_REAL,
+                value=30.0,
+                quantity=Q_TIME,
+                unit=U_S,
+                description="Response time for immediate pressure increase",
+            ),
+        ),
+    }
+
+
+# Registry of block type -> cached getter for its constructor arguments
+_BLOCK_SPECS: dict[str, Callable[[], dict[str, Any]]] = {
+    _BT_MODE: _mode_selector_spec,
+    _BT_PI: _pi_controller_spec,
+    _BT_SF: _supply_fan_controller_spec,
+    _BT_RF: _return_fan_controller_spec,
+    _BT_ECON: _economizer_controller_spec,
+    _BT_DPR: _duct_pressure_reset_spec,
+}
+
+
+def _spec_kwargs(block_type: str) -> dict[str, Any]:
+    """Return constructor arguments for a block type registered in ``_BLOCK_SPECS``."""
+    spec = _BLOCK_SPECS[block_type]()
+    # Pydantic builds a fresh list from each tuple during validation, so the
+    # connector tuples are passed through without an extra copy here.
+    return {
+        "block_type": block_type,
+        "description": spec["description"],
+        "inputs": spec["inputs"],
+        "outputs": spec["outputs"],
+        "parameters": _fresh(spec["parameters"]),
+    }
+
+
 class ModeSelector(CompositeBlock):
     """Mode selector using finite state machine for AHU operating modes.
 
@@ -46,86 +644,7 @@ class ModeSelector(CompositeBlock):
 
     def __init__(self, name: str = "ModeSelector", **kwargs: Any):
         """Initialize mode selector with inputs, outputs, and parameters."""
-        super().__init__(
-            name=name,
-            block_type="ModeSelector",
-            description="Finite state machine for AHU operating mode selection",
-            inputs=[
-                BooleanInput(
-                    name="uOccupied",
-                    description="Occupancy schedule input (true = occupied period)",
-                ),
-                RealInput(
-                    name="TZonAve",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Average zone temperature",
-                ),
-                RealInput(
-                    name="TZonSet",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Zone temperature setpoint",
-                ),
-                RealInput(
-                    name="TOut",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Outside air temperature",
-                ),
-                RealInput(
-                    name="timeOfDay",
-                    quantity="Time",
-                    unit="h",
-                    description="Time of day in hours (0-24)",
-                ),
-            ],
-            outputs=[
-                BooleanOutput(
-                    name="yOccupied",
-                    description="Occupied mode active",
-                ),
-                BooleanOutput(
-                    name="yMorningWarmup",
-                    description="Morning warmup mode active",
-                ),
-                BooleanOutput(
-                    name="yNightSetback",
-                    description="Night setback mode active",
-                ),
-                BooleanOutput(
-                    name="yUnoccupied",
-                    description="Unoccupied mode active",
-                ),
-            ],
-            parameters=[
-                Parameter(
-                    name="tWarmupStart",
-                    type=CDLTypeEnum.REAL,
-                    value=1.0,
-                    quantity="Time",
-                    unit="h",
-                    description="Hours before occupancy to start warmup",
-                ),
-                Parameter(
-                    name="dTWarmup",
-                    type=CDLTypeEnum.REAL,
-                    value=2.0,
-                    quantity="TemperatureDifference",
-                    unit="K",
-                    description="Temperature deficit to trigger warmup",
-                ),
-                Parameter(
-                    name="tNightSetbackStart",
-                    type=CDLTypeEnum.REAL,
-                    value=22.0,
-                    quantity="Time",
-                    unit="h",
-                    description="Time of day to start night setback",
-                ),
-            ],
-            **kwargs,
-        )
+        super().__init__(name=name, **_spec_kwargs(_BT_MODE), **kwargs)
 
 
 class PIController(ElementaryBlock):
@@ -142,64 +661,7 @@ class PIController(ElementaryBlock):
 
     def __init__(self, name: str = "PIController", **kwargs: Any):
         """Initialize PI controller with inputs, outputs, and parameters."""
-        super().__init__(
-            name=name,
-            block_type="PIController",
-            description="Proportional-Integral controller with anti-windup",
-            inputs=[
-                RealInput(
-                    name="u_s",
-                    description="Setpoint value",
-                ),
-                RealInput(
-                    name="u_m",
-                    description="Measured value",
-                ),
-                BooleanInput(
-                    name="enable",
-                    description="Enable controller (false = reset integral term)",
-                ),
-            ],
-            outputs=[
-                RealOutput(
-                    name="y",
-                    min=0.0,
-                    max=1.0,
-                    description="Control output (0-1)",
-                ),
-            ],
-            parameters=[
-                Parameter(
-                    name="k",
-                    type=CDLTypeEnum.REAL,
-                    value=1.0,
-                    description="Proportional gain",
-                    min=0.0,
-                ),
-                Parameter(
-                    name="Ti",
-                    type=CDLTypeEnum.REAL,
-                    value=60.0,
-                    quantity="Time",
-                    unit="s",
-                    description="Integral time constant",
-                    min=0.01,
-                ),
-                Parameter(
-                    name="yMax",
-                    type=CDLTypeEnum.REAL,
-                    value=1.0,
-                    description="Maximum controller output",
-                ),
-                Parameter(
-                    name="yMin",
-                    type=CDLTypeEnum.REAL,
-                    value=0.0,
-                    description="Minimum controller output",
-                ),
-            ],
-            **kwargs,
-        )
+        super().__init__(name=name, **_spec_kwargs(_BT_PI), **kwargs)
 
 
 class SupplyFanController(CompositeBlock):
@@ -215,90 +677,7 @@ class SupplyFanController(CompositeBlock):
 
     def __init__(self, name: str = "SupplyFanController", **kwargs: Any):
         """Initialize supply fan controller with inputs, outputs, and parameters."""
-        super().__init__(
-            name=name,
-            block_type="SupplyFanController",
-            description="VFD speed control for supply fan with static pressure control",
-            inputs=[
-                RealInput(
-                    name="pDuctSet",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Duct static pressure setpoint",
-                ),
-                RealInput(
-                    name="pDuct",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Measured duct static pressure",
-                ),
-                BooleanInput(
-                    name="uEnable",
-                    description="Enable fan operation",
-                ),
-                BooleanInput(
-                    name="uOccupied",
-                    description="Occupied mode active",
-                ),
-            ],
-            outputs=[
-                RealOutput(
-                    name="yFanSpeed",
-                    min=0.0,
-                    max=1.0,
-                    description="Fan speed command (0-1)",
-                ),
-                BooleanOutput(
-                    name="yFanStatus",
-                    description="Fan running status",
-                ),
-                BooleanOutput(
-                    name="yAlarm",
-                    description="Fan alarm (failed to prove)",
-                ),
-            ],
-            parameters=[
-                Parameter(
-                    name="kp",
-                    type=CDLTypeEnum.REAL,
-                    value=0.5,
-                    description="Proportional gain for pressure control",
-                ),
-                Parameter(
-                    name="Ti",
-                    type=CDLTypeEnum.REAL,
-                    value=60.0,
-                    quantity="Time",
-                    unit="s",
-                    description="Integral time constant",
-                ),
-                Parameter(
-                    name="spdMin",
-                    type=CDLTypeEnum.REAL,
-                    value=0.3,
-                    description="Minimum fan speed when occupied",
-                    min=0.0,
-                    max=1.0,
-                ),
-                Parameter(
-                    name="spdMinUnoccupied",
-                    type=CDLTypeEnum.REAL,
-                    value=0.15,
-                    description="Minimum fan speed when unoccupied",
-                    min=0.0,
-                    max=1.0,
-                ),
-                Parameter(
-                    name="tProveDelay",
-                    type=CDLTypeEnum.REAL,
-                    value=30.0,
-                    quantity="Time",
-                    unit="s",
-                    description="Time delay for fan proving",
-                ),
-            ],
-            **kwargs,
-        )
+        super().__init__(name=name, **_spec_kwargs(_BT_SF), **kwargs)
 
 
 class ReturnFanController(CompositeBlock):
@@ -313,68 +692,7 @@ class ReturnFanController(CompositeBlock):
 
     def __init__(self, name: str = "ReturnFanController", **kwargs: Any):
         """Initialize return fan controller with inputs, outputs, and parameters."""
-        super().__init__(
-            name=name,
-            block_type="ReturnFanController",
-            description="Return fan speed tracking with building pressure control",
-            inputs=[
-                RealInput(
-                    name="VSupAir",
-                    quantity="VolumeFlowRate",
-                    unit="m3/s",
-                    description="Supply airflow rate",
-                ),
-                RealInput(
-                    name="pBldg",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Building static pressure",
-                ),
-                RealInput(
-                    name="pBldgSet",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Building pressure setpoint",
-                ),
-                BooleanInput(
-                    name="uEnable",
-                    description="Enable return fan",
-                ),
-            ],
-            outputs=[
-                RealOutput(
-                    name="yFanSpeed",
-                    min=0.0,
-                    max=1.0,
-                    description="Return fan speed command (0-1)",
-                ),
-            ],
-            parameters=[
-                Parameter(
-                    name="kTracking",
-                    type=CDLTypeEnum.REAL,
-                    value=0.9,
-                    description="Tracking gain (return flow as fraction of supply)",
-                    min=0.0,
-                    max=1.0,
-                ),
-                Parameter(
-                    name="kPressure",
-                    type=CDLTypeEnum.REAL,
-                    value=0.02,
-                    description="Building pressure control gain",
-                ),
-                Parameter(
-                    name="spdMin",
-                    type=CDLTypeEnum.REAL,
-                    value=0.3,
-                    description="Minimum return fan speed",
-                    min=0.0,
-                    max=1.0,
-                ),
-            ],
-            **kwargs,
-        )
+        super().__init__(name=name, **_spec_kwargs(_BT_RF), **kwargs)
 
 
 class EconomizerController(CompositeBlock):
@@ -394,144 +712,7 @@ class EconomizerController(CompositeBlock):
 
     def __init__(self, name: str = "EconomizerController", **kwargs: Any):
         """Initialize economizer controller with inputs, outputs, and parameters."""
-        super().__init__(
-            name=name,
-            block_type="EconomizerController",
-            description="Economizer with mixed air temperature and enthalpy control",
-            inputs=[
-                RealInput(
-                    name="TMixSet",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Mixed air temperature setpoint",
-                ),
-                RealInput(
-                    name="TMix",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Measured mixed air temperature",
-                ),
-                RealInput(
-                    name="TOut",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Outside air temperature",
-                ),
-                RealInput(
-                    name="TRet",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Return air temperature",
-                ),
-                RealInput(
-                    name="hOut",
-                    quantity="SpecificEnthalpy",
-                    unit="J/kg",
-                    description="Outside air enthalpy",
-                ),
-                RealInput(
-                    name="hRet",
-                    quantity="SpecificEnthalpy",
-                    unit="J/kg",
-                    description="Return air enthalpy",
-                ),
-                RealInput(
-                    name="VSupAir",
-                    quantity="VolumeFlowRate",
-                    unit="m3/s",
-                    description="Supply airflow for minimum OA calculation",
-                ),
-                BooleanInput(
-                    name="uEnable",
-                    description="Enable economizer operation",
-                ),
-                BooleanInput(
-                    name="uFreezeStat",
-                    description="Freeze stat alarm (true = alarm active)",
-                ),
-            ],
-            outputs=[
-                RealOutput(
-                    name="yOutDamper",
-                    min=0.0,
-                    max=1.0,
-                    description="Outdoor air damper position (0=closed, 1=open)",
-                ),
-                RealOutput(
-                    name="yRetDamper",
-                    min=0.0,
-                    max=1.0,
-                    description="Return air damper position (0=closed, 1=open)",
-                ),
-                RealOutput(
-                    name="yRelDamper",
-                    min=0.0,
-                    max=1.0,
-                    description="Relief damper position (0=closed, 1=open)",
-                ),
-                BooleanOutput(
-                    name="yEconomizerActive",
-                    description="Economizer mode active (not at minimum OA)",
-                ),
-            ],
-            parameters=[
-                Parameter(
-                    name="VOutMinFra",
-                    type=CDLTypeEnum.REAL,
-                    value=0.15,
-                    description="Minimum outdoor air fraction",
-                    min=0.0,
-                    max=1.0,
-                ),
-                Parameter(
-                    name="kp",
-                    type=CDLTypeEnum.REAL,
-                    value=0.5,
-                    description="Proportional gain for mixed air temperature control",
-                ),
-                Parameter(
-                    name="Ti",
-                    type=CDLTypeEnum.REAL,
-                    value=120.0,
-                    quantity="Time",
-                    unit="s",
-                    description="Integral time constant",
-                ),
-                Parameter(
-                    name="TOutLowLim",
-                    type=CDLTypeEnum.REAL,
-                    value=-5.0,
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Lower limit for economizer operation",
-                ),
-                Parameter(
-                    name="TOutHighLim",
-                    type=CDLTypeEnum.REAL,
-                    value=21.0,
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Upper limit for economizer operation",
-                ),
-                Parameter(
-                    name="hOutHighLim",
-                    type=CDLTypeEnum.REAL,
-                    value=65000.0,
-                    quantity="SpecificEnthalpy",
-                    unit="J/kg",
-                    description="Maximum outdoor air enthalpy for economizer",
-                ),
-                Parameter(
-                    name="dhEconomizerMin",
-                    type=CDLTypeEnum.REAL,
-                    value=5000.0,
-                    quantity="SpecificEnthalpy",
-                    unit="J/kg",
-                    description="Minimum enthalpy difference (hRet - hOut) for economizer",
-                ),
-            ],
-            **kwargs,
-        )
+        super().__init__(name=name, **_spec_kwargs(_BT_ECON), **kwargs)
 
 
 class DuctPressureReset(CompositeBlock):
@@ -550,95 +731,4 @@ class DuctPressureReset(CompositeBlock):
 
     def __init__(self, name: str = "DuctPressureReset", **kwargs: Any):
         """Initialize duct pressure reset with inputs, outputs, and parameters."""
-        super().__init__(
-            name=name,
-            block_type="DuctPressureReset",
-            description="Duct static pressure setpoint reset using trim and respond",
-            inputs=[
-                RealInput(
-                    name="uDamperPositions",
-                    description="Array of VAV box damper positions (0-1)",
-                    min=0.0,
-                    max=1.0,
-                ),
-                BooleanInput(
-                    name="uOccupied",
-                    description="Occupied mode active",
-                ),
-            ],
-            outputs=[
-                RealOutput(
-                    name="pDuctSet",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Duct static pressure setpoint",
-                ),
-            ],
-            parameters=[
-                Parameter(
-                    name="pDuctSetMin",
-                    type=CDLTypeEnum.REAL,
-                    value=75.0,
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Minimum duct static pressure setpoint",
-                ),
-                Parameter(
-                    name="pDuctSetMax",
-                    type=CDLTypeEnum.REAL,
-                    value=400.0,
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Maximum duct static pressure setpoint",
-                ),
-                Parameter(
-                    name="pDuctSetOccupied",
-                    type=CDLTypeEnum.REAL,
-                    value=250.0,
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Initial occupied setpoint",
-                ),
-                Parameter(
-                    name="pDuctSetUnoccupied",
-                    type=CDLTypeEnum.REAL,
-                    value=100.0,
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Initial unoccupied setpoint",
-                ),
-                Parameter(
-                    name="damperThreshold",
-                    type=CDLTypeEnum.REAL,
-                    value=0.9,
-                    description="Damper position threshold for trim up",
-                    min=0.0,
-                    max=1.0,
-                ),
-                Parameter(
-                    name="trimAmount",
-                    type=CDLTypeEnum.REAL,
-                    value=25.0,
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Pressure adjustment per trim cycle",
-                ),
-                Parameter(
-                    name="trimInterval",
-                    type=CDLTypeEnum.REAL,
-                    value=300.0,
-                    quantity="Time",
-                    unit="s",
-                    description="Time between trim adjustments",
-                ),
-                Parameter(
-                    name="respondTime",
-                    type=CDLTypeEnum.REAL,
-                    value=30.0,
-                    quantity="Time",
-                    unit="s",
-                    description="Response time for immediate pressure increase",
-                ),
-            ],
-            **kwargs,
-        )
+        super().__init__(name=name, **_spec_kwargs(_BT_DPR), **kwargs)
@@ -16,9 +16,12 @@ Control Coordination:
 The system implements ASHRAE Guideline 36 High Performance Sequences of Operation.
 """
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 
 from python_cdl.models.blocks import CompositeBlock
 from python_cdl.models.connections import Connection
@@ -33,6 +36,312 @@ from .ahu_controller import (
     ReturnFanController,
     SupplyFanController,
 )
+from .units import (
+    Q_ENTH,
+    Q_PRESS,
+    Q_TEMP,
+    Q_TIME,
+    Q_VFR,
+    U_DEGC,
+    U_H,
+    U_JKG,
+    U_M3S,
+    U_PA,
+)
+
+
+_CONNECTION_FIELDS = ("from_block", "from_output", "to_block", "to_input", "description")
+
+# Internal connections as (from_block, from_output, to_block, to_input, description)
+_CONNECTION_ROWS = (
+    # Mode selector connections
+    ("uOccupancySchedule", "uOccupancySchedule", "modeSelector", "uOccupied",
+     "Pass occupancy schedule to mode selector"),
+    ("TZoneAverage", "TZoneAverage", "modeSelector", "TZonAve",
+     "Zone temperature to mode selector"),
+    ("TZoneSetpoint", "TZoneSetpoint", "modeSelector", "TZonSet",
+     "Zone setpoint to mode selector"),
+    ("TOut", "TOut", "modeSelector", "TOut",
+     "Outside temperature to mode selector"),
+    ("timeOfDay", "timeOfDay", "modeSelector", "timeOfDay",
+     "Time of day to mode selector"),
+    # Mode selector to other controllers
+    ("modeSelector", "yOccupied", "ductPressureReset", "uOccupied",
+     "Occupied status to pressure reset"),
+    ("modeSelector", "yOccupied", "supplyFanController", "uOccupied",
+     "Occupied status to supply fan"),
+    # Pressure reset connections
+    ("uDamperPositions", "uDamperPositions", "ductPressureReset", "uDamperPositions",
+     "VAV damper positions to pressure reset"),
+    ("ductPressureReset", "pDuctSet", "supplyFanController", "pDuctSet",
+     "Pressure setpoint to supply fan controller"),
+    # Supply fan connections
+    ("pDuct", "pDuct", "supplyFanController", "pDuct",
+     "Duct pressure measurement to supply fan controller"),
+    # Return fan connections
+    ("VSupAir", "VSupAir", "returnFanController", "VSupAir",
+     "Supply airflow to return fan controller"),
+    ("pBldg", "pBldg", "returnFanController", "pBldg",
+     "Building pressure to return fan controller"),
+    # Economizer connections
+    ("TMix", "TMix", "economizerController", "TMix",
+     "Mixed air temperature to economizer"),
+    ("TOut", "TOut", "economizerController", "TOut",
+     "Outside air temperature to economizer"),
+    ("TRet", "TRet", "economizerController", "TRet",
+     "Return air temperature to economizer"),
+    ("hOut", "hOut", "economizerController", "hOut",
+     "Outside air enthalpy to economizer"),
+    ("hRet", "hRet", "economizerController", "hRet",
+     "Return air enthalpy to economizer"),
+    ("VSupAir", "VSupAir", "economizerController", "VSupAir",
+     "Supply airflow to economizer for min OA calculation"),
+    ("uFreezeStat", "uFreezeStat", "economizerController", "uFreezeStat",
+     "Freeze stat to economizer"),
+    # Output connections to system boundary
+    ("modeSelector", "yOccupied", "yOccupiedMode", "yOccupiedMode",
+     "Occupied mode to system output"),
+    ("modeSelector", "yMorningWarmup", "yMorningWarmupMode", "yMorningWarmupMode",
+     "Morning warmup mode to system output"),
+    ("modeSelector", "yNightSetback", "yNightSetbackMode", "yNightSetbackMode",
+     "Night setback mode to system output"),
+    ("modeSelector", "yUnoccupied", "yUnoccupiedMode", "yUnoccupiedMode",
+     "Unoccupied mode to system output"),
+    ("supplyFanController", "yFanSpeed", "ySupplyFanSpeed", "ySupplyFanSpeed",
+     "Supply fan speed to system output"),
+    ("supplyFanController", "yFanStatus", "ySupplyFanStatus", "ySupplyFanStatus",
+     "Supply fan status to system output"),
+    ("returnFanController", "yFanSpeed", "yReturnFanSpeed", "yReturnFanSpeed",
+     "Return fan speed to system output"),
+    ("economizerController", "yOutDamper", "yOutdoorDamper", "yOutdoorDamper",
+     "Outdoor damper position to system output"),
+    ("economizerController", "yRetDamper", "yReturnDamper", "yReturnDamper",
+     "Return damper position to system output"),
+    ("economizerController", "yRelDamper", "yReliefDamper", "yReliefDamper",
+     "Relief damper position to system output"),
+    ("economizerController", "yEconomizerActive", "yEconomizerActive", "yEconomizerActive",
+     "Economizer status to system output"),
+    ("ductPressureReset", "pDuctSet", "yDuctPressureSetpoint", "yDuctPressureSetpoint",
+     "Duct pressure setpoint to system output"),
+    ("supplyFanController", "yAlarm", "ySystemAlarm", "ySystemAlarm",
+     "Fan alarm to system alarm output"),
+)
+
+
+@functools.cache
+def _ahu_control_system_spec() -> dict[str, tuple[Any, ...]]:
+    """Static interface and topology shared by every :class:`AHUControlSystem`.
+
+    Built once on first use. Connectors and connections are frozen and shared
+    between instances; parameters are copied per instance.
+    """
+    return {
+        # System-level inputs
+        "inputs": (
+            # Schedule and occupancy
+            BooleanInput(
+                name="uOccupancySchedule",
+                description="Occupancy schedule input",
+            ),
+            RealInput(
+                name="timeOfDay",
+                quantity=Q_TIME,
+                unit=U_H,
+                description="Current time of day (0-24)",
+            ),
+            # Zone conditions
+            RealInput(
+                name="TZoneAverage",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Average zone temperature",
+            ),
+            RealInput(
+                name="TZoneSetpoint",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Zone temperature setpoint",
+            ),
+            RealInput(
+                name="uDamperPositions",
+                description="VAV box damper positions for trim/respond",
+            ),
+            # Air measurements
+            RealInput(
+                name="TOut",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Outside air temperature",
+            ),
+            RealInput(
+                name="TRet",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Return air temperature",
+            ),
+            RealInput(
+                name="TMix",
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Mixed air temperature",
+            ),
+            RealInput(
+                name="hOut",
+                quantity=Q_ENTH,
+                unit=U_JKG,
+                description="Outside air enthalpy",
+            ),
+            RealInput(
+                name="hRet",
+                quantity=Q_ENTH,
+                unit=U_JKG,
+                description="Return air enthalpy",
+            ),
+            # Pressure measurements
+            RealInput(
+                name="pDuct",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Duct static pressure measurement",
+            ),
+            RealInput(
+                name="pBldg",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Building static pressure measurement",
+            ),
+            # Airflow measurements
+            RealInput(
+                name="VSupAir",
+                quantity=Q_VFR,
+                unit=U_M3S,
+                description="Supply airflow measurement",
+            ),
+            # Safety inputs
+            BooleanInput(
+                name="uFreezeStat",
+                description="Freeze stat alarm (true = freeze condition)",
+            ),
+            BooleanInput(
+                name="uEmergencyStop",
+                description="Emergency stop (true = stop all equipment)",
+            ),
+        ),
+        # System-level outputs
+        "outputs": (
+            # Operating mode indicators
+            BooleanOutput(
+                name="yOccupiedMode",
+                description="System in occupied mode",
+            ),
+            BooleanOutput(
+                name="yMorningWarmupMode",
+                description="System in morning warmup mode",
+            ),
+            BooleanOutput(
+                name="yNightSetbackMode",
+                description="System in night setback mode",
+            ),
+            BooleanOutput(
+                name="yUnoccupiedMode",
+                description="System in unoccupied mode",
+            ),
+            # Fan commands
+            RealOutput(
+                name="ySupplyFanSpeed",
+                min=0.0,
+                max=1.0,
+                description="Supply fan VFD speed command",
+            ),
+            RealOutput(
+                name="yReturnFanSpeed",
+                min=0.0,
+                max=1.0,
+                description="Return fan VFD speed command",
+            ),
+            BooleanOutput(
+                name="ySupplyFanStatus",
+                description="Supply fan running status",
+            ),
+            # Damper commands
+            RealOutput(
+                name="yOutdoorDamper",
+                min=0.0,
+                max=1.0,
+                description="Outdoor air damper position command",
+            ),
+            RealOutput(
+                name="yReturnDamper",
+                min=0.0,
+                max=1.0,
+                description="Return air damper position command",
+            ),
+            RealOutput(
+                name="yReliefDamper",
+                min=0.0,
+                max=1.0,
+                description="Relief damper position command",
+            ),
+            # Status and diagnostics
+            BooleanOutput(
+                name="yEconomizerActive",
+                description="Economizer operating (not at minimum OA)",
+            ),
+            RealOutput(
+                name="yDuctPressureSetpoint",
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Current duct static pressure setpoint",
+            ),
+            BooleanOutput(
+                name="ySystemAlarm",
+                description="System alarm condition exists",
+            ),
+        ),
+        # System-level parameters
+        "parameters": (
+            Parameter(
+                name="TMixSetCooling",
+                type=CDLTypeEnum.REAL,
+                value=13.0,
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Mixed air temperature setpoint for cooling",
+            ),
+            Parameter(
+                name="TMixSetHeating",
+                type=CDLTypeEnum.REAL,
+                value=16.0,
+                quantity=Q_TEMP,
+                unit=U_DEGC,
+                description="Mixed air temperature setpoint for heating",
+            ),
+            Parameter(
+                name="pBldgSetpoint",
+                type=CDLTypeEnum.REAL,
+                value=12.5,
+                quantity=Q_PRESS,
+                unit=U_PA,
+                description="Building static pressure setpoint",
+            ),
+            Parameter(
+                name="enableEconomizer",
+                type=CDLTypeEnum.BOOLEAN,
+                value=True,
+                description="Enable economizer operation",
+            ),
+            Parameter(
+                name="enablePressureReset",
+                type=CDLTypeEnum.BOOLEAN,
+                value=True,
+                description="Enable duct pressure reset logic",
+            ),
+        ),
+        # Internal connections, validated in one batch
+        "connections": TypeAdapter(tuple[Connection, ...]).validate_python(
+            [dict(zip(_CONNECTION_FIELDS, row)) for row in _CONNECTION_ROWS]
+        ),
+    }
 
 
 class AHUControlSystem(CompositeBlock):
@@ -48,8 +357,16 @@ class AHUControlSystem(CompositeBlock):
     and produces all necessary actuator commands for the AHU.
     """
 
-    def __init__(self, name: str = "AHUControlSystem", **kwargs: Any):
-        """Initialize integrated AHU control system."""
+    def __init__(self, name: str = "AHUControlSystem", *, description: str | None = None):
+        """Initialize integrated AHU control system.
+
+        Args:
+            name: Block name
+            description: Block description; defaults to a summary of the
+                integrated control sequences
+        """
+        spec = _ahu_control_system_spec()
+
         # Create child controller blocks
         mode_selector = ModeSelector(name="modeSelector")
         pressure_reset = DuctPressureReset(name="ductPressureReset")
@@ -60,208 +377,11 @@ class AHUControlSystem(CompositeBlock):
         super().__init__(
             name=name,
             block_type="AHUControlSystem",
-            description="Integrated AHU control system with mode selection, fan control, and economizer",
-            # System-level inputs
-            inputs=[
-                # Schedule and occupancy
-                BooleanInput(
-                    name="uOccupancySchedule",
-                    description="Occupancy schedule input",
-                ),
-                RealInput(
-                    name="timeOfDay",
-                    quantity="Time",
-                    unit="h",
-                    description="Current time of day (0-24)",
-                ),
-                # Zone conditions
-                RealInput(
-                    name="TZoneAverage",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Average zone temperature",
-                ),
-                RealInput(
-                    name="TZoneSetpoint",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Zone temperature setpoint",
-                ),
-                RealInput(
-                    name="uDamperPositions",
-                    description="VAV box damper positions for trim/respond",
-                ),
-                # Air measurements
-                RealInput(
-                    name="TOut",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Outside air temperature",
-                ),
-                RealInput(
-                    name="TRet",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Return air temperature",
-                ),
-                RealInput(
-                    name="TMix",
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Mixed air temperature",
-                ),
-                RealInput(
-                    name="hOut",
-                    quantity="SpecificEnthalpy",
-                    unit="J/kg",
-                    description="Outside air enthalpy",
-                ),
-                RealInput(
-                    name="hRet",
-                    quantity="SpecificEnthalpy",
-                    unit="J/kg",
-                    description="Return air enthalpy",
-                ),
-                # Pressure measurements
-                RealInput(
-                    name="pDuct",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Duct static pressure measurement",
-                ),
-                RealInput(
-                    name="pBldg",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Building static pressure measurement",
-                ),
-                # Airflow measurements
-                RealInput(
-                    name="VSupAir",
-                    quantity="VolumeFlowRate",
-                    unit="m3/s",
-                    description="Supply airflow measurement",
-                ),
-                # Safety inputs
-                BooleanInput(
-                    name="uFreezeStat",
-                    description="Freeze stat alarm (true = freeze condition)",
-                ),
-                BooleanInput(
-                    name="uEmergencyStop",
-                    description="Emergency stop (true = stop all equipment)",
-                ),
-            ],
-            # System-level outputs
-            outputs=[
-                # Operating mode indicators
-                BooleanOutput(
-                    name="yOccupiedMode",
-                    description="System in occupied mode",
-                ),
-                BooleanOutput(
-                    name="yMorningWarmupMode",
-                    description="System in morning warmup mode",
-                ),
-                BooleanOutput(
-                    name="yNightSetbackMode",
-                    description="System in night setback mode",
-                ),
-                BooleanOutput(
-                    name="yUnoccupiedMode",
-                    description="System in unoccupied mode",
-                ),
-                # Fan commands
-                RealOutput(
-                    name="ySupplyFanSpeed",
-                    min=0.0,
-                    max=1.0,
-                    description="Supply fan VFD speed command",
-                ),
-                RealOutput(
-                    name="yReturnFanSpeed",
-                    min=0.0,
-                    max=1.0,
-                    description="Return fan VFD speed command",
-                ),
-                BooleanOutput(
-                    name="ySupplyFanStatus",
-                    description="Supply fan running status",
-                ),
-                # Damper commands
-                RealOutput(
-                    name="yOutdoorDamper",
-                    min=0.0,
-                    max=1.0,
-                    description="Outdoor air damper position command",
-                ),
-                RealOutput(
-                    name="yReturnDamper",
-                    min=0.0,
-                    max=1.0,
-                    description="Return air damper position command",
-                ),
-                RealOutput(
-                    name="yReliefDamper",
-                    min=0.0,
-                    max=1.0,
-                    description="Relief damper position command",
-                ),
-                # Status and diagnostics
-                BooleanOutput(
-                    name="yEconomizerActive",
-                    description="Economizer operating (not at minimum OA)",
-                ),
-                RealOutput(
-                    name="yDuctPressureSetpoint",
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Current duct static pressure setpoint",
-                ),
-                BooleanOutput(
-                    name="ySystemAlarm",
-                    description="System alarm condition exists",
-                ),
-            ],
-            # System-level parameters
-            parameters=[
-                Parameter(
-                    name="TMixSetCooling",
-                    type=CDLTypeEnum.REAL,
-                    value=13.0,
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Mixed air temperature setpoint for cooling",
-                ),
-                Parameter(
-                    name="TMixSetHeating",
-                    type=CDLTypeEnum.REAL,
-                    value=16.0,
-                    quantity="Temperature",
-                    unit="degC",
-                    description="Mixed air temperature setpoint for heating",
-                ),
-                Parameter(
-                    name="pBldgSetpoint",
-                    type=CDLTypeEnum.REAL,
-                    value=12.5,
-                    quantity="Pressure",
-                    unit="Pa",
-                    description="Building static pressure setpoint",
-                ),
-                Parameter(
-                    name="enableEconomizer",
-                    type=CDLTypeEnum.BOOLEAN,
-                    value=True,
-                    description="Enable economizer operation",
-                ),
-                Parameter(
-                    name="enablePressureReset",
-                    type=CDLTypeEnum.BOOLEAN,
-                    value=True,
-                    description="Enable duct pressure reset logic",
-                ),
-            ],
+            description=description
+            or "Integrated AHU control system with mode selection, fan control, and economizer",
+            inputs=spec["inputs"],
+            outputs=spec["outputs"],
+            parameters=[p.model_copy() for p in spec["parameters"]],
             # Child blocks
             blocks=[
                 mode_selector,
@@ -270,259 +390,22 @@ class AHUControlSystem(CompositeBlock):
                 return_fan,
                 economizer,
             ],
-            # Internal connections
-            connections=[
-                # Mode selector connections
-                Connection(
-                    from_block="uOccupancySchedule",
-                    from_output="uOccupancySchedule",
-                    to_block="modeSelector",
-                    to_input="uOccupied",
-                    description="Pass occupancy schedule to mode selector",
-                ),
-                Connection(
-                    from_block="TZoneAverage",
-                    from_output="TZoneAverage",
-                    to_block="modeSelector",
-                    to_input="TZonAve",
-                    description="Zone temperature to mode selector",
-                ),
-                Connection(
-                    from_block="TZoneSetpoint",
-                    from_output="TZoneSetpoint",
-                    to_block="modeSelector",
-                    to_input="TZonSet",
-                    description="Zone setpoint to mode selector",
-                ),
-                Connection(
-                    from_block="TOut",
-                    from_output="TOut",
-                    to_block="modeSelector",
-                    to_input="TOut",
-                    description="Outside temperature to mode selector",
-                ),
-                Connection(
-                    from_block="timeOfDay",
-                    from_output="timeOfDay",
-                    to_block="modeSelector",
-                    to_input="timeOfDay",
-                    description="Time of day to mode selector",
-                ),
-                # Mode selector to other controllers
-                Connection(
-                    from_block="modeSelector",
-                    from_output="yOccupied",
-                    to_block="ductPressureReset",
-                    to_input="uOccupied",
-                    description="Occupied status to pressure reset",
-                ),
-                Connection(
-                    from_block="modeSelector",
-                    from_output="yOccupied",
-                    to_block="supplyFanController",
-                    to_input="uOccupied",
-                    description="Occupied status to supply fan",
-                ),
-                # Pressure reset connections
-                Connection(
-                    from_block="uDamperPositions",
-                    from_output="uDamperPositions",
-                    to_block="ductPressureReset",
-                    to_input="uDamperPositions",
-                    description="VAV damper positions to pressure reset",
-                ),
-                Connection(
-                    from_block="ductPressureReset",
-                    from_output="pDuctSet",
-                    to_block="supplyFanController",
-                    to_input="pDuctSet",
-                    description="Pressure setpoint to supply fan controller",
-                ),
-                # Supply fan connections
-                Connection(
-                    from_block="pDuct",
-                    from_output="pDuct",
-                    to_block="supplyFanController",
-                    to_input="pDuct",
-                    description="Duct pressure measurement to supply fan controller",
-                ),
-                # Return fan connections
-                Connection(
-                    from_block="VSupAir",
-                    from_output="VSupAir",
-                    to_block="returnFanController",
-                    to_input="VSupAir",
-                    description="Supply airflow to return fan controller",
-                ),
-                Connection(
-                    from_block="pBldg",
-                    from_output="pBldg",
-                    to_block="returnFanController",
-                    to_input="pBldg",
-                    description="Building pressure to return fan controller",
-                ),
-                # Economizer connections
-                Connection(
-                    from_block="TMix",
-                    from_output="TMix",
-                    to_block="economizerController",
-                    to_input="TMix",
-                    description="Mixed air temperature to economizer",
-                ),
-                Connection(
-                    from_block="TOut",
-                    from_output="TOut",
-                    to_block="economizerController",
-                    to_input="TOut",
-                    description="Outside air temperature to economizer",
-                ),
-                Connection(
-                    from_block="TRet",
-                    from_output="TRet",
-                    to_block="economizerController",
-                    to_input="TRet",
-                    description="Return air temperature to economizer",
-                ),
-                Connection(
-                    from_block="hOut",
-                    from_output="hOut",
-                    to_block="economizerController",
-                    to_input="hOut",
-                    description="Outside air enthalpy to economizer",
-                ),
-                Connection(
-                    from_block="hRet",
-                    from_output="hRet",
-                    to_block="economizerController",
-                    to_input="hRet",
-                    description="Return air enthalpy to economizer",
-                ),
-                Connection(
-                    from_block="VSupAir",
-                    from_output="VSupAir",
-                    to_block="economizerController",
-                    to_input="VSupAir",
-                    description="Supply airflow to economizer for min OA calculation",
-                ),
-                Connection(
-                    from_block="uFreezeStat",
-                    from_output="uFreezeStat",
-                    to_block="economizerController",
-                    to_input="uFreezeStat",
-                    description="Freeze stat to economizer",
-                ),
-                # Output connections to system boundary
-                Connection(
-                    from_block="modeSelector",
-                    from_output="yOccupied",
-                    to_block="yOccupiedMode",
-                    to_input="yOccupiedMode",
-                    description="Occupied mode to system output",
-                ),
-                Connection(
-                    from_block="modeSelector",
-                    from_output="yMorningWarmup",
-                    to_block="yMorningWarmupMode",
-                    to_input="yMorningWarmupMode",
-                    description="Morning warmup mode to system output",
-                ),
-                Connection(
-                    from_block="modeSelector",
-                    from_output="yNightSetback",
-                    to_block="yNightSetbackMode",
-                    to_input="yNightSetbackMode",
-                    description="Night setback mode to system output",
-                ),
-                Connection(
-                    from_block="modeSelector",
-                    from_output="yUnoccupied",
-                    to_block="yUnoccupiedMode",
-                    to_input="yUnoccupiedMode",
-                    description="Unoccupied mode to system output",
-                ),
-                Connection(
-                    from_block="supplyFanController",
-                    from_output="yFanSpeed",
-                    to_block="ySupplyFanSpeed",
-                    to_input="ySupplyFanSpeed",
-                    description="Supply fan speed to system output",
-                ),
-                Connection(
-                    from_block="supplyFanController",
-                    from_output="yFanStatus",
-                    to_block="ySupplyFanStatus",
-                    to_input="ySupplyFanStatus",
-                    description="Supply fan status to system output",
-                ),
-                Connection(
-                    from_block="returnFanController",
-                    from_output="yFanSpeed",
-                    to_block="yReturnFanSpeed",
-                    to_input="yReturnFanSpeed",
-                    description="Return fan speed to system output",
-                ),
-                Connection(
-                    from_block="economizerController",
-                    from_output="yOutDamper",
-                    to_block="yOutdoorDamper",
-                    to_input="yOutdoorDamper",
-                    description="Outdoor damper position to system output",
-                ),
-                Connection(
-                    from_block="economizerController",
-                    from_output="yRetDamper",
-                    to_block="yReturnDamper",
-                    to_input="yReturnDamper",
-                    description="Return damper position to system output",
-                ),
-                Connection(
-                    from_block="economizerController",
-                    from_output="yRelDamper",
-                    to_block="yReliefDamper",
-                    to_input="yReliefDamper",
-                    description="Relief damper position to system output",
-                ),
-                Connection(
-                    from_block="economizerController",
-                    from_output="yEconomizerActive",
-                    to_block="yEconomizerActive",
-                    to_input="yEconomizerActive",
-                    description="Economizer status to system output",
-                ),
-                Connection(
-                    from_block="ductPressureReset",
-                    from_output="pDuctSet",
-                    to_block="yDuctPressureSetpoint",
-                    to_input="yDuctPressureSetpoint",
-                    description="Duct pressure setpoint to system output",
-                ),
-                Connection(
-                    from_block="supplyFanController",
-                    from_output="yAlarm",
-                    to_block="ySystemAlarm",
-                    to_input="ySystemAlarm",
-                    description="Fan alarm to system alarm output",
-                ),
-            ],
-            **kwargs,
+            connections=spec["connections"],
         )
 
 
-class CoordinationLogic:
-    """Coordination logic and operational notes for the AHU control system.
-
-    This class documents the control coordination strategy and operational behavior.
-    It does not contain executable code but serves as documentation.
-    """
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dictionaries in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
 
-    @staticmethod
-    def get_operational_notes() -> dict[str, str]:
-        """Return operational notes for each control sequence.
 
-        Returns:
-            Dictionary mapping control function to operational notes
-        """
-        return {
+@functools.cache
+def _operational_notes() -> Mapping[str, str]:
+    """Operational notes per control sequence, built on first request."""
+    return MappingProxyType(
+        {
             "mode_selection": """
             Mode Selector Finite State Machine:
 
@@ -668,15 +551,14 @@ class CoordinationLogic:
             - Immediate: Close OA damper, open return damper
             """,
         }
+    )
 
-    @staticmethod
-    def get_tuning_parameters() -> dict[str, dict[str, Any]]:
-        """Return recommended tuning parameters for different system types.
 
-        Returns:
-            Dictionary mapping system type to tuning parameters
-        """
-        return {
+@functools.cache
+def _tuning_parameters() -> Mapping[str, Mapping[str, Any]]:
+    """Recommended tuning parameters per system type, built on first request."""
+    return _freeze(
+        {
             "small_system": {
                 "description": "Single-zone or small VAV (< 10,000 CFM)",
                 "supply_fan": {"kp": 0.8, "Ti": 45.0, "spdMin": 0.4},
@@ -706,3 +588,30 @@ class CoordinationLogic:
                 },
             },
         }
+    )
+
+
+class CoordinationLogic:
+    """Coordination logic and operational notes for the AHU control system.
+
+    This class documents the control coordination strategy and operational behavior.
+    It does not contain executable code but serves as documentation.
+    """
+
+    @staticmethod
+    def get_operational_notes() -> Mapping[str, str]:
+        """Return operational notes for each control sequence.
+
+        Returns:
+            Read-only mapping of control function to operational notes
+        """
+        return _operational_notes()
+
+    @staticmethod
+    def get_tuning_parameters() -> Mapping[str, Mapping[str, Any]]:
+        """Return recommended tuning parameters for different system types.
+
+        Returns:
+            Read-only mapping of system type to tuning parameters
+        """
+        return _tuning_parameters()
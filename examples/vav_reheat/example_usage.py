@@ -7,51 +7,94 @@ This script demonstrates:
 4. Generating CDL block representations
 """
 
-import json
-from typing import Dict
-
-from .zone_controller import VAVBoxController, create_vav_controller_block
-from .zone_models import ZoneState, ZoneType, get_zone_config
-
-
-def simulate_zone_controllers():
-    """Simulate VAV box controllers for all 5 zones."""
+import functools
+import sys
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+
+from python_cdl.models.blocks import CompositeBlock
+
+from .zone_controller import (
+    VAVBoxBatchController,
+    VAVBoxController,
+    create_vav_controller_block,
+)
+from .zone_models import ZoneBatch, ZoneState, ZoneType, get_zone_config
+
+# Zone types in simulation order, materialized once
+_ZONES: tuple[ZoneType, ...] = tuple(ZoneType)
+
+# Operating mode labels, indexed by the mode codes from np.select below
+_MODE_NAMES = ("COOLING", "HEATING", "DEADBAND")
+
+# Header and row layout of the per-step simulation table
+_TABLE_HEADER = (
+    f"{'Zone':<12} | {'Temp':<8} | {'Damper':<8} | {'Reheat':<8} | {'Airflow':<10} | {'Mode':<10}\n"
+    + "-" * 80
+)
+_ROW_FMT = "{:<12} | {:6.2f}°C | {:6.2%} | {:6.2%} | {:7.3f} m³/s | {:<10}".format
+
+# Per-zone block of the end-of-simulation summary
+_SUMMARY_FMT = (
+    "\n{zone} Zone:\n"
+    "  Temperature:           {temp:6.2f}°C\n"
+    "  Cooling Setpoint:      {cooling_sp:6.2f}°C\n"
+    "  Heating Setpoint:      {heating_sp:6.2f}°C\n"
+    "  Damper Position:       {damper:6.2%}\n"
+    "  Reheat Valve:          {reheat:6.2%}\n"
+    "  Airflow:               {airflow:6.3f} m³/s\n"
+    "  Cooling Demand:        {cooling_demand:6.2%}\n"
+    "  Heating Demand:        {heating_demand:6.2%}"
+).format
+
+
+class _Scenario(NamedTuple):
+    """Control mode demonstration scenario."""
+
+    name: str
+    room_temp: float
+    supply_temp: float
+    expected_mode: str
+
+
+def simulate_zone_controllers() -> tuple[ZoneBatch, VAVBoxBatchController]:
+    """Simulate VAV box controllers for all 5 zones.
+
+    Returns:
+        Tuple of (final zone states, batch controller), both indexed in
+        ``ZoneType`` order; use ``ZoneBatch.state(i)`` for a single zone's
+        ``ZoneState``
+    """
 
     print("=" * 80)
     print("VAV Box Controller Simulation - 5 Zone Building")
     print("=" * 80)
     print()
 
-    # Initialize controllers for all zones
-    zones = {}
-    controllers = {}
-
-    for zone_type in ZoneType:
-        config = get_zone_config(zone_type)
-        controllers[zone_type] = VAVBoxController(config)
-
-        # Initialize zone state with varying temperatures
-        if zone_type == ZoneType.CORRIDOR:
-            initial_temp = 23.5  # Comfortable interior zone
-        elif zone_type == ZoneType.SOUTH:
-            initial_temp = 26.5  # Hot due to solar gain
-        elif zone_type == ZoneType.NORTH:
-            initial_temp = 22.0  # Cooler, less solar
-        elif zone_type == ZoneType.EAST:
-            initial_temp = 25.0  # Morning sun
-        else:  # WEST
-            initial_temp = 25.5  # Afternoon sun
-
-        zones[zone_type] = ZoneState(
-            room_temp=initial_temp,
+    # Initialize zone states with varying temperatures
+    initial_temps = {
+        ZoneType.CORRIDOR: 23.5,  # Comfortable interior zone
+        ZoneType.SOUTH: 26.5,  # Hot due to solar gain
+        ZoneType.NORTH: 22.0,  # Cooler, less solar
+        ZoneType.EAST: 25.0,  # Morning sun
+        ZoneType.WEST: 25.5,  # Afternoon sun
+    }
+    controllers = VAVBoxBatchController([get_zone_config(z) for z in _ZONES])
+    zones = ZoneBatch.from_states([
+        ZoneState(
+            room_temp=initial_temps[zone_type],
             supply_air_temp=13.0,  # Typical supply air temp
         )
+        for zone_type in _ZONES
+    ])
 
     print("Initial Zone Conditions:")
     print("-" * 80)
-    for zone_type, state in zones.items():
-        config = controllers[zone_type].config
-        print(f"{zone_type.value.upper():12s} | Temp: {state.room_temp:5.1f}°C | "
+    for i, zone_type in enumerate(_ZONES):
+        config = controllers.configs[i]
+        print(f"{zone_type.value.upper():12s} | Temp: {zones.room_temp[i]:5.1f}°C | "
               f"Cooling SP: {config.cooling_setpoint:5.1f}°C | "
               f"Heating SP: {config.heating_setpoint:5.1f}°C")
     print()
@@ -63,81 +106,105 @@ def simulate_zone_controllers():
     dt = 1.0  # 1 second time step
     num_steps = 10
 
+    # Mode thresholds are loop-invariant
+    cooling_threshold = controllers.cooling_setpoint + controllers.deadband
+    heating_threshold = controllers.heating_setpoint
+
     for step in range(num_steps):
-        print(f"\nTime = {step} seconds:")
-        print(f"{'Zone':<12} | {'Temp':<8} | {'Damper':<8} | {'Reheat':<8} | {'Airflow':<10} | {'Mode':<10}")
-        print("-" * 80)
-
-        for zone_type in ZoneType:
-            controller = controllers[zone_type]
-            state = zones[zone_type]
-            config = controller.config
-
-            # Update zone state with controller
-            state = controller.update_state(state, dt=dt)
-            zones[zone_type] = state
-
-            # Determine operating mode
-            if state.room_temp > config.cooling_setpoint + config.deadband:
-                mode = "COOLING"
-            elif state.room_temp < config.heating_setpoint:
-                mode = "HEATING"
-            else:
-                mode = "DEADBAND"
-
-            print(f"{zone_type.value:<12} | {state.room_temp:6.2f}°C | "
-                  f"{state.damper_position:6.2%} | {state.reheat_valve_position:6.2%} | "
-                  f"{state.airflow:7.3f} m³/s | {mode:<10}")
-
-            # Simulate simple temperature response
-            # (In real system, this would be based on thermal model)
-            if state.damper_position > 0.3:
-                # Cooling effect from increased airflow
-                state.room_temp -= 0.05 * state.damper_position
-            if state.reheat_valve_position > 0.1:
-                # Heating effect from reheat coil
-                state.room_temp += 0.03 * state.reheat_valve_position
+        # Collect the step's table and write it in one call
+        lines = [f"\nTime = {step} seconds:", _TABLE_HEADER]
+
+        # Update all zone states with the controllers
+        controllers.update_state(zones, dt=dt)
+
+        # Determine operating modes
+        temps = zones.room_temp
+        modes = np.select(
+            [temps > cooling_threshold, temps < heating_threshold], [0, 1], default=2
+        )
+
+        for i, zone_type in enumerate(_ZONES):
+            lines.append(_ROW_FMT(
+                zone_type.value,
+                temps[i],
+                zones.damper_position[i],
+                zones.reheat_valve_position[i],
+                zones.airflow[i],
+                _MODE_NAMES[modes[i]],
+            ))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+        # Simulate simple temperature response
+        # (In real system, this would be based on thermal model)
+        dampers = zones.damper_position
+        reheats = zones.reheat_valve_position
+        # Cooling effect from increased airflow
+        temps = temps - np.where(dampers > 0.3, 0.05 * dampers, 0.0)
+        # Heating effect from reheat coil
+        zones.room_temp = temps + np.where(reheats > 0.1, 0.03 * reheats, 0.0)
 
     print("\n" + "=" * 80)
     print("Control Summary After 10 Seconds:")
     print("=" * 80)
 
-    for zone_type in ZoneType:
-        state = zones[zone_type]
-        config = controllers[zone_type].config
-
-        print(f"\n{zone_type.value.upper()} Zone:")
-        print(f"  Temperature:           {state.room_temp:6.2f}°C")
-        print(f"  Cooling Setpoint:      {config.cooling_setpoint:6.2f}°C")
-        print(f"  Heating Setpoint:      {config.heating_setpoint:6.2f}°C")
-        print(f"  Damper Position:       {state.damper_position:6.2%}")
-        print(f"  Reheat Valve:          {state.reheat_valve_position:6.2%}")
-        print(f"  Airflow:               {state.airflow:6.3f} m³/s")
-        print(f"  Cooling Demand:        {state.cooling_demand:6.2%}")
-        print(f"  Heating Demand:        {state.heating_demand:6.2%}")
+    for i, zone_type in enumerate(_ZONES):
+        state = zones.state(i)
+        config = controllers.configs[i]
+
+        print(_SUMMARY_FMT(
+            zone=zone_type.value.upper(),
+            temp=state.room_temp,
+            cooling_sp=config.cooling_setpoint,
+            heating_sp=config.heating_setpoint,
+            damper=state.damper_position,
+            reheat=state.reheat_valve_position,
+            airflow=state.airflow,
+            cooling_demand=state.cooling_demand,
+            heating_demand=state.heating_demand,
+        ))
 
     return zones, controllers
 
 
-def generate_cdl_blocks():
-    """Generate CDL block representations for all zone controllers."""
+@functools.cache
+def _controller_block(
+    zone_type: ZoneType, indent: int | None
+) -> tuple[CompositeBlock, str]:
+    """Build and serialize the CDL block for a zone type's default config.
+
+    Cached per zone type and indent, so the default zone configurations must
+    not be modified once blocks have been generated.
+    """
+    block = create_vav_controller_block(get_zone_config(zone_type))
+    return block, block.model_dump_json(indent=indent)
+
+
+def generate_cdl_blocks(
+    output_dir: Path = Path(__file__).parent,
+    indent: int | None = 2,
+):
+    """Generate CDL block representations for all zone controllers.
+
+    Args:
+        output_dir: Directory to write the JSON files to (default: this
+            example's directory)
+        indent: JSON indentation, or None for compact output (default: 2)
+    """
 
     print("\n" + "=" * 80)
     print("Generating CDL Block Representations")
     print("=" * 80)
     print()
 
-    for zone_type in ZoneType:
-        config = get_zone_config(zone_type)
-        block = create_vav_controller_block(config)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Convert to JSON for inspection
-        block_dict = block.model_dump()
+    for zone_type in _ZONES:
+        block, serialized = _controller_block(zone_type, indent)
 
         # Save to file
-        output_file = f"/Users/acedrew/aceiot-projects/python-cdl/examples/vav_reheat/{zone_type.value}_controller.json"
-        with open(output_file, 'w') as f:
-            json.dump(block_dict, f, indent=2)
+        output_file = output_dir / f"{zone_type.value}_controller.json"
+        output_file.write_text(serialized, encoding="utf-8")
 
         print(f"Generated CDL block for {zone_type.value.upper()} zone:")
         print(f"  Name: {block.name}")
@@ -160,44 +227,40 @@ def demonstrate_control_modes():
     controller = VAVBoxController(config)
 
     # Test scenarios
-    scenarios = [
-        {
-            "name": "Hot Room - Cooling Mode",
-            "room_temp": 27.0,
-            "supply_temp": 13.0,
-            "expected_mode": "Cooling (high damper, no reheat)"
-        },
-        {
-            "name": "Comfortable - Deadband Mode",
-            "room_temp": 23.0,
-            "supply_temp": 13.0,
-            "expected_mode": "Deadband (min airflow, minimal reheat)"
-        },
-        {
-            "name": "Cold Room - Heating Mode",
-            "room_temp": 19.0,
-            "supply_temp": 13.0,
-            "expected_mode": "Heating (min airflow, active reheat)"
-        },
-    ]
-
-    for scenario in scenarios:
-        print(f"\n{scenario['name']}:")
-        print(f"  Room Temperature: {scenario['room_temp']}°C")
-        print(f"  Supply Air Temperature: {scenario['supply_temp']}°C")
-        print(f"  Expected: {scenario['expected_mode']}")
+    scenarios = (
+        _Scenario(
+            name="Hot Room - Cooling Mode",
+            room_temp=27.0,
+            supply_temp=13.0,
+            expected_mode="Cooling (high damper, no reheat)",
+        ),
+        _Scenario(
+            name="Comfortable - Deadband Mode",
+            room_temp=23.0,
+            supply_temp=13.0,
+            expected_mode="Deadband (min airflow, minimal reheat)",
+        ),
+        _Scenario(
+            name="Cold Room - Heating Mode",
+            room_temp=19.0,
+            supply_temp=13.0,
+            expected_mode="Heating (min airflow, active reheat)",
+        ),
+    )
+
+    for name, room_temp, supply_temp, expected_mode in scenarios:
+        print(f"\n{name}:")
+        print(f"  Room Temperature: {room_temp}°C")
+        print(f"  Supply Air Temperature: {supply_temp}°C")
+        print(f"  Expected: {expected_mode}")
 
         # Reset controller for clean test
         controller.reset()
 
         # Run for a few steps to see response
-        state = ZoneState(
-            room_temp=scenario['room_temp'],
-            supply_air_temp=scenario['supply_temp']
-        )
+        state = ZoneState(room_temp=room_temp, supply_air_temp=supply_temp)
 
-        for i in range(5):
-            state = controller.update_state(state, dt=1.0)
+        state = controller.run(state, dt=1.0, n_steps=5)
 
         print(f"  Actual Results (after 5 seconds):")
         print(f"    Damper Position: {state.damper_position:6.2%}")
@@ -18,7 +18,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict
 
 # Import Python CDL library
 import sys
@@ -27,7 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 from python_cdl import CDLParser, ExecutionContext, BlockValidator
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneState:
     """State of a single zone."""
     name: str
@@ -38,7 +38,7 @@ class ZoneState:
     reheat_valve: float  # 0-1
 
 
-@dataclass
+@dataclass(slots=True)
 class AHUState:
     """State of the Air Handling Unit."""
     outdoor_temp: float  # K
@@ -55,6 +55,19 @@ class AHUState:
     occupied: bool
 
 
+# Series recorded by VAVSystem.log_data
+_AHU_HISTORY_SERIES = (
+    'time',
+    'ahu_outdoor_temp',
+    'ahu_supply_temp',
+    'ahu_fan_speed',
+    'ahu_oa_damper',
+    'ahu_cooling_valve',
+    'ahu_heating_valve',
+)
+_ZONE_HISTORY_SERIES = ('temp', 'setpoint', 'airflow', 'reheat')
+
+
 class VAVSystem:
     """Complete VAV system with AHU and multiple zones."""
 
@@ -85,17 +98,13 @@ class VAVSystem:
             occupied=False
         )
 
-        self.zone_states = [
-            ZoneState(
-                name=f"Zone{i+1}",
-                temperature=291.15,  # 18°C
-                setpoint=294.15,  # 21°C
-                airflow=0.10,  # m3/s
-                damper_position=0.5,
-                reheat_valve=0.0
-            )
-            for i in range(num_zones)
-        ]
+        # Zone states, held as one array per quantity (element i is zone i)
+        self.zone_names = [f"Zone{i+1}" for i in range(num_zones)]
+        self.zone_temperature = np.full(num_zones, 291.15)  # K (18°C)
+        self.zone_setpoint = np.full(num_zones, 294.15)  # K (21°C)
+        self.zone_airflow = np.full(num_zones, 0.10)  # m3/s
+        self.zone_damper_position = np.full(num_zones, 0.5)  # 0-1
+        self.zone_reheat_valve = np.zeros(num_zones)  # 0-1
 
         # Simulation parameters
         self.time_step = 300.0  # 5 minutes in seconds
@@ -109,22 +118,69 @@ class VAVSystem:
         self.air_specific_heat = 1005.0  # J/(kg·K)
         self.reheat_capacity = 5000.0  # W per zone
 
-        # Data logging
-        self.history: Dict[str, List[Any]] = {
-            'time': [],
-            'ahu_outdoor_temp': [],
-            'ahu_supply_temp': [],
-            'ahu_fan_speed': [],
-            'ahu_oa_damper': [],
-            'ahu_cooling_valve': [],
-            'ahu_heating_valve': [],
-        }
-
-        for i in range(num_zones):
-            self.history[f'zone{i+1}_temp'] = []
-            self.history[f'zone{i+1}_setpoint'] = []
-            self.history[f'zone{i+1}_airflow'] = []
-            self.history[f'zone{i+1}_reheat'] = []
+        # Data logging, into preallocated buffers: one row per logged step,
+        # with one column per zone for the zone series
+        self._history_len = 0
+        self._history_buffers: Dict[str, np.ndarray] = {}
+        self._reserve_history(0)
+
+    @property
+    def history(self) -> Dict[str, np.ndarray]:
+        """Logged series, keyed by name, trimmed to the steps logged so far."""
+        n = self._history_len
+        buffers = self._history_buffers
+        history = {name: buffers[name][:n] for name in _AHU_HISTORY_SERIES}
+        for i in range(self.num_zones):
+            for series in _ZONE_HISTORY_SERIES:
+                history[f'zone{i+1}_{series}'] = buffers[f'zone_{series}'][:n, i]
+        return history
+
+    def _reserve_history(self, num_steps: int):
+        """Make room in the history buffers for more logged steps.
+
+        Args:
+            num_steps: Number of steps to make room for
+        """
+        capacity = self._history_len + num_steps
+        buffers = self._history_buffers
+        if buffers and len(buffers['time']) >= capacity:
+            return
+
+        n = self._history_len
+        for name in _AHU_HISTORY_SERIES:
+            buffer = np.empty(capacity)
+            if name in buffers:
+                buffer[:n] = buffers[name][:n]
+            buffers[name] = buffer
+        for series in _ZONE_HISTORY_SERIES:
+            name = f'zone_{series}'
+            buffer = np.empty((capacity, self.num_zones))
+            if name in buffers:
+                buffer[:n] = buffers[name][:n]
+            buffers[name] = buffer
+
+    @property
+    def zone_states(self) -> List[ZoneState]:
+        """Snapshot of each zone's current state.
+
+        Zone state is stored in per-field arrays (``zone_temperature``,
+        ``zone_setpoint``, ``zone_airflow``, ``zone_damper_position`` and
+        ``zone_reheat_valve``), so this builds new ``ZoneState`` copies on
+        every access. Modifying a returned state has no effect on the
+        simulation; write to the arrays instead, e.g.
+        ``vav.zone_temperature[0] = 295.15``.
+        """
+        return [
+            ZoneState(
+                name=self.zone_names[i],
+                temperature=float(self.zone_temperature[i]),
+                setpoint=float(self.zone_setpoint[i]),
+                airflow=float(self.zone_airflow[i]),
+                damper_position=float(self.zone_damper_position[i]),
+                reheat_valve=float(self.zone_reheat_valve[i]),
+            )
+            for i in range(self.num_zones)
+        ]
 
     def _load_controllers(self):
         """Load CDL controller definitions."""
@@ -167,13 +223,13 @@ class VAVSystem:
         """Get occupancy status based on time of day.
 
         Args:
-            hour: Hour of day (0-24)
+            hour: Hour of day (0-24), or an array of hours
 
         Returns:
-            True if occupied, False if unoccupied
+            True if occupied, False if unoccupied (elementwise for arrays)
         """
         # Occupied 7 AM to 6 PM on weekdays
-        return 7 <= hour < 18
+        return (hour >= 7) & (hour < 18)
 
     def get_zone_setpoint(self, hour: float, occupied: bool) -> float:
         """Get zone temperature setpoint.
@@ -196,10 +252,10 @@ class VAVSystem:
         Simulates a sinusoidal daily temperature variation.
 
         Args:
-            hour: Hour of day (0-24)
+            hour: Hour of day (0-24), or an array of hours
 
         Returns:
-            Outdoor temperature in Kelvin
+            Outdoor temperature in Kelvin (elementwise for arrays)
         """
         # Daily variation: min at 6 AM, max at 3 PM
         t_min = 278.15  # 5°C minimum
@@ -236,7 +292,7 @@ class VAVSystem:
         if fan_speed is None:
             # Simple PI control for fan speed
             dp_error = self.ahu_state.duct_pressure_setpoint - self.ahu_state.duct_pressure
-            fan_speed = np.clip(0.5 + 0.001 * dp_error, 0.2, 1.0)
+            fan_speed = min(1.0, max(0.2, 0.5 + 0.001 * dp_error))
 
         oa_damper = self.ahu_context.get_output("yOutDam")
         if oa_damper is None:
@@ -252,13 +308,13 @@ class VAVSystem:
         if cooling_valve is None:
             # Simple cooling control
             temp_error = self.ahu_state.supply_temp - self.ahu_state.supply_temp_setpoint
-            cooling_valve = np.clip(0.1 * temp_error, 0.0, 1.0)
+            cooling_valve = min(1.0, max(0.0, 0.1 * temp_error))
 
         heating_valve = self.ahu_context.get_output("yHeaCoil")
         if heating_valve is None:
             # Simple heating control
             temp_error = self.ahu_state.supply_temp_setpoint - self.ahu_state.supply_temp
-            heating_valve = np.clip(0.1 * temp_error, 0.0, 1.0)
+            heating_valve = min(1.0, max(0.0, 0.1 * temp_error))
 
         # Update AHU state
         self.ahu_state.fan_speed = float(fan_speed)
@@ -277,12 +333,13 @@ class VAVSystem:
         Args:
             zone_idx: Zone index (0-based)
         """
-        zone = self.zone_states[zone_idx]
+        temperature = float(self.zone_temperature[zone_idx])
+        setpoint = float(self.zone_setpoint[zone_idx])
         ctx = self.zone_contexts[zone_idx]
 
         # Set zone inputs
-        ctx.set_input("TZon", zone.temperature)
-        ctx.set_input("TZonSet", zone.setpoint)
+        ctx.set_input("TZon", temperature)
+        ctx.set_input("TZonSet", setpoint)
         ctx.set_input("TSup", self.ahu_state.supply_temp)
         ctx.set_input("VDis_flow_min", 0.05)  # 50 L/s minimum
         ctx.set_input("VDis_flow_max", 0.20)  # 200 L/s maximum
@@ -294,7 +351,7 @@ class VAVSystem:
         airflow = ctx.get_output("VDis_flow")
         if airflow is None:
             # Simple airflow control based on temperature error
-            temp_error = zone.temperature - zone.setpoint
+            temp_error = temperature - setpoint
             if temp_error > 0.5:  # Cooling needed
                 airflow = 0.05 + (0.15 * min(temp_error / 2.0, 1.0))
             else:
@@ -307,16 +364,16 @@ class VAVSystem:
         reheat_valve = ctx.get_output("yVal")
         if reheat_valve is None:
             # Simple reheat control
-            temp_error = zone.setpoint - zone.temperature
+            temp_error = setpoint - temperature
             if temp_error > 0.5 and airflow <= 0.06:  # Heating needed, at minimum airflow
-                reheat_valve = np.clip(0.5 * temp_error, 0.0, 1.0)
+                reheat_valve = min(1.0, max(0.0, 0.5 * temp_error))
             else:
                 reheat_valve = 0.0
 
         # Update zone state
-        zone.airflow = float(airflow)
-        zone.damper_position = float(np.clip(damper, 0.0, 1.0))
-        zone.reheat_valve = float(reheat_valve)
+        self.zone_airflow[zone_idx] = float(airflow)
+        self.zone_damper_position[zone_idx] = float(min(1.0, max(0.0, damper)))
+        self.zone_reheat_valve[zone_idx] = float(reheat_valve)
 
     def simulate_ahu_physics(self, dt: float):
         """Simulate AHU physics (simplified).
@@ -329,7 +386,7 @@ class VAVSystem:
         ra_fraction = self.ahu_state.ra_damper
 
         # Average zone temperature for return air
-        avg_zone_temp = np.mean([z.temperature for z in self.zone_states])
+        avg_zone_temp = self.zone_temperature.mean()
 
         self.ahu_state.mixed_temp = (
             oa_fraction * self.ahu_state.outdoor_temp +
@@ -352,34 +409,33 @@ class VAVSystem:
         self.ahu_state.supply_temp += alpha * (target_supply_temp - self.ahu_state.supply_temp)
 
         # Duct pressure based on fan speed and total airflow
-        total_airflow = sum(z.airflow for z in self.zone_states)
+        total_airflow = self.zone_airflow.sum()
         pressure_from_flow = 200.0 * total_airflow  # Simplified
         pressure_from_fan = 700.0 * self.ahu_state.fan_speed
 
         target_pressure = pressure_from_fan - pressure_from_flow
         self.ahu_state.duct_pressure += alpha * (target_pressure - self.ahu_state.duct_pressure)
 
-    def simulate_zone_physics(self, zone_idx: int, dt: float):
-        """Simulate zone thermal physics (simplified).
+    def simulate_zone_physics(self, dt: float):
+        """Simulate zone thermal physics (simplified) for all zones at once.
 
         Args:
-            zone_idx: Zone index
             dt: Time step in seconds
         """
-        zone = self.zone_states[zone_idx]
+        temperature = self.zone_temperature
 
         # Heat from supply air
-        mass_flow = zone.airflow * self.air_density  # kg/s
+        mass_flow = self.zone_airflow * self.air_density  # kg/s
         q_supply = mass_flow * self.air_specific_heat * (
-            self.ahu_state.supply_temp - zone.temperature
+            self.ahu_state.supply_temp - temperature
         )
 
         # Heat from reheat coil
-        q_reheat = self.reheat_capacity * zone.reheat_valve
+        q_reheat = self.reheat_capacity * self.zone_reheat_valve
 
         # Heat loss to outdoor through envelope
         q_envelope = -self.zone_area * self.u_value * (
-            zone.temperature - self.ahu_state.outdoor_temp
+            temperature - self.ahu_state.outdoor_temp
         )
 
         # Internal gains (occupancy, equipment, lighting)
@@ -393,20 +449,34 @@ class VAVSystem:
         zone_thermal_mass = zone_mass * self.air_specific_heat
 
         dT = (q_total * dt) / zone_thermal_mass
-        zone.temperature += dT
+        self.zone_temperature += dT
 
     def step(self):
         """Execute one simulation time step."""
         # Get current hour for scheduling
         hour = (self.current_time / 3600.0) % 24
 
+        occupied = self.get_occupancy_schedule(hour)
+        self._advance(
+            occupied,
+            self.get_zone_setpoint(hour, occupied),
+            self.get_outdoor_temperature(hour),
+        )
+
+    def _advance(self, occupied: bool, setpoint: float, outdoor_temp: float):
+        """Execute one simulation time step from already scheduled conditions.
+
+        Args:
+            occupied: Occupancy status for this step
+            setpoint: Zone temperature setpoint in Kelvin
+            outdoor_temp: Outdoor temperature in Kelvin
+        """
         # Update occupancy and setpoints
-        self.ahu_state.occupied = self.get_occupancy_schedule(hour)
-        for zone in self.zone_states:
-            zone.setpoint = self.get_zone_setpoint(hour, self.ahu_state.occupied)
+        self.ahu_state.occupied = occupied
+        self.zone_setpoint[:] = setpoint
 
         # Update outdoor conditions
-        self.ahu_state.outdoor_temp = self.get_outdoor_temperature(hour)
+        self.ahu_state.outdoor_temp = outdoor_temp
 
         # Execute control sequences
         self.compute_ahu_control()
@@ -415,8 +485,7 @@ class VAVSystem:
 
         # Simulate physics
         self.simulate_ahu_physics(self.time_step)
-        for i in range(self.num_zones):
-            self.simulate_zone_physics(i, self.time_step)
+        self.simulate_zone_physics(self.time_step)
 
         # Log data
         self.log_data()
@@ -426,21 +495,26 @@ class VAVSystem:
 
     def log_data(self):
         """Log current state to history."""
-        hour = self.current_time / 3600.0
-
-        self.history['time'].append(hour)
-        self.history['ahu_outdoor_temp'].append(self.ahu_state.outdoor_temp - 273.15)  # °C
-        self.history['ahu_supply_temp'].append(self.ahu_state.supply_temp - 273.15)
-        self.history['ahu_fan_speed'].append(self.ahu_state.fan_speed * 100)  # %
-        self.history['ahu_oa_damper'].append(self.ahu_state.oa_damper * 100)
-        self.history['ahu_cooling_valve'].append(self.ahu_state.cooling_valve * 100)
-        self.history['ahu_heating_valve'].append(self.ahu_state.heating_valve * 100)
-
-        for i, zone in enumerate(self.zone_states):
-            self.history[f'zone{i+1}_temp'].append(zone.temperature - 273.15)
-            self.history[f'zone{i+1}_setpoint'].append(zone.setpoint - 273.15)
-            self.history[f'zone{i+1}_airflow'].append(zone.airflow * 1000)  # L/s
-            self.history[f'zone{i+1}_reheat'].append(zone.reheat_valve * 100)
+        idx = self._history_len
+        if idx == len(self._history_buffers['time']):
+            # Called outside run_simulation: grow geometrically
+            self._reserve_history(max(idx, 1))
+        buffers = self._history_buffers
+
+        buffers['time'][idx] = self.current_time / 3600.0
+        buffers['ahu_outdoor_temp'][idx] = self.ahu_state.outdoor_temp - 273.15  # °C
+        buffers['ahu_supply_temp'][idx] = self.ahu_state.supply_temp - 273.15
+        buffers['ahu_fan_speed'][idx] = self.ahu_state.fan_speed * 100  # %
+        buffers['ahu_oa_damper'][idx] = self.ahu_state.oa_damper * 100
+        buffers['ahu_cooling_valve'][idx] = self.ahu_state.cooling_valve * 100
+        buffers['ahu_heating_valve'][idx] = self.ahu_state.heating_valve * 100
+
+        buffers['zone_temp'][idx] = self.zone_temperature - 273.15
+        buffers['zone_setpoint'][idx] = self.zone_setpoint - 273.15
+        buffers['zone_airflow'][idx] = self.zone_airflow * 1000  # L/s
+        buffers['zone_reheat'][idx] = self.zone_reheat_valve * 100
+
+        self._history_len = idx + 1
 
     def run_simulation(self, duration_hours: float = 24.0):
         """Run simulation for specified duration.
@@ -456,18 +530,30 @@ class VAVSystem:
         print(f"Total steps: {num_steps}")
         print()
 
-        for step in range(num_steps):
-            self.step()
+        self._reserve_history(num_steps)
+
+        # Evaluate the schedules for the whole run up front
+        hours = ((self.current_time + np.arange(num_steps) * self.time_step) / 3600.0) % 24
+        occupied = self.get_occupancy_schedule(hours)
+        setpoints = np.where(
+            occupied,
+            self.get_zone_setpoint(hours, True),
+            self.get_zone_setpoint(hours, False),
+        )
+        outdoor_temps = self.get_outdoor_temperature(hours)
+        schedule = zip(occupied.tolist(), setpoints.tolist(), outdoor_temps.tolist())
+
+        for step, conditions in enumerate(schedule):
+            self._advance(*conditions)
 
             # Print progress every hour
             if step % 12 == 0:
                 hour = self.current_time / 3600.0
-                zone1 = self.zone_states[0]
                 print(f"Hour {hour:5.1f}: "
                       f"OAT={self.ahu_state.outdoor_temp-273.15:5.1f}°C  "
                       f"SAT={self.ahu_state.supply_temp-273.15:5.1f}°C  "
-                      f"Zone1={zone1.temperature-273.15:5.1f}°C (SP={zone1.setpoint-273.15:5.1f}°C)  "
-                      f"Reheat={zone1.reheat_valve*100:4.1f}%")
+                      f"Zone1={self.zone_temperature[0]-273.15:5.1f}°C (SP={self.zone_setpoint[0]-273.15:5.1f}°C)  "
+                      f"Reheat={self.zone_reheat_valve[0]*100:4.1f}%")
 
         print()
         print("Simulation complete!")
@@ -481,14 +567,15 @@ class VAVSystem:
         fig, axes = plt.subplots(4, 2, figsize=(16, 12))
         fig.suptitle('VAV System 24-Hour Simulation - ASHRAE Guideline 36', fontsize=16, fontweight='bold')
 
-        time = np.array(self.history['time'])
+        history = self.history
+        time = history['time']
 
         # Plot 1: Zone Temperatures
         ax = axes[0, 0]
         for i in range(min(3, self.num_zones)):  # Plot first 3 zones
-            ax.plot(time, self.history[f'zone{i+1}_temp'], label=f'Zone {i+1}', linewidth=2)
-            ax.plot(time, self.history[f'zone{i+1}_setpoint'], '--', alpha=0.7, linewidth=1)
-        ax.plot(time, self.history['ahu_outdoor_temp'], 'k:', label='Outdoor', linewidth=1.5)
+            ax.plot(time, history[f'zone{i+1}_temp'], label=f'Zone {i+1}', linewidth=2)
+            ax.plot(time, history[f'zone{i+1}_setpoint'], '--', alpha=0.7, linewidth=1)
+        ax.plot(time, history['ahu_outdoor_temp'], 'k:', label='Outdoor', linewidth=1.5)
         ax.set_ylabel('Temperature (°C)')
         ax.set_title('Zone Temperatures')
         ax.legend(loc='best', fontsize=8)
@@ -497,7 +584,7 @@ class VAVSystem:
 
         # Plot 2: AHU Supply Temperature
         ax = axes[0, 1]
-        ax.plot(time, self.history['ahu_supply_temp'], 'b-', label='Supply Temp', linewidth=2)
+        ax.plot(time, history['ahu_supply_temp'], 'b-', label='Supply Temp', linewidth=2)
         ax.axhline(y=13, color='r', linestyle='--', label='Setpoint (13°C)', linewidth=1)
         ax.set_ylabel('Temperature (°C)')
         ax.set_title('AHU Supply Air Temperature')
@@ -507,7 +594,7 @@ class VAVSystem:
         # Plot 3: Zone Airflows
         ax = axes[1, 0]
         for i in range(min(3, self.num_zones)):
-            ax.plot(time, self.history[f'zone{i+1}_airflow'], label=f'Zone {i+1}', linewidth=2)
+            ax.plot(time, history[f'zone{i+1}_airflow'], label=f'Zone {i+1}', linewidth=2)
         ax.set_ylabel('Airflow (L/s)')
         ax.set_title('Zone Airflow Rates')
         ax.legend(loc='best', fontsize=8)
@@ -516,7 +603,7 @@ class VAVSystem:
         # Plot 4: Reheat Valves
         ax = axes[1, 1]
         for i in range(min(3, self.num_zones)):
-            ax.plot(time, self.history[f'zone{i+1}_reheat'], label=f'Zone {i+1}', linewidth=2)
+            ax.plot(time, history[f'zone{i+1}_reheat'], label=f'Zone {i+1}', linewidth=2)
         ax.set_ylabel('Valve Position (%)')
         ax.set_title('Zone Reheat Valve Positions')
         ax.legend(loc='best', fontsize=8)
@@ -524,15 +611,15 @@ class VAVSystem:
 
         # Plot 5: AHU Fan Speed
         ax = axes[2, 0]
-        ax.plot(time, self.history['ahu_fan_speed'], 'g-', linewidth=2)
-        ax.fill_between(time, 0, self.history['ahu_fan_speed'], alpha=0.3)
+        ax.plot(time, history['ahu_fan_speed'], 'g-', linewidth=2)
+        ax.fill_between(time, 0, history['ahu_fan_speed'], alpha=0.3)
         ax.set_ylabel('Fan Speed (%)')
         ax.set_title('AHU Supply Fan Speed')
         ax.grid(True, alpha=0.3)
 
         # Plot 6: Economizer Dampers
         ax = axes[2, 1]
-        ax.plot(time, self.history['ahu_oa_damper'], 'b-', label='OA Damper', linewidth=2)
+        ax.plot(time, history['ahu_oa_damper'], 'b-', label='OA Damper', linewidth=2)
         ax.set_ylabel('Damper Position (%)')
         ax.set_title('AHU Outdoor Air Damper')
         ax.legend(loc='best')
@@ -540,8 +627,8 @@ class VAVSystem:
 
         # Plot 7: Cooling Coil
         ax = axes[3, 0]
-        ax.plot(time, self.history['ahu_cooling_valve'], 'b-', linewidth=2)
-        ax.fill_between(time, 0, self.history['ahu_cooling_valve'], alpha=0.3, color='blue')
+        ax.plot(time, history['ahu_cooling_valve'], 'b-', linewidth=2)
+        ax.fill_between(time, 0, history['ahu_cooling_valve'], alpha=0.3, color='blue')
         ax.set_ylabel('Valve Position (%)')
         ax.set_xlabel('Time (hours)')
         ax.set_title('AHU Cooling Coil Valve')
@@ -549,8 +636,8 @@ class VAVSystem:
 
         # Plot 8: Heating Coil
         ax = axes[3, 1]
-        ax.plot(time, self.history['ahu_heating_valve'], 'r-', linewidth=2)
-        ax.fill_between(time, 0, self.history['ahu_heating_valve'], alpha=0.3, color='red')
+        ax.plot(time, history['ahu_heating_valve'], 'r-', linewidth=2)
+        ax.fill_between(time, 0, history['ahu_heating_valve'], alpha=0.3, color='red')
         ax.set_ylabel('Valve Position (%)')
         ax.set_xlabel('Time (hours)')
         ax.set_title('AHU Heating Coil Valve')
@@ -571,11 +658,13 @@ class VAVSystem:
         print("VAV SYSTEM PERFORMANCE SUMMARY")
         print("="*60)
 
+        history = self.history
+
         # Zone performance
         print("\nZONE PERFORMANCE:")
         for i in range(self.num_zones):
-            temps = np.array(self.history[f'zone{i+1}_temp'])
-            setpoints = np.array(self.history[f'zone{i+1}_setpoint'])
+            temps = history[f'zone{i+1}_temp']
+            setpoints = history[f'zone{i+1}_setpoint']
             errors = np.abs(temps - setpoints)
 
             mae = np.mean(errors)
@@ -589,10 +678,10 @@ class VAVSystem:
 
         # Energy usage
         print("\nENERGY USAGE INDICATORS:")
-        avg_reheat = np.mean([np.mean(self.history[f'zone{i+1}_reheat']) for i in range(self.num_zones)])
-        avg_cooling = np.mean(self.history['ahu_cooling_valve'])
-        avg_heating = np.mean(self.history['ahu_heating_valve'])
-        avg_fan = np.mean(self.history['ahu_fan_speed'])
+        avg_reheat = np.mean([np.mean(history[f'zone{i+1}_reheat']) for i in range(self.num_zones)])
+        avg_cooling = np.mean(history['ahu_cooling_valve'])
+        avg_heating = np.mean(history['ahu_heating_valve'])
+        avg_fan = np.mean(history['ahu_fan_speed'])
 
         print(f"  Average Zone Reheat: {avg_reheat:.1f}%")
         print(f"  Average AHU Cooling: {avg_cooling:.1f}%")
@@ -600,7 +689,7 @@ class VAVSystem:
         print(f"  Average Fan Speed: {avg_fan:.1f}%")
 
         # Economizer usage
-        high_oa = np.sum(np.array(self.history['ahu_oa_damper']) > 50) / len(self.history['ahu_oa_damper']) * 100
+        high_oa = np.sum(history['ahu_oa_damper'] > 50) / len(history['ahu_oa_damper']) * 100
         print(f"  Economizer Active (OA>50%): {high_oa:.1f}% of time")
 
         print("\n" + "="*60)
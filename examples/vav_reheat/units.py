@@ -0,0 +1,22 @@
+"""Quantity and unit strings shared by the VAV reheat connectors and parameters.
+
+The strings are interned so every connector and parameter of a kind
+references the same metadata objects.
+"""
+
+import sys
+
+Q_TEMP, Q_TDIFF, Q_PRESS, Q_TIME, Q_VFR, Q_ENTH = map(
+    sys.intern,
+    (
+        "Temperature",
+        "TemperatureDifference",
+        "Pressure",
+        "Time",
+        "VolumeFlowRate",
+        "SpecificEnthalpy",
+    ),
+)
+U_DEGC, U_K, U_PA, U_S, U_H, U_M3S, U_JKG = map(
+    sys.intern, ("degC", "K", "Pa", "s", "h", "m3/s", "J/kg")
+)
@@ -18,14 +18,17 @@ Control Sequence:
    - Modulate reheat valve to maintain heating setpoint
 """
 
+from collections.abc import Sequence
 from typing import Tuple
 
+import numpy as np
+
 from python_cdl.models.blocks import CompositeBlock
 from python_cdl.models.connectors import RealInput, RealOutput
 from python_cdl.models.parameters import Parameter
 from python_cdl.models.types import CDLTypeEnum
 
-from .zone_models import ZoneConfig, ZoneState
+from .zone_models import ZoneBatch, ZoneConfig, ZoneState
 
 
 class VAVBoxController:
@@ -223,6 +226,181 @@ class VAVBoxController:
 
         return state
 
+    def run(
+        self,
+        state: ZoneState,
+        dt: float = 1.0,
+        n_steps: int = 1,
+        supply_pressure: float = 1.0,
+    ) -> ZoneState:
+        """Advance zone state through several control time steps.
+
+        Args:
+            state: Current zone state
+            dt: Time step in seconds
+            n_steps: Number of time steps to run
+            supply_pressure: Supply air pressure (normalized)
+
+        Returns:
+            Zone state after the final time step
+        """
+        update_state = self.update_state
+        for _ in range(n_steps):
+            update_state(state, dt, supply_pressure)
+
+        return state
+
+
+class VAVBoxBatchController:
+    """Array form of ``VAVBoxController`` for a group of zones.
+
+    Runs the same sequences as ``VAVBoxController`` for every zone at once:
+    the configuration is unpacked into one array per parameter and the mode
+    selection and PI updates are applied with masks, so each time step costs
+    a fixed number of array operations regardless of the zone count.
+    """
+
+    def __init__(self, configs: Sequence[ZoneConfig]):
+        """Initialize the batch controller.
+
+        Args:
+            configs: Zone configuration parameters, in zone order
+        """
+        self.configs = tuple(configs)
+
+        def column(field: str) -> np.ndarray:
+            return np.array([getattr(c, field) for c in self.configs], dtype=float)
+
+        self.cooling_setpoint = column("cooling_setpoint")
+        self.heating_setpoint = column("heating_setpoint")
+        self.min_airflow = column("min_airflow")
+        self.max_airflow = column("max_airflow")
+        self.min_damper_position = column("min_damper_position")
+        self.max_damper_position = column("max_damper_position")
+        self.deadband = column("deadband")
+        self.kp_damper = column("kp_damper")
+        self.ki_damper = column("ki_damper")
+        self.kp_reheat = column("kp_reheat")
+        self.ki_reheat = column("ki_reheat")
+        self.reset()
+
+    def reset(self):
+        """Reset controller integral terms for every zone."""
+        n_zones = len(self.configs)
+        self.damper_integral = np.zeros(n_zones)
+        self.reheat_integral = np.zeros(n_zones)
+
+    def compute_control(
+        self,
+        room_temp: np.ndarray,
+        supply_air_temp: np.ndarray,
+        dt: float = 1.0,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute damper and reheat valve positions for every zone.
+
+        Args:
+            room_temp: Current room temperatures in degC
+            supply_air_temp: Supply air temperatures in degC
+            dt: Time step in seconds (default: 1.0)
+
+        Returns:
+            Tuple of (damper_position, reheat_valve_position) arrays in range [0, 1]
+        """
+        cooling_error = room_temp - self.cooling_setpoint
+        heating_error = self.heating_setpoint - room_temp
+
+        # Same mode precedence as VAVBoxController.compute_control
+        cooling = cooling_error > self.deadband
+        in_deadband = ~cooling & (
+            (np.abs(room_temp - self.cooling_setpoint) <= self.deadband)
+            & (room_temp >= self.heating_setpoint)
+        )
+        heating = ~cooling & ~in_deadband
+        reheating = heating | (in_deadband & (room_temp < self.cooling_setpoint - 0.5))
+
+        # Damper PI loop, active in cooling mode only
+        max_integral = 1.0 - self.min_damper_position
+        damper_integral = np.clip(
+            self.damper_integral + self.ki_damper * cooling_error * dt,
+            -max_integral,
+            max_integral,
+        )
+        self.damper_integral = np.where(cooling, damper_integral, 0.0)
+        damper_position = np.where(
+            cooling,
+            np.clip(
+                self.min_damper_position + self.kp_damper * cooling_error + damper_integral,
+                self.min_damper_position,
+                self.max_damper_position,
+            ),
+            self.min_damper_position,
+        )
+
+        # Reheat PI loop, held in deadband and reset in cooling mode
+        reheat_integral = np.clip(
+            self.reheat_integral + self.ki_reheat * heating_error * dt, 0.0, 1.0
+        )
+        self.reheat_integral = np.where(
+            reheating, reheat_integral, np.where(cooling, 0.0, self.reheat_integral)
+        )
+        reheat_valve_position = np.where(
+            reheating,
+            np.clip(self.kp_reheat * heating_error + reheat_integral, 0.0, 1.0),
+            0.0,
+        )
+
+        return damper_position, reheat_valve_position
+
+    def compute_airflow(
+        self, damper_position: np.ndarray, supply_pressure: float = 1.0
+    ) -> np.ndarray:
+        """Compute airflow for every zone based on damper position.
+
+        Args:
+            damper_position: Damper positions in range [0, 1]
+            supply_pressure: Supply air pressure (normalized, default: 1.0)
+
+        Returns:
+            Airflow rates in m3/s
+        """
+        airflow_range = self.max_airflow - self.min_airflow
+        airflow = self.min_airflow + airflow_range * damper_position * supply_pressure
+
+        return np.clip(airflow, self.min_airflow, self.max_airflow)
+
+    def update_state(
+        self,
+        batch: ZoneBatch,
+        dt: float = 1.0,
+        supply_pressure: float = 1.0,
+    ) -> ZoneBatch:
+        """Update the batch of zone states based on control computations.
+
+        Args:
+            batch: Current zone states
+            dt: Time step in seconds
+            supply_pressure: Supply air pressure (normalized)
+
+        Returns:
+            Updated zone states
+        """
+        damper_pos, reheat_pos = self.compute_control(
+            room_temp=batch.room_temp,
+            supply_air_temp=batch.supply_air_temp,
+            dt=dt,
+        )
+
+        cooling_error = np.maximum(0.0, batch.room_temp - self.cooling_setpoint)
+        heating_error = np.maximum(0.0, self.heating_setpoint - batch.room_temp)
+
+        batch.damper_position = damper_pos
+        batch.reheat_valve_position = reheat_pos
+        batch.airflow = self.compute_airflow(damper_pos, supply_pressure)
+        batch.cooling_demand = np.minimum(1.0, cooling_error / 2.0)
+        batch.heating_demand = np.minimum(1.0, heating_error / 2.0)
+
+        return batch
+
 
 def create_vav_controller_block(zone_config: ZoneConfig) -> CompositeBlock:
     """Create a CDL CompositeBlock representation of the VAV controller.
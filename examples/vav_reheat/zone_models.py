@@ -4,9 +4,12 @@ This module defines the zone-specific parameters and configurations
 for a 5-zone VAV system with reheat capability.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 
 class ZoneType(str, Enum):
     """Zone types in the building."""
@@ -128,7 +131,7 @@ DEFAULT_ZONE_CONFIGS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoneState:
     """Runtime state for a VAV zone.
 
@@ -151,6 +154,69 @@ class ZoneState:
     heating_demand: float = 0.0
 
 
+@dataclass
+class ZoneBatch:
+    """Runtime state for a group of VAV zones, one array element per zone.
+
+    Mirrors ``ZoneState`` field for field, with each attribute held as a
+    float array of shape ``(n_zones,)`` so a whole building can be stepped
+    with array operations.
+    """
+
+    room_temp: np.ndarray
+    supply_air_temp: np.ndarray
+    damper_position: np.ndarray
+    reheat_valve_position: np.ndarray
+    airflow: np.ndarray
+    cooling_demand: np.ndarray
+    heating_demand: np.ndarray
+
+    @classmethod
+    def from_states(cls, states: Sequence[ZoneState]) -> "ZoneBatch":
+        """Pack a sequence of zone states into a batch.
+
+        Args:
+            states: Zone states, in zone order
+
+        Returns:
+            Batch holding a copy of the states' values
+        """
+        return cls(
+            room_temp=np.array([s.room_temp for s in states], dtype=float),
+            supply_air_temp=np.array([s.supply_air_temp for s in states], dtype=float),
+            damper_position=np.array([s.damper_position for s in states], dtype=float),
+            reheat_valve_position=np.array(
+                [s.reheat_valve_position for s in states], dtype=float
+            ),
+            airflow=np.array([s.airflow for s in states], dtype=float),
+            cooling_demand=np.array([s.cooling_demand for s in states], dtype=float),
+            heating_demand=np.array([s.heating_demand for s in states], dtype=float),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of zones in the batch."""
+        return len(self.room_temp)
+
+    def state(self, index: int) -> ZoneState:
+        """Unpack a single zone of the batch.
+
+        Args:
+            index: Position of the zone in the batch
+
+        Returns:
+            Zone state holding that zone's current values
+        """
+        return ZoneState(
+            room_temp=float(self.room_temp[index]),
+            supply_air_temp=float(self.supply_air_temp[index]),
+            damper_position=float(self.damper_position[index]),
+            reheat_valve_position=float(self.reheat_valve_position[index]),
+            airflow=float(self.airflow[index]),
+            cooling_demand=float(self.cooling_demand[index]),
+            heating_demand=float(self.heating_demand[index]),
+        )
+
+
 def get_zone_config(zone_type: ZoneType) -> ZoneConfig:
     """Get the default configuration for a zone type.
 
@@ -13,6 +13,9 @@ Key features:
 - Support for control flow (Sequence, Parallel, If, While)
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from python_cdl.models import (
     Block,
     Boolean,
@@ -43,21 +46,40 @@ from python_cdl.models import (
     StringOutput,
     WhileBlock,
 )
-from python_cdl.parser import CDLParser, load_cdl_file, parse_cdl_json
-from python_cdl.runtime import (
-    BlockExecutor,
-    ExecutionContext,
-    ExecutionEvent,
-    ExecutionResult,
-)
-from python_cdl.validators import (
-    BlockValidator,
-    GraphValidator,
-    ValidationError,
-    ValidationResult,
-    detect_cycles,
-    validate_connections,
-)
+if TYPE_CHECKING:
+    from python_cdl.parser import CDLParser, load_cdl_file, parse_cdl_json
+    from python_cdl.runtime import (
+        BlockExecutor,
+        ExecutionContext,
+        ExecutionEvent,
+        ExecutionResult,
+    )
+    from python_cdl.validators import (
+        BlockValidator,
+        GraphValidator,
+        ValidationError,
+        ValidationResult,
+        detect_cycles,
+        validate_connections,
+    )
+
+# The parser, runtime and validators are loaded on first attribute access
+# (PEP 562) so that code which only builds models does not pay for them.
+_LAZY_IMPORTS = {
+    "CDLParser": "python_cdl.parser",
+    "load_cdl_file": "python_cdl.parser",
+    "parse_cdl_json": "python_cdl.parser",
+    "BlockExecutor": "python_cdl.runtime",
+    "ExecutionContext": "python_cdl.runtime",
+    "ExecutionEvent": "python_cdl.runtime",
+    "ExecutionResult": "python_cdl.runtime",
+    "BlockValidator": "python_cdl.validators",
+    "GraphValidator": "python_cdl.validators",
+    "ValidationError": "python_cdl.validators",
+    "ValidationResult": "python_cdl.validators",
+    "detect_cycles": "python_cdl.validators",
+    "validate_connections": "python_cdl.validators",
+}
 
 __version__ = "0.1.0"
 
@@ -117,6 +139,21 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including lazily imported public names."""
+    return sorted(set(globals()) | set(__all__))
+
+
 def main() -> None:
     """CLI entry point for python-cdl."""
     print("Python CDL - Controls Description Language Processor")
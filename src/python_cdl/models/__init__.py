@@ -20,9 +20,10 @@ from python_cdl.models.connectors import (
     BooleanOutput,
     StringInput,
     StringOutput,
+    PortTable,
 )
 from python_cdl.models.parameters import Parameter, Constant
-from python_cdl.models.connections import Connection
+from python_cdl.models.connections import Connection, ConnectionTable
 from python_cdl.models.equations import Equation
 from python_cdl.models.blocks import (
     Block,
@@ -54,9 +55,11 @@ __all__ = [
     "BooleanOutput",
     "StringInput",
     "StringOutput",
+    "PortTable",
     "Parameter",
     "Constant",
     "Connection",
+    "ConnectionTable",
     "Equation",
     "Block",
     "ElementaryBlock",
@@ -2,10 +2,10 @@
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from python_cdl.models.connectors import InputConnector, OutputConnector
-from python_cdl.models.connections import Connection
+from python_cdl.models.connectors import InputConnector, OutputConnector, PortTable
+from python_cdl.models.connections import Connection, ConnectionTable
 from python_cdl.models.equations import Equation
 from python_cdl.models.parameters import Constant, Parameter
 from python_cdl.models.semantic import SemanticMetadata
@@ -48,11 +48,17 @@ class Block(BaseModel):
         """Get constant by name."""
         return next((c for c in self.constants if c.name == name), None)
 
-    class Config:
-        """Pydantic configuration."""
+    @property
+    def input_table(self) -> PortTable:
+        """Get the inputs as parallel tuples of names, types and units."""
+        return PortTable.from_connectors(self.inputs)
 
-        frozen = False
-        extra = "forbid"
+    @property
+    def output_table(self) -> PortTable:
+        """Get the outputs as parallel tuples of names, types and units."""
+        return PortTable.from_connectors(self.outputs)
+
+    model_config = ConfigDict(frozen=False, extra="forbid")
 
 
 class ElementaryBlock(Block):
@@ -94,6 +100,29 @@ class CompositeBlock(Block):
 
         return v
 
+    def get_block(self, name: str) -> Block | None:
+        """Get child block by name."""
+        return next((b for b in self.blocks if b.name == name), None)
+
+    @property
+    def block_index(self) -> dict[str, Block]:
+        """Get child blocks keyed by name, keeping the first of any duplicates.
+
+        Built on access rather than cached, since ``blocks`` is mutable.
+        """
+        index: dict[str, Block] = {}
+        for child in self.blocks:
+            index.setdefault(child.name, child)
+        return index
+
+    @property
+    def connection_table(self) -> ConnectionTable:
+        """Get the connections as parallel tuples of endpoint names.
+
+        Built on access rather than cached, since ``connections`` is mutable.
+        """
+        return ConnectionTable.from_connections(self.connections)
+
 
 class ExtensionBlock(Block):
     """Extension block allowing custom implementations."""
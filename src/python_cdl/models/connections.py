@@ -1,34 +1,33 @@
 """CDL connection model for wiring blocks together."""
 
-from pydantic import BaseModel, Field, field_validator
+import sys
+from collections.abc import Iterable
+from typing import Annotated, NamedTuple
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, StringConstraints
+
+# Constraints are enforced by pydantic-core rather than Python validators.
+# Block names must be non-empty; connector names may be empty for
+# connections to/from the composite block boundary. Names are interned so
+# the small, heavily repeated set of identifiers in a graph is stored once
+# and compares by identity in graph walks.
+BlockName = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1), AfterValidator(sys.intern)
+]
+ConnectorName = Annotated[
+    str, StringConstraints(strip_whitespace=True), AfterValidator(sys.intern)
+]
 
 
 class Connection(BaseModel):
     """Connection between block outputs and inputs."""
 
-    from_block: str = Field(description="Source block name")
-    from_output: str = Field(description="Source output connector name")
-    to_block: str = Field(description="Target block name")
-    to_input: str = Field(description="Target input connector name")
+    from_block: BlockName = Field(description="Source block name")
+    from_output: ConnectorName = Field(description="Source output connector name")
+    to_block: BlockName = Field(description="Target block name")
+    to_input: ConnectorName = Field(description="Target input connector name")
     description: str | None = Field(default=None, description="Natural language description")
 
-    @field_validator("from_block", "to_block")
-    @classmethod
-    def validate_block_name(cls, v: str) -> str:
-        """Validate block name is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Block name cannot be empty")
-        return v.strip()
-
-    @field_validator("from_output", "to_input")
-    @classmethod
-    def validate_connector_name(cls, v: str) -> str:
-        """Validate connector name (can be empty for top-level connections)."""
-        # Allow empty string for connections to/from composite block boundary
-        if v is None:
-            return ""
-        return v.strip()
-
     @property
     def from_path(self) -> str:
         """Get the full path of the source."""
@@ -39,8 +38,33 @@ class Connection(BaseModel):
         """Get the full path of the target."""
         return f"{self.to_block}.{self.to_input}"
 
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class ConnectionTable(NamedTuple):
+    """Column-oriented view of a list of connections.
+
+    Each field holds one connection attribute for every connection, in the
+    same order, so graph walks can ``zip`` over plain string tuples instead
+    of reading attributes off each ``Connection``.
+    """
+
+    from_blocks: tuple[str, ...]
+    from_outputs: tuple[str, ...]
+    to_blocks: tuple[str, ...]
+    to_inputs: tuple[str, ...]
+
+    @classmethod
+    def from_connections(cls, connections: Iterable[Connection]) -> "ConnectionTable":
+        """Build a table from connection models."""
+        rows = [(c.from_block, c.from_output, c.to_block, c.to_input) for c in connections]
+        if not rows:
+            return cls((), (), (), ())
+        return cls(*zip(*rows))
 
-        frozen = False
-        extra = "forbid"
+    def rows_by_target(self) -> dict[str, list[int]]:
+        """Map each target block name to the rows of its incoming connections."""
+        index: dict[str, list[int]] = {}
+        for row, to_block in enumerate(self.to_blocks):
+            index.setdefault(to_block, []).append(row)
+        return index
@@ -1,8 +1,9 @@
 """CDL connector models for inputs and outputs."""
 
-from typing import Literal
+from collections.abc import Iterable
+from typing import Literal, NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from python_cdl.models.types import CDLTypeEnum
 
@@ -16,12 +17,7 @@ class Connector(BaseModel):
     unit: str | None = Field(default=None, description="Unit of measurement")
     description: str | None = Field(default=None, description="Natural language description")
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = False
-        extra = "forbid"
-        use_enum_values = True
+    model_config = ConfigDict(frozen=True, extra="forbid", use_enum_values=True)
 
 
 class InputConnector(Connector):
@@ -90,3 +86,23 @@ class StringOutput(OutputConnector):
     """String-valued output connector."""
 
     type: Literal[CDLTypeEnum.STRING] = CDLTypeEnum.STRING
+
+
+class PortTable(NamedTuple):
+    """Column-oriented view of a list of connectors.
+
+    Each field holds one connector attribute for every connector, in the
+    same order, so bulk readers can ``zip`` over plain tuples.
+    """
+
+    names: tuple[str, ...]
+    types: tuple[str, ...]
+    units: tuple[str | None, ...]
+
+    @classmethod
+    def from_connectors(cls, connectors: Iterable[Connector]) -> "PortTable":
+        """Build a table from connector models."""
+        rows = [(c.name, c.type, c.unit) for c in connectors]
+        if not rows:
+            return cls((), (), ())
+        return cls(*zip(*rows))
@@ -1,6 +1,6 @@
 """CDL equation models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Equation(BaseModel):
@@ -13,8 +13,4 @@ class Equation(BaseModel):
     rhs: str = Field(description="Right-hand side (expression to evaluate)")
     description: str | None = Field(default=None, description="Optional description")
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = False
-        extra = "forbid"
+    model_config = ConfigDict(frozen=False, extra="forbid")
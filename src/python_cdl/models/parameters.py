@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from python_cdl.models.types import CDLTypeEnum
 
@@ -19,11 +19,7 @@ class Parameter(BaseModel):
     max: float | int | None = Field(default=None, description="Maximum value")
     description: str | None = Field(default=None, description="Natural language description")
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = False
-        extra = "forbid"
+    model_config = ConfigDict(frozen=False, extra="forbid")
 
 
 class Constant(BaseModel):
@@ -36,8 +32,4 @@ class Constant(BaseModel):
     unit: str | None = Field(default=None, description="Unit of measurement")
     description: str | None = Field(default=None, description="Natural language description")
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = True
-        extra = "forbid"
+    model_config = ConfigDict(frozen=True, extra="forbid")
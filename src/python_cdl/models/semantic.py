@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SemanticMetadata(BaseModel):
@@ -33,8 +33,4 @@ class SemanticMetadata(BaseModel):
         description="Custom vendor-specific annotations",
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = False
-        extra = "allow"
+    model_config = ConfigDict(frozen=False, extra="allow")
@@ -3,7 +3,7 @@
 from enum import Enum as PyEnum
 from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class CDLTypeEnum(str, PyEnum):
@@ -22,11 +22,7 @@ class CDLType(BaseModel):
     type: CDLTypeEnum
     description: str | None = Field(default=None, description="Natural language description")
 
-    class Config:
-        """Pydantic configuration."""
-
-        frozen = False
-        extra = "forbid"
+    model_config = ConfigDict(frozen=False, extra="forbid")
 
 
 class Real(CDLType):
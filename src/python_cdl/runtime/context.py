@@ -5,6 +5,14 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+# Python types accepted for each CDL connector type
+_CDL_PYTHON_TYPES: dict[str, type | tuple[type, ...]] = {
+    'Real': (int, float),
+    'Integer': int,
+    'Boolean': bool,
+    'String': str,
+}
+
 
 class ExecutionEventType(str, Enum):
     """Types of execution events."""
@@ -51,6 +59,7 @@ class ExecutionContext:
         self._current_event: ExecutionEvent | None = None
         self._event_history: list[ExecutionEvent] = []
         self._block = block
+        self._input_types: dict[str, str] = {}
         self.current_time = 0.0
         self.step_count = 0
 
@@ -58,6 +67,8 @@ class ExecutionContext:
         if block is not None:
             for inp in getattr(block, 'inputs', []):
                 self._connector_values[inp.name] = None
+                # First declaration wins, matching a scan of block.inputs
+                self._input_types.setdefault(inp.name, inp.type)
             for out in getattr(block, 'outputs', []):
                 self._connector_values[out.name] = None
             # Load default parameter values
@@ -177,14 +188,7 @@ class ExecutionContext:
         if value is None:
             return  # Allow None values
 
-        type_map = {
-            'Real': (int, float),
-            'Integer': int,
-            'Boolean': bool,
-            'String': str
-        }
-
-        expected_python_types = type_map.get(expected_type)
+        expected_python_types = _CDL_PYTHON_TYPES.get(expected_type)
         if expected_python_types is None:
             # Unknown type, skip validation
             return
@@ -205,14 +209,10 @@ class ExecutionContext:
         Raises:
             TypeError: If value type doesn't match connector type
         """
-        # Type checking if block is defined
-        if self._block is not None:
-            input_connector = next(
-                (inp for inp in getattr(self._block, 'inputs', []) if inp.name == name),
-                None
-            )
-            if input_connector:
-                self._validate_type(value, input_connector.type, f"input '{name}'")
+        # Type checking against the input types registered for the block
+        expected_type = self._input_types.get(name)
+        if expected_type is not None:
+            self._validate_type(value, expected_type, f"input '{name}'")
 
         self._connector_values[name] = value
 
@@ -311,30 +311,48 @@ class ExecutionContext:
         max_iterations = len(self._block.blocks) + 1
         computed = set()
 
+        # Resolve every connection's endpoints once, so each sweep below only
+        # follows precomputed routes. A source or target context of None
+        # stands for the composite's own input or output.
+        input_names = frozenset(self._block.input_table.names)
+        output_names = frozenset(self._block.output_table.names)
+        routes = []
+        for from_block, from_output, to_block, to_input in zip(*self._block.connection_table):
+            if from_block in input_names:
+                source = None
+            elif from_block in sub_contexts:
+                source = sub_contexts[from_block]
+            else:
+                continue
+            if to_block in sub_contexts:
+                target = sub_contexts[to_block]
+            elif to_block in output_names:
+                target = None
+            else:
+                continue
+            routes.append((from_block, source, from_output, to_block, target, to_input))
+
         for iteration in range(max_iterations):
             made_progress = False
 
             # Propagate values through all connections
-            for conn in self._block.connections:
-                from_block = conn.from_block
-                to_block = conn.to_block
-
+            for from_block, source, from_output, to_block, target, to_input in routes:
                 # Get source value
-                value = None
-                if from_block in [inp.name for inp in self._block.inputs]:
+                if source is None:
                     # From composite input
                     value = self._connector_values.get(from_block)
-                elif from_block in sub_contexts:
+                elif from_block in computed:
                     # From sub-block output
-                    if from_block in computed:
-                        value = sub_contexts[from_block].get_output(conn.from_output)
+                    value = source.get_output(from_output)
+                else:
+                    continue
 
                 # Set destination value
                 if value is not None:
-                    if to_block in sub_contexts:
+                    if target is not None:
                         # To sub-block input
-                        sub_contexts[to_block].set_input(conn.to_input, value)
-                    elif to_block in [out.name for out in self._block.outputs]:
+                        target.set_input(to_input, value)
+                    else:
                         # To composite output
                         self._connector_values[to_block] = value
 
@@ -406,9 +424,11 @@ class ExecutionContext:
         self.step_count = 0
 
         # Re-register block connectors if block exists
+        self._input_types.clear()
         if self._block is not None:
             for inp in getattr(self._block, 'inputs', []):
                 self._connector_values[inp.name] = None
+                self._input_types.setdefault(inp.name, inp.type)
             for out in getattr(self._block, 'outputs', []):
                 self._connector_values[out.name] = None
             # Reload default parameter values
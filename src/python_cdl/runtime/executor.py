@@ -13,6 +13,7 @@ from python_cdl.models.blocks import (
     SequenceBlock,
     WhileBlock,
 )
+from python_cdl.models.connections import Connection
 from python_cdl.runtime.context import ExecutionContext, ExecutionEvent
 
 
@@ -208,12 +209,15 @@ class BlockExecutor:
         # Build dependency graph from connections
         child_names = {child.name for child in block.blocks}
         dependencies = {child.name: set() for child in block.blocks}
+        incoming = self._incoming_connections(block)
+        children = block.block_index
 
-        for conn in block.connections:
+        table = block.connection_table
+        for from_block, to_block in zip(table.from_blocks, table.to_blocks):
             # Only track dependencies between child blocks
-            if conn.to_block in child_names and conn.from_block in child_names:
+            if to_block in child_names and from_block in child_names:
                 # to_block depends on from_block
-                dependencies[conn.to_block].add(conn.from_block)
+                dependencies[to_block].add(from_block)
 
         # Topological sort to determine execution order
         execution_order = []
@@ -236,7 +240,7 @@ class BlockExecutor:
 
             # Execute ready blocks
             for block_name in ready:
-                child = next((b for b in block.blocks if b.name == block_name), None)
+                child = children.get(block_name)
                 if not child:
                     return ExecutionResult(
                         success=False,
@@ -244,7 +248,7 @@ class BlockExecutor:
                         blocks_executed=executed,
                     )
 
-                child_result = self._execute_child(child, block)
+                child_result = self._execute_child(child, block, incoming)
                 executed.append(child.name)
                 execution_order.append(child.name)
 
@@ -278,10 +282,12 @@ class BlockExecutor:
         Executes blocks in the specified order.
         """
         executed = []
+        incoming = self._incoming_connections(block)
+        children = block.block_index
 
         # Execute in order
         for block_name in block.execution_order:
-            child = next((b for b in block.blocks if b.name == block_name), None)
+            child = children.get(block_name)
             if not child:
                 return ExecutionResult(
                     success=False,
@@ -289,7 +295,7 @@ class BlockExecutor:
                     blocks_executed=executed,
                 )
 
-            child_result = self._execute_child(child, block)
+            child_result = self._execute_child(child, block, incoming)
             executed.append(child.name)
 
             if not child_result.success:
@@ -308,10 +314,11 @@ class BlockExecutor:
         on each other in any order (simulated parallelism).
         """
         executed = []
+        incoming = self._incoming_connections(block)
 
         # Execute all blocks (in practice, would execute independent groups)
         for child in block.blocks:
-            child_result = self._execute_child(child, block)
+            child_result = self._execute_child(child, block, incoming)
             executed.append(child.name)
 
             if not child_result.success:
@@ -329,6 +336,8 @@ class BlockExecutor:
         Executes then or else branch based on condition.
         """
         executed = []
+        incoming = self._incoming_connections(block)
+        children = block.block_index
 
         # Get condition value
         condition_path = f"{block.name}.{block.condition_input}"
@@ -345,7 +354,7 @@ class BlockExecutor:
         branch = block.then_blocks if condition else block.else_blocks
 
         for block_name in branch:
-            child = next((b for b in block.blocks if b.name == block_name), None)
+            child = children.get(block_name)
             if not child:
                 return ExecutionResult(
                     success=False,
@@ -353,7 +362,7 @@ class BlockExecutor:
                     blocks_executed=executed,
                 )
 
-            child_result = self._execute_child(child, block)
+            child_result = self._execute_child(child, block, incoming)
             executed.append(child.name)
 
             if not child_result.success:
@@ -371,6 +380,8 @@ class BlockExecutor:
         Executes loop body while condition is true.
         """
         executed = []
+        incoming = self._incoming_connections(block)
+        children = block.block_index
         iterations = 0
         max_iter = block.max_iterations or 1000  # Default safety limit
 
@@ -390,9 +401,7 @@ class BlockExecutor:
 
             # Execute loop body
             for block_name in block.loop_blocks:
-                child = next(
-                    (b for b in block.blocks if b.name == block_name), None
-                )
+                child = children.get(block_name)
                 if not child:
                     return ExecutionResult(
                         success=False,
@@ -400,7 +409,7 @@ class BlockExecutor:
                         blocks_executed=executed,
                     )
 
-                child_result = self._execute_child(child, block)
+                child_result = self._execute_child(child, block, incoming)
                 executed.append(child.name)
 
                 if not child_result.success:
@@ -421,41 +430,59 @@ class BlockExecutor:
 
         return ExecutionResult(success=True, blocks_executed=executed)
 
+    def _incoming_connections(self, parent: CompositeBlock) -> dict[str, list[Connection]]:
+        """Group a composite block's connections by target block.
+
+        Built once per composite execution so each child only visits the
+        connections that feed it, instead of scanning every connection.
+        """
+        connections = parent.connections
+        return {
+            to_block: [connections[row] for row in rows]
+            for to_block, rows in parent.connection_table.rows_by_target().items()
+        }
+
     def _execute_child(
-        self, child: Block, parent: CompositeBlock
+        self,
+        child: Block,
+        parent: CompositeBlock,
+        incoming: dict[str, list[Connection]] | None = None,
     ) -> ExecutionResult:
         """Execute a child block within a composite block.
 
         Args:
             child: Child block to execute
             parent: Parent composite block
+            incoming: Parent connections grouped by target block, as returned
+                by ``_incoming_connections``; computed on demand if omitted
 
         Returns:
             ExecutionResult for the child execution
         """
         # Get list of child block names to distinguish from parent inputs
         child_names = {block.name for block in parent.blocks}
+        if incoming is None:
+            incoming = self._incoming_connections(parent)
 
         # Collect inputs from connections and set them in context
-        for conn in parent.connections:
-            if conn.to_block == child.name:
-                # Determine if source is a parent input or another child block
-                # Check if from_output is empty (indicates parent input)
-                if not conn.from_output or conn.from_output == "":
-                    # Connection from parent input
-                    source_path = f"{parent.name}.{conn.from_block}"
-                elif conn.from_block in child_names:
-                    # Connection from another child block
-                    source_path = f"{parent.name}.{conn.from_block}.{conn.from_output}"
-                else:
-                    # Connection from parent input with explicit connector
-                    source_path = f"{parent.name}.{conn.from_block}"
-
-                if self.context.has_value(source_path):
-                    # Set the value with the full path including parent
-                    target_path = f"{parent.name}.{conn.to_block}.{conn.to_input}"
-                    value = self.context.get_value(source_path)
-                    self.context.set_value(target_path, value)
+        for conn in incoming.get(child.name, ()):
+            # Determine if source is a parent input or another child block
+            # Check if from_output is empty (indicates parent input)
+            if not conn.from_output or conn.from_output == "":
+                # Connection from parent input
+                source_path = f"{parent.name}.{conn.from_block}"
+            elif conn.from_block in child_names:
+                # Connection from another child block
+                source_path = f"{parent.name}.{conn.from_block}.{conn.from_output}"
+            else:
+                # Connection from parent input with explicit connector
+                source_path = f"{parent.name}.{conn.from_block}"
+
+            if self.context.has_value(source_path):
+                # Set the value with the full path including parent
+                target_path = f"{parent.name}.{conn.to_block}.{conn.to_input}"
+                value = self.context.get_value(source_path)
+                self.context.set_value(target_path, value)
 
         # Execute child directly without creating a new event
         # The child's name needs to be fully qualified with parent
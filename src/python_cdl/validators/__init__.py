@@ -5,6 +5,7 @@ from python_cdl.validators.block_validator import (
     ValidationError,
     ValidationMessage,
     ValidationResult,
+    validate_and_dump,
 )
 from python_cdl.validators.graph_validator import (
     GraphValidator,
@@ -17,6 +18,7 @@ __all__ = [
     "ValidationError",
     "ValidationMessage",
     "ValidationResult",
+    "validate_and_dump",
     "GraphValidator",
     "detect_cycles",
     "validate_connections",
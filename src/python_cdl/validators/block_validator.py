@@ -1,8 +1,17 @@
 """Validator for CDL blocks."""
 
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from typing import Any
 
 from python_cdl.models.blocks import Block, CompositeBlock
+from python_cdl.validators.graph_validator import GraphValidator
+
+
+def _duplicates(names: Iterable[str]) -> set[str]:
+    """Return the names that occur more than once, in a single counting pass."""
+    return {name for name, count in Counter(names).items() if count > 1}
 
 
 class ValidationError(Exception):
@@ -59,14 +68,15 @@ class BlockValidator:
         """
         result = ValidationResult(valid=True)
 
-        # Check basic block properties
-        if not block.name or not block.name.strip():
-            result.errors.append(ValidationMessage(message="Block name cannot be empty"))
-            result.valid = False
+        # Check this block's own rules
+        self._validate_local(block, result)
 
-        # Validate composite blocks
+        # Recursively validate child blocks
         if isinstance(block, CompositeBlock):
-            self._validate_composite(block, result)
+            for child in block.blocks:
+                child_result = self.validate(child)
+                result.errors.extend(child_result.errors)
+                result.warnings.extend(child_result.warnings)
 
         # Validate connectors
         self._validate_connectors(block, result)
@@ -76,18 +86,71 @@ class BlockValidator:
 
         return result
 
+    def validate_and_dump(self, block: Block) -> tuple[ValidationResult, dict[str, Any]]:
+        """Validate a block and serialize it to CDL-JSON in a single tree walk.
+
+        Runs the same checks as :meth:`validate` plus ``GraphValidator`` on
+        every composite, visiting each block once to both validate it and dump
+        its fields. The returned dict matches
+        ``block.model_dump(mode="json", exclude_none=True, serialize_as_any=True)``.
+
+        Args:
+            block: Block to validate and serialize
+
+        Returns:
+            Tuple of (validation result, CDL-JSON dict)
+        """
+        result = ValidationResult(valid=True)
+        data = self._validate_and_dump_block(block, result)
+        result.valid = len(result.errors) == 0
+        return result, data
+
+    def _validate_and_dump_block(self, block: Block, result: ValidationResult) -> dict[str, Any]:
+        """Validate one block into ``result`` and return its JSON dict."""
+        self._validate_local(block, result)
+
+        data = block.model_dump(
+            mode="json", exclude_none=True, serialize_as_any=True, exclude={"blocks"}
+        )
+
+        if isinstance(block, CompositeBlock):
+            _, graph_errors = GraphValidator.validate(block)
+            result.errors.extend(
+                ValidationMessage(message=error, context=block.name) for error in graph_errors
+            )
+
+            children = [self._validate_and_dump_block(child, result) for child in block.blocks]
+            # Re-insert the children at the position of the "blocks" field
+            data = {
+                key: children if key == "blocks" else data[key]
+                for key in type(block).model_fields
+                if key == "blocks" or key in data
+            }
+
+        self._validate_connectors(block, result)
+        return data
+
+    def _validate_local(self, block: Block, result: ValidationResult) -> None:
+        """Validate a block's name and, for composites, its direct connections."""
+        # Check basic block properties
+        if not block.name or not block.name.strip():
+            result.errors.append(ValidationMessage(message="Block name cannot be empty"))
+
+        # Validate composite blocks
+        if isinstance(block, CompositeBlock):
+            self._validate_composite(block, result)
+
     def _validate_composite(
         self, block: CompositeBlock, result: ValidationResult
     ) -> None:
         """Validate composite block specific rules."""
         # Check for unique child block names
-        child_names = [b.name for b in block.blocks]
-        duplicates = [name for name in child_names if child_names.count(name) > 1]
+        duplicates = _duplicates(b.name for b in block.blocks)
 
         if duplicates:
             result.errors.append(
                 ValidationMessage(
-                    message=f"Duplicate child block names in {block.name}: {set(duplicates)}",
+                    message=f"Duplicate child block names in {block.name}: {duplicates}",
                     context=block.name
                 )
             )
@@ -96,6 +159,7 @@ class BlockValidator:
         # Build list of valid connection endpoints (child blocks + composite boundary)
         input_names = {inp.name for inp in block.inputs}
         output_names = {out.name for out in block.outputs}
+        children = block.block_index
 
         for conn in block.connections:
             # Check source exists (can be child block or composite input)
@@ -103,9 +167,7 @@ class BlockValidator:
             source_is_boundary = conn.from_block in input_names
 
             if not source_is_boundary:
-                source_block = next(
-                    (b for b in block.blocks if b.name == conn.from_block), None
-                )
+                source_block = children.get(conn.from_block)
                 if not source_block:
                     result.errors.append(
                         ValidationMessage(
@@ -120,9 +182,7 @@ class BlockValidator:
             target_is_boundary = conn.to_block in output_names
 
             if not target_is_boundary:
-                target_block = next(
-                    (b for b in block.blocks if b.name == conn.to_block), None
-                )
+                target_block = children.get(conn.to_block)
                 if not target_block:
                     result.errors.append(
                         ValidationMessage(
@@ -170,32 +230,26 @@ class BlockValidator:
                             )
                         )
 
-        # Recursively validate child blocks
-        for child in block.blocks:
-            child_result = self.validate(child)
-            result.errors.extend(child_result.errors)
-            result.warnings.extend(child_result.warnings)
-
     def _validate_connectors(self, block: Block, result: ValidationResult) -> None:
         """Validate connector rules."""
         # Check for unique input names
         input_names = [inp.name for inp in block.inputs]
-        duplicates = [name for name in input_names if input_names.count(name) > 1]
+        duplicates = _duplicates(input_names)
         if duplicates:
             result.errors.append(
                 ValidationMessage(
-                    message=f"Duplicate input names in {block.name}: {set(duplicates)}",
+                    message=f"Duplicate input names in {block.name}: {duplicates}",
                     context=block.name
                 )
             )
 
         # Check for unique output names
         output_names = [out.name for out in block.outputs]
-        duplicates = [name for name in output_names if output_names.count(name) > 1]
+        duplicates = _duplicates(output_names)
         if duplicates:
             result.errors.append(
                 ValidationMessage(
-                    message=f"Duplicate output names in {block.name}: {set(duplicates)}",
+                    message=f"Duplicate output names in {block.name}: {duplicates}",
                     context=block.name
                 )
             )
@@ -210,3 +264,17 @@ class BlockValidator:
                     context=block.name
                 )
             )
+
+
+def validate_and_dump(block: Block) -> tuple[ValidationResult, dict[str, Any]]:
+    """Validate a block and serialize it to CDL-JSON in a single tree walk.
+
+    Convenience wrapper around :meth:`BlockValidator.validate_and_dump`.
+
+    Args:
+        block: Block to validate and serialize
+
+    Returns:
+        Tuple of (validation result, CDL-JSON dict)
+    """
+    return BlockValidator().validate_and_dump(block)
@@ -20,8 +20,9 @@ def detect_cycles(block: CompositeBlock) -> list[list[str]]:
     # Build adjacency list
     graph: dict[str, list[str]] = defaultdict(list)
 
-    for conn in block.connections:
-        graph[conn.from_block].append(conn.to_block)
+    table = block.connection_table
+    for from_block, to_block in zip(table.from_blocks, table.to_blocks):
+        graph[from_block].append(to_block)
 
     # Get all block names
     all_blocks = {b.name for b in block.blocks}
@@ -79,9 +80,10 @@ def validate_connections(block: CompositeBlock) -> list[str]:
     # Track input connections
     input_connections: dict[str, list[str]] = defaultdict(list)
 
-    for conn in block.connections:
-        input_key = f"{conn.to_block}.{conn.to_input}"
-        output_key = f"{conn.from_block}.{conn.from_output}"
+    table = block.connection_table
+    for from_block, from_output, to_block, to_input in zip(*table):
+        input_key = f"{to_block}.{to_input}"
+        output_key = f"{from_block}.{from_output}"
         input_connections[input_key].append(output_key)
 
     # Check each input has exactly one connection
@@ -124,9 +126,10 @@ def topological_sort(block: CompositeBlock) -> list[str] | None:
         if block_name not in in_degree:
             in_degree[block_name] = 0
 
-    for conn in block.connections:
-        graph[conn.from_block].append(conn.to_block)
-        in_degree[conn.to_block] += 1
+    table = block.connection_table
+    for from_block, to_block in zip(table.from_blocks, table.to_blocks):
+        graph[from_block].append(to_block)
+        in_degree[to_block] += 1
 
     # Kahn's algorithm
     queue = deque([b for b in all_blocks if in_degree[b] == 0])
@@ -0,0 +1,46 @@
+"""
+Integration tests for the programmatic composition examples.
+
+Tests the room control system example, including:
+- Building many rooms from one validated template
+- Independence of the copied rooms
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(
+    0, str(Path(__file__).parent.parent.parent / "examples" / "programmatic_composition")
+)
+
+from room_control_system import build_many_rooms  # noqa: E402
+
+
+class TestBuildManyRooms:
+    """Test suite for building many room control systems at once."""
+
+    @pytest.fixture
+    def rooms(self):
+        """Build three rooms from the shared template."""
+        return build_many_rooms(3)
+
+    def test_room_names_are_unique(self, rooms):
+        """Test that each room gets its own numbered name."""
+        assert [room.name for room in rooms] == [
+            "RoomControlSystem_001",
+            "RoomControlSystem_002",
+            "RoomControlSystem_003",
+        ]
+
+    def test_rooms_are_independent_copies(self, rooms):
+        """Test that editing one room leaves the others untouched."""
+        first, second = rooms[0], rooms[1]
+        assert first.blocks[0] is not second.blocks[0]
+
+        first.blocks[0].parameters[0].value = 999.0
+        first.connections.pop()
+
+        assert second.blocks[0].parameters[0].value != 999.0
+        assert len(second.connections) == len(first.connections) + 1
@@ -10,6 +10,7 @@ Tests the complete VAV system implementation including:
 """
 
 import json
+import sys
 import pytest
 from pathlib import Path
 
@@ -20,6 +21,18 @@ from python_cdl import (
     ExecutionContext,
 )
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "examples"))
+
+from vav_reheat import (  # noqa: E402
+    AHUControlSystem,
+    VAVBoxBatchController,
+    VAVBoxController,
+    ZoneBatch,
+    ZoneState,
+    ZoneType,
+    get_zone_config,
+)
+
 
 class TestVAVZoneController:
     """Test suite for VAV zone terminal box controller."""
@@ -554,5 +567,58 @@ class TestVAVPerformanceMetrics:
         assert cooling_with_economizer is None or isinstance(cooling_with_economizer, (int, float))
 
 
+class TestVAVReheatExample:
+    """Test suite for the programmatic VAV reheat example package."""
+
+    def test_ahu_control_system_default_description(self):
+        """Test that the AHU control system describes itself by default."""
+        system = AHUControlSystem()
+        assert system.name == "AHUControlSystem"
+        assert "mode selection" in system.description
+
+    def test_ahu_control_system_custom_description(self):
+        """Test that a custom description can be set at construction time."""
+        system = AHUControlSystem(name="Building_AHU_1", description="Rooftop unit 1")
+        assert system.name == "Building_AHU_1"
+        assert system.description == "Rooftop unit 1"
+
+    def test_run_matches_repeated_updates(self):
+        """Test that run() is equivalent to stepping update_state."""
+        config = get_zone_config(ZoneType.NORTH)
+        stepped, batched = VAVBoxController(config), VAVBoxController(config)
+
+        state = ZoneState(room_temp=19.5, supply_air_temp=13.0)
+        for _ in range(5):
+            state = stepped.update_state(state, dt=1.0)
+
+        result = batched.run(ZoneState(room_temp=19.5, supply_air_temp=13.0), dt=1.0, n_steps=5)
+
+        assert result == state
+        assert batched.reheat_integral == stepped.reheat_integral
+
+    def test_batch_controller_matches_scalar(self):
+        """Test that the batch controller tracks per-zone controllers exactly."""
+        configs = [get_zone_config(zone_type) for zone_type in ZoneType]
+        controllers = [VAVBoxController(config) for config in configs]
+        batch_controller = VAVBoxBatchController(configs)
+
+        # One zone in each mode, plus one crossing from deadband into heating
+        temps = [23.2, 27.0, 19.0, 24.0, 21.2]
+        states = [ZoneState(room_temp=t, supply_air_temp=13.0) for t in temps]
+        batch = ZoneBatch.from_states(states)
+
+        for _ in range(10):
+            batch = batch_controller.update_state(batch, dt=1.0)
+            for i, controller in enumerate(controllers):
+                states[i] = controller.update_state(states[i], dt=1.0)
+                states[i].room_temp -= 0.1
+            batch.room_temp = batch.room_temp - 0.1
+
+        for i, controller in enumerate(controllers):
+            assert batch.state(i) == states[i]
+            assert batch_controller.damper_integral[i] == controller.damper_integral
+            assert batch_controller.reheat_integral[i] == controller.reheat_integral
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
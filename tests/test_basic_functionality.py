@@ -155,6 +155,61 @@ class TestBasicFunctionality:
         assert hasattr(result, 'errors')
         assert hasattr(result, 'warnings')
 
+    def test_validate_and_dump(self):
+        """Test combined validation and CDL-JSON serialization."""
+        from python_cdl.models import CompositeBlock, Connection, ElementaryBlock, RealInput, RealOutput
+        from python_cdl.validators import validate_and_dump
+
+        gain = ElementaryBlock(
+            name="gain",
+            block_type="Gain",
+            inputs=[RealInput(name="u", min=0.0)],
+            outputs=[RealOutput(name="y")]
+        )
+        composite = CompositeBlock(
+            name="Controller",
+            block_type="composite",
+            inputs=[RealInput(name="u")],
+            outputs=[RealOutput(name="y")],
+            blocks=[gain],
+            connections=[
+                Connection(from_block="u", from_output="", to_block="gain", to_input="u"),
+                Connection(from_block="gain", from_output="y", to_block="y", to_input=""),
+            ]
+        )
+
+        result, data = validate_and_dump(composite)
+
+        assert result.is_valid
+        assert data == composite.model_dump(mode="json", exclude_none=True, serialize_as_any=True)
+        assert data["blocks"][0]["category"] == "elementary"
+        assert data["blocks"][0]["inputs"][0]["min"] == 0.0
+
+    def test_validate_and_dump_reports_cycles(self):
+        """Test combined validation includes graph errors."""
+        from python_cdl.models import Block, CompositeBlock, Connection, RealInput, RealOutput
+        from python_cdl.validators import validate_and_dump
+
+        blocks = [
+            Block(name=name, block_type="Gain", inputs=[RealInput(name="u")], outputs=[RealOutput(name="y")])
+            for name in ("a", "b")
+        ]
+        composite = CompositeBlock(
+            name="Loop",
+            block_type="composite",
+            blocks=blocks,
+            connections=[
+                Connection(from_block="a", from_output="y", to_block="b", to_input="u"),
+                Connection(from_block="b", from_output="y", to_block="a", to_input="u"),
+            ]
+        )
+
+        result, data = validate_and_dump(composite)
+
+        assert not result.is_valid
+        assert any("Cycle detected" in str(e) for e in result.errors)
+        assert [b["name"] for b in data["blocks"]] == ["a", "b"]
+
     def test_execution_context(self):
         """Test ExecutionContext with actual API."""
         from python_cdl import ExecutionContext
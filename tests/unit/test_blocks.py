@@ -234,3 +234,75 @@ class TestBlocks:
 
         with pytest.raises(ValidationError):
             Block(**data)
+
+    def test_composite_block_connection_table(self):
+        """Test connections exposed as parallel tuples."""
+        from python_cdl.models import Block, CompositeBlock, Connection, RealInput, RealOutput
+
+        gain = Block(name="gain", block_type="Gain", inputs=[RealInput(name="u")], outputs=[RealOutput(name="y")])
+        block = CompositeBlock(
+            name="Controller",
+            block_type="composite",
+            inputs=[RealInput(name="u")],
+            outputs=[RealOutput(name="y")],
+            blocks=[gain],
+            connections=[
+                Connection(from_block="u", from_output="", to_block="gain", to_input="u"),
+                Connection(from_block="gain", from_output="y", to_block="y", to_input=""),
+            ]
+        )
+
+        table = block.connection_table
+        assert table.from_blocks == ("u", "gain")
+        assert table.from_outputs == ("", "y")
+        assert table.to_blocks == ("gain", "y")
+        assert table.to_inputs == ("u", "")
+
+        block.connections = []
+        assert block.connection_table == ((), (), (), ())
+
+    def test_composite_block_child_lookup(self):
+        """Test looking up child blocks by name."""
+        from python_cdl.models import Block, CompositeBlock
+
+        first = Block(name="gain", block_type="Gain")
+        block = CompositeBlock(
+            name="Controller",
+            block_type="composite",
+            blocks=[first, Block(name="limiter", block_type="Limiter"), Block(name="gain", block_type="Other")],
+        )
+
+        assert block.get_block("gain") is first
+        assert block.get_block("missing") is None
+        assert list(block.block_index) == ["gain", "limiter"]
+        assert block.block_index["gain"] is first
+
+    def test_connection_table_rows_by_target(self):
+        """Test grouping connection rows by target block."""
+        from python_cdl.models import Connection, ConnectionTable
+
+        table = ConnectionTable.from_connections([
+            Connection(from_block="u", from_output="", to_block="gain", to_input="u"),
+            Connection(from_block="gain", from_output="y", to_block="y", to_input=""),
+            Connection(from_block="k", from_output="", to_block="gain", to_input="k"),
+        ])
+
+        assert table.rows_by_target() == {"gain": [0, 2], "y": [1]}
+        assert ConnectionTable.from_connections([]).rows_by_target() == {}
+
+    def test_block_port_tables(self):
+        """Test inputs and outputs exposed as parallel tuples."""
+        from python_cdl.models import Block, BooleanOutput, RealInput, RealOutput
+
+        block = Block(
+            name="Hysteresis",
+            block_type="elementary",
+            inputs=[RealInput(name="u", unit="K")],
+            outputs=[RealOutput(name="y"), BooleanOutput(name="on")]
+        )
+
+        assert block.input_table == (("u",), ("Real",), ("K",))
+        assert block.output_table.names == ("y", "on")
+        assert block.output_table.types == ("Real", "Boolean")
+        assert block.output_table.units == (None, None)
+        assert Block(name="Empty", block_type="elementary").input_table == ((), (), ())
@@ -171,3 +171,14 @@ class TestCDLConnectors:
         input_conn = RealInput(name="u")
         assert input_conn.name == "u"
         assert input_conn.type == "Real"
+
+    def test_connector_is_immutable(self):
+        """Test that connectors are frozen and can be shared between blocks."""
+        from python_cdl.models import RealInput
+
+        input_conn = RealInput(name="u", unit="K")
+
+        with pytest.raises(ValidationError):
+            input_conn.unit = "degC"
+
+        assert hash(input_conn) == hash(RealInput(name="u", unit="K"))
@@ -40,6 +40,28 @@ class TestEdgeCases:
         assert inp.name == ""
         assert out.name == ""
 
+    def test_connection_endpoint_names(self):
+        """Test connection block names are required and endpoint names are stripped."""
+        from python_cdl.models import Connection
+
+        with pytest.raises(ValidationError):
+            Connection(from_block="   ", from_output="y", to_block="b", to_input="u")
+
+        conn = Connection(from_block=" a ", from_output=" y ", to_block="b", to_input="")
+        assert conn.from_block == "a"
+        assert conn.from_output == "y"
+        assert conn.to_input == ""
+
+    def test_connection_endpoint_names_interned(self):
+        """Test connection endpoint names are interned."""
+        import sys
+
+        from python_cdl.models import Connection
+
+        name = "".join(["mode", "Selector"])
+        conn = Connection(from_block=name, from_output="y", to_block="b", to_input="u")
+        assert conn.from_block is sys.intern("modeSelector")
+
     def test_duplicate_parameter_names(self):
         """Test detection of duplicate parameter names."""
         from python_cdl.models import Block, Parameter, RealInput, RealOutput
@@ -0,0 +1,36 @@
+"""Regenerate the pre-generated CDL-JSON templates checked into examples/.
+
+Run from the repository root after changing any of the template factories:
+
+    uv run python tools/regen_templates.py
+"""
+
+import sys
+from pathlib import Path
+
+from pydantic_core import to_json
+
+from python_cdl.validators import validate_and_dump
+
+_EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples" / "programmatic_composition"
+
+
+def main() -> int:
+    """Build each templated system from its factories and rewrite its template."""
+    sys.path.insert(0, str(_EXAMPLES_DIR))
+    import room_control_system
+
+    system = room_control_system.create_room_control_system()
+    result, cdl_json = validate_and_dump(system)
+    if not result.is_valid:
+        print(f"✗ {system.name} is invalid: {[str(e) for e in result.errors]}")
+        return 1
+
+    template_path = room_control_system._TEMPLATE_PATH
+    template_path.write_bytes(to_json(cdl_json, indent=2))
+    print(f"✓ Wrote {template_path.relative_to(_EXAMPLES_DIR.parent.parent)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())